@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Customer search benchmark for Tobey Finance Bank
+
+Loads synthetic customers into ``CustomerService`` over an in-memory
+database and times ``search_customers`` for the prefixes a type-ahead
+search sends as a name or email is typed.
+
+    python benchmarks/customer_search.py [rows]
+"""
+
+import gc
+import os
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from model_memory import customer_record
+from src.services.customer_service import CustomerService
+from src.utils.memory_database import InMemoryDatabaseManager
+
+FIRST_NAMES = ("Jane", "John", "Maria", "Wei", "Fatima", "Olusegun", "Priya", "Lars", "Ana", "Kenji")
+LAST_NAMES = ("Doe", "Smith", "Garcia", "Chen", "Khan", "Adeyemi", "Patel", "Larsen", "Silva", "Tanaka")
+QUERIES = ("m", "ma", "mar", "mari", "maria", "maria g", "garcia", "arci", "1234", "maria.garcia1234@")
+
+
+def search_record(i: int, start: datetime) -> dict:
+    record = customer_record(i, start)
+    record['first_name'] = FIRST_NAMES[i % len(FIRST_NAMES)]
+    record['last_name'] = LAST_NAMES[(i // len(FIRST_NAMES)) % len(LAST_NAMES)]
+    record['email'] = f"{record['first_name']}.{record['last_name']}{i}@example.com".lower()
+    return record
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    start = datetime(2024, 1, 1)
+    db = InMemoryDatabaseManager()
+    for i in range(rows):
+        db.save_customer(search_record(i, start))
+    began = time.perf_counter()
+    service = CustomerService(db)
+    print(f"Python {sys.version.split()[0]}, {rows:,} customers, "
+          f"loaded in {time.perf_counter() - began:.2f} s (best of 3)")
+    for query in QUERIES:
+        timings = []
+        for _ in range(3):
+            gc.collect()
+            began = time.perf_counter()
+            matches = service.search_customers(query)
+            timings.append(time.perf_counter() - began)
+        print(f"{query!r:<22} {len(matches):>9,} matches {min(timings) * 1e3:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
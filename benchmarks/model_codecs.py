@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Serialization benchmark for the models of Tobey Finance Bank
+
+Times the bulk load (``from_dict``) and save (``to_dict``) paths of each
+model, and the startup of ``TransactionService`` over an in-memory
+database, which is dominated by ``from_dict``.
+
+    python benchmarks/model_codecs.py [rows]
+"""
+
+import gc
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from model_memory import (account_record, audit_log_record, customer_record,
+                          transaction_record)
+from src.models.account import Account
+from src.models.audit_log import AuditLog
+from src.models.customer import Customer
+from src.models.transaction import Transaction
+from src.services.transaction_service import TransactionService
+from src.utils.memory_database import InMemoryDatabaseManager
+from datetime import datetime
+
+
+def best_of(function, repeat: int = 3) -> float:
+    """Fastest of several timed runs, in seconds"""
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    start = datetime(2024, 1, 1)
+    print(f"Python {sys.version.split()[0]}, {rows:,} rows per model (best of 3)")
+    for model, make_record in ((Transaction, transaction_record), (AuditLog, audit_log_record),
+                               (Account, account_record), (Customer, customer_record)):
+        records = [make_record(i, start) for i in range(rows)]
+        # from_dict used to modify its argument, so each run decodes fresh copies
+        load = best_of(lambda: [model.from_dict(dict(record)) for record in records])
+        copy = best_of(lambda: [dict(record) for record in records])
+        instances = [model.from_dict(dict(record)) for record in records]
+        save = best_of(lambda: [instance.to_dict() for instance in instances])
+        print(f"{model.__name__:<12} from_dict {(load - copy) / rows * 1e6:6.2f} us/row   "
+              f"to_dict {save / rows * 1e6:6.2f} us/row")
+
+    db = InMemoryDatabaseManager()
+    db.save_transactions(transaction_record(i, start) for i in range(rows))
+    startup = best_of(lambda: TransactionService(db))
+    print(f"TransactionService startup with {rows:,} transactions: {startup:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark for the in-memory models of Tobey Finance Bank
+
+Loads synthetic records the way the services do (JSON -> ``from_dict``)
+and reports the bytes each model instance costs, including its field
+values, as traced by ``tracemalloc``.
+
+    python benchmarks/model_memory.py [rows]
+"""
+
+import gc
+import json
+import os
+import sys
+import tracemalloc
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from src.models.account import Account
+from src.models.audit_log import AuditLog
+from src.models.customer import Customer
+from src.models.transaction import Transaction
+
+ACCOUNTS = 10000
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0"
+
+
+def transaction_record(i: int, start: datetime) -> dict:
+    kind = ('deposit', 'withdrawal', 'transfer')[i % 3]
+    return {
+        'transaction_id': f"{i:016x}",
+        'account_number': f"{i % ACCOUNTS:012d}",
+        'transaction_type': kind,
+        'amount': float(i % 500 + 1),
+        'currency': "USD",
+        'description': kind.capitalize(),
+        'status': 'completed',
+        'timestamp': (start + timedelta(seconds=i)).isoformat(),
+        'reference_number': None,
+        'target_account': f"{(i + 1) % ACCOUNTS:012d}" if kind == 'transfer' else None,
+        'fee': 0.0,
+        'balance_after': float(i),
+    }
+
+
+def audit_log_record(i: int, start: datetime) -> dict:
+    return {
+        'log_id': f"{i:016x}",
+        'employee_id': f"{i % 50:08d}",
+        'action': 'update_account',
+        'target_type': 'account',
+        'target_id': f"{i % ACCOUNTS:012d}",
+        'details': f"Updated account {i % ACCOUNTS}",
+        'ip_address': "10.0.0.%d" % (i % 50),
+        'user_agent': USER_AGENT,
+        'timestamp': (start + timedelta(seconds=i)).isoformat(),
+        'success': True,
+        'additional_data': {},
+    }
+
+
+def account_record(i: int, start: datetime) -> dict:
+    return {
+        'account_number': f"{i:012d}", 'customer_id': f"{i:08d}", 'account_type': 'savings',
+        'balance': 100.0, 'currency': "USD", 'status': 'active',
+        'created_date': start.isoformat(), 'last_updated': start.isoformat(),
+        'interest_rate': 0.02, 'overdraft_limit': 0.0, 'minimum_balance': 0.0,
+    }
+
+
+def customer_record(i: int, start: datetime) -> dict:
+    return {
+        'customer_id': f"{i:08d}", 'first_name': "Jane", 'last_name': "Doe",
+        'email': f"jane{i}@example.com", 'phone': "555-0100", 'address': "1 Main St",
+        'date_of_birth': None, 'status': 'active', 'created_date': start.isoformat(),
+        'last_updated': start.isoformat(), 'kyc_verified': True, 'risk_level': 'low',
+        'accounts': [f"{i:012d}"],
+    }
+
+
+def measure(model, make_record, rows: int, chunk: int = 100000) -> float:
+    """Bytes per instance held after loading ``rows`` records"""
+    start = datetime(2024, 1, 1)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = []
+    for offset in range(0, rows, chunk):
+        # Round-trip through JSON so strings are per-row copies, as when loading from disk
+        records = json.loads(json.dumps([make_record(i, start)
+                                         for i in range(offset, min(rows, offset + chunk))]))
+        instances.extend(model.from_dict(record) for record in records)
+        del records
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del instances
+    return used / rows
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    print(f"Python {sys.version.split()[0]}, {rows:,} rows per model")
+    for model, make_record, count in ((Transaction, transaction_record, rows),
+                                      (AuditLog, audit_log_record, rows),
+                                      (Account, account_record, min(rows, 100000)),
+                                      (Customer, customer_record, min(rows, 100000))):
+        per_row = measure(model, make_record, count)
+        print(f"{model.__name__:<12} {per_row:8.1f} bytes/row  {per_row * count / 2 ** 20:9.1f} MiB for {count:,}")
+
+
+if __name__ == "__main__":
+    main()
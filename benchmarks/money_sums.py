@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Money aggregation benchmark for Tobey Finance Bank
+
+Sums synthetic amounts with cents the way reports used to (a Python loop
+over floats) and over a ``MoneyColumn`` of packed integer cents, and
+reports the time and the error of each against the exact total.
+
+    python benchmarks/money_sums.py [rows]
+"""
+
+import gc
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from src.models.money import Money, MoneyColumn
+
+
+def best_of(function, repeat: int = 3):
+    """Result and fastest time in seconds of several runs"""
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        result = function()
+        timings.append(time.perf_counter() - start)
+    return result, min(timings)
+
+
+def float_loop(amounts):
+    total = 0.0
+    for amount in amounts:
+        total += amount
+    return total
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    rng = random.Random(0)
+    cents = [rng.randrange(1, 1000000) for _ in range(rows)]
+    exact = Money.from_cents(sum(cents))
+    amounts = [c / 100 for c in cents]
+    column = MoneyColumn(amounts)
+    print(f"Python {sys.version.split()[0]}, {rows:,} amounts, exact total {exact:,.2f} (best of 3)")
+
+    for name, function in (("float loop", lambda: float_loop(amounts)),
+                           ("sum(floats)", lambda: sum(amounts)),
+                           ("MoneyColumn.total", column.total)):
+        total, elapsed = best_of(function)
+        print(f"{name:<18} {elapsed * 1e3:8.1f} ms   off by {abs(total - float(exact)):.10f}")
+    print(f"MoneyColumn        {column.cents.itemsize * len(column) / 2**20:8.1f} MiB packed")
+
+
+if __name__ == "__main__":
+    main()
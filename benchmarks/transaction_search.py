@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Transaction search benchmark for Tobey Finance Bank
+
+Loads synthetic transactions into ``TransactionService`` over an
+in-memory database, timing the cold build of the search index, then times
+``search_transactions`` for selective and broad search terms. Reference
+numbers are random, as real ones arrive in no particular order.
+
+    python benchmarks/transaction_search.py [rows]
+"""
+
+import gc
+import os
+import random
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from model_memory import ACCOUNTS, transaction_record
+from src.services.transaction_service import TransactionService
+from src.utils.memory_database import InMemoryDatabaseManager
+
+def search_record(i: int, start: datetime, reference: int) -> dict:
+    record = transaction_record(i, start)
+    if record['transaction_type'] == 'transfer':
+        record['target_account'] = f"{(i * 7) % ACCOUNTS:012d}"
+        record['description'] = f"Transfer to {record['target_account']}"
+    elif i % 10 == 1:
+        record['description'] = "Salary payment"
+    record['reference_number'] = f"REF-{reference:09d}"
+    return record
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    start = datetime(2024, 1, 1)
+    references = random.Random(42).sample(range(10 ** 9), rows)
+    db = InMemoryDatabaseManager()
+    db.save_transactions(search_record(i, start, references[i]) for i in range(rows))
+    print(f"Python {sys.version.split()[0]}, {rows:,} transactions (best of 3)")
+    gc.collect()
+    began = time.perf_counter()
+    service = TransactionService(db)
+    print(f"{'load and index':<28} {time.perf_counter() - began:>23.2f} s")
+
+    reference = f"REF-{references[rows // 2]:09d}"
+    queries = (reference, reference[:8].lower(), "transfer to 000000001234", "salary", "deposit")
+    for query in queries:
+        timings = []
+        for _ in range(3):
+            gc.collect()
+            began = time.perf_counter()
+            matches = service.search_transactions(query)
+            timings.append(time.perf_counter() - began)
+        print(f"{query!r:<28} {len(matches):>9,} matches {min(timings) * 1e3:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
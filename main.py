@@ -12,7 +12,7 @@ from datetime import datetime
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
 from src.ui.cli import BankingCLI
-from src.utils.database import DatabaseManager
+from src.utils.backends import create_database_manager
 
 
 def main():
@@ -23,13 +23,14 @@ def main():
     print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print()
     
+    cli = None
     try:
         # Initialize database
-        db_manager = DatabaseManager()
+        db_manager = create_database_manager()
         db_manager.initialize_database()
         
         # Start the CLI interface
-        cli = BankingCLI()
+        cli = BankingCLI(db_manager)
         cli.run()
         
     except KeyboardInterrupt:
@@ -39,6 +40,9 @@ def main():
         print(f"\nAn error occurred: {e}")
         print("Please contact system administrator.")
         sys.exit(1)
+    finally:
+        if cli is not None:
+            cli.close()
 
 
 if __name__ == "__main__":
@@ -7,6 +7,7 @@ from .customer import Customer
 from .transaction import Transaction
 from .employee import Employee
 from .audit_log import AuditLog
+from .money import Money
 
-__all__ = ['Account', 'Customer', 'Transaction', 'Employee', 'AuditLog'] 
-__all__ = ['Account', 'Customer', 'Transaction', 'Employee'] 
\ No newline at end of file
+__all__ = ['Account', 'Customer', 'Transaction', 'Employee', 'AuditLog', 'Money'] 
+__all__ = ['Account', 'Customer', 'Transaction', 'Employee', 'Money'] 
\ No newline at end of file
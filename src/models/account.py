@@ -8,6 +8,10 @@ from typing import List, Optional
 from enum import Enum
 import uuid
 
+from .codec import ModelCodec
+from .money import Money, to_cents
+from .slots import add_slots
+
 
 class AccountType(Enum):
     """Account types available in the bank"""
@@ -25,6 +29,7 @@ class AccountStatus(Enum):
     CLOSED = "closed"
 
 
+@add_slots
 @dataclass
 class Account:
     """Bank account model"""
@@ -32,17 +37,20 @@ class Account:
     account_number: str = field(default_factory=lambda: str(uuid.uuid4())[:12])
     customer_id: str = ""
     account_type: AccountType = AccountType.SAVINGS
-    balance: float = 0.0
+    balance: Money = Money(0)
     currency: str = "USD"
     status: AccountStatus = AccountStatus.ACTIVE
     created_date: datetime = field(default_factory=datetime.now)
     last_updated: datetime = field(default_factory=datetime.now)
     interest_rate: float = 0.02  # 2% default interest rate
-    overdraft_limit: float = 0.0
-    minimum_balance: float = 0.0
+    overdraft_limit: Money = Money(0)
+    minimum_balance: Money = Money(0)
     
     def __post_init__(self):
         """Validate account data after initialization"""
+        self.balance = Money(self.balance)
+        self.overdraft_limit = Money(self.overdraft_limit)
+        self.minimum_balance = Money(self.minimum_balance)
         if self.balance < 0:
             raise ValueError("Account balance cannot be negative")
         if self.interest_rate < 0 or self.interest_rate > 1:
@@ -50,7 +58,8 @@ class Account:
     
     def deposit(self, amount: float) -> bool:
         """Deposit money into the account"""
-        if amount <= 0:
+        # Amounts that round to no cents would post an empty transaction
+        if to_cents(amount) <= 0:
             return False
         if self.status != AccountStatus.ACTIVE:
             return False
@@ -61,7 +70,8 @@ class Account:
     
     def withdraw(self, amount: float) -> bool:
         """Withdraw money from the account"""
-        if amount <= 0:
+        # Amounts that round to no cents would post an empty transaction
+        if to_cents(amount) <= 0:
             return False
         if self.status != AccountStatus.ACTIVE:
             return False
@@ -84,41 +94,28 @@ class Account:
                 self.deposit(amount)
         return False
     
-    def calculate_interest(self) -> float:
-        """Calculate interest for the account"""
+    def calculate_interest(self) -> Money:
+        """Calculate interest for the account, rounded to the cent"""
         if self.account_type == AccountType.SAVINGS:
             return self.balance * self.interest_rate
-        return 0.0
+        return Money(0)
     
     def is_active(self) -> bool:
         """Check if account is active"""
         return self.status == AccountStatus.ACTIVE
     
-    def get_available_balance(self) -> float:
+    def get_available_balance(self) -> Money:
         """Get available balance including overdraft"""
         return self.balance + self.overdraft_limit
     
     def to_dict(self) -> dict:
         """Convert account to dictionary"""
-        return {
-            'account_number': self.account_number,
-            'customer_id': self.customer_id,
-            'account_type': self.account_type.value,
-            'balance': self.balance,
-            'currency': self.currency,
-            'status': self.status.value,
-            'created_date': self.created_date.isoformat(),
-            'last_updated': self.last_updated.isoformat(),
-            'interest_rate': self.interest_rate,
-            'overdraft_limit': self.overdraft_limit,
-            'minimum_balance': self.minimum_balance
-        }
+        return _codec.to_dict(self)
     
     @classmethod
     def from_dict(cls, data: dict) -> 'Account':
-        """Create account from dictionary"""
-        data['account_type'] = AccountType(data['account_type'])
-        data['status'] = AccountStatus(data['status'])
-        data['created_date'] = datetime.fromisoformat(data['created_date'])
-        data['last_updated'] = datetime.fromisoformat(data['last_updated'])
-        return cls(**data) 
\ No newline at end of file
+        """Create account from dictionary, leaving the dictionary unchanged"""
+        return _codec.from_dict(data)
+
+
+_codec = ModelCodec(Account)
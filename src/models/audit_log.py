@@ -6,7 +6,10 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, Dict, Any
 from enum import Enum
-import uuid
+
+from .codec import ModelCodec
+from .ids import new_ulid
+from .slots import add_slots, intern_str
 
 class AuditAction(Enum):
     """Types of audit actions"""
@@ -28,10 +31,15 @@ class AuditAction(Enum):
     UPDATE_TRANSACTION = "update_transaction"
     DELETE_TRANSACTION = "delete_transaction"
 
+@add_slots
 @dataclass
 class AuditLog:
-    """Audit log entry for tracking employee actions"""
-    log_id: str = field(default_factory=lambda: str(uuid.uuid4())[:16])
+    """Audit log entry for tracking employee actions
+    
+    Slotted, with the often repeated employee, target type, IP address and
+    user agent strings shared between instances.
+    """
+    log_id: str = field(default_factory=new_ulid)
     employee_id: str = ""
     action: AuditAction = AuditAction.LOGIN
     target_type: str = ""  # employee, account, customer, transaction
@@ -43,23 +51,20 @@ class AuditLog:
     success: bool = True
     additional_data: Dict[str, Any] = field(default_factory=dict)
 
+    def __post_init__(self):
+        self.employee_id = intern_str(self.employee_id)
+        self.target_type = intern_str(self.target_type)
+        self.ip_address = intern_str(self.ip_address)
+        self.user_agent = intern_str(self.user_agent)
+
     def to_dict(self) -> dict:
-        return {
-            'log_id': self.log_id,
-            'employee_id': self.employee_id,
-            'action': self.action.value,
-            'target_type': self.target_type,
-            'target_id': self.target_id,
-            'details': self.details,
-            'ip_address': self.ip_address,
-            'user_agent': self.user_agent,
-            'timestamp': self.timestamp.isoformat(),
-            'success': self.success,
-            'additional_data': self.additional_data
-        }
+        """Convert audit log to dictionary"""
+        return _codec.to_dict(self)
 
     @classmethod
     def from_dict(cls, data: dict) -> 'AuditLog':
-        data['action'] = AuditAction(data['action'])
-        data['timestamp'] = datetime.fromisoformat(data['timestamp'])
-        return cls(**data) 
\ No newline at end of file
+        """Create audit log from dictionary, leaving the dictionary unchanged"""
+        return _codec.from_dict(data)
+
+
+_codec = ModelCodec(AuditLog)
@@ -0,0 +1,104 @@
+"""
+Compiled dictionary codecs for Tobey Finance Bank models
+"""
+
+from dataclasses import MISSING, fields
+from datetime import datetime
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Type, Union, get_args, get_origin
+
+
+class EnumTable(dict):
+    """Value to member lookup for an enum that fails like ``Enum(value)``"""
+
+    def __init__(self, enum: Type[Enum]):
+        super().__init__((member.value, member) for member in enum)
+        # Members map to themselves, as Enum(member) allows
+        self.update((member, member) for member in enum)
+        self.enum = enum
+
+    def __missing__(self, value: Any):
+        raise ValueError(f"{value!r} is not a valid {self.enum.__qualname__}")
+
+
+def _field_kind(annotation: Any) -> tuple:
+    """Classify a field annotation as ('enum', cls), ('timestamp', optional) or ('plain',)"""
+    optional = False
+    if get_origin(annotation) is Union:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            annotation, optional = args[0], True
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        return ('enum', annotation)
+    if annotation is datetime:
+        return ('timestamp', optional)
+    return ('plain',)
+
+
+class ModelCodec:
+    """``to_dict``/``from_dict`` functions generated for one dataclass model
+
+    As ``dataclasses`` does for ``__init__``, the conversion functions are
+    generated from the model's fields once, so converting a record is a
+    single call with no per-field dispatch. Enum fields go through lookup
+    tables instead of ``Enum(value)``, datetime fields are parsed and
+    formatted inline, and ``from_dict`` fills the instance directly (then
+    runs ``__post_init__``) without building keyword arguments or touching
+    the record it is given. Missing keys take the field's default and
+    unknown keys are ignored.
+    """
+
+    def __init__(self, cls: type):
+        self.cls = cls
+        self._namespace: Dict[str, Any] = {
+            '_cls': cls, '_new': object.__new__, '_parse': datetime.fromisoformat,
+        }
+        encode: List[str] = []
+        decode: List[str] = []
+        for f in fields(cls):
+            kind = _field_kind(f.type)
+            name = f.name
+            value = f"data[{name!r}]"
+            attribute = f"obj.{name}"
+
+            if kind[0] == 'enum':
+                self._namespace[f"_enum_{name}"] = EnumTable(kind[1])
+                value = f"_enum_{name}[{value}]"
+                attribute = f"{attribute}._value_"
+            elif kind[0] == 'timestamp':
+                value = f"_parse({value})"
+                attribute = f"{attribute}.isoformat()"
+                if kind[1]:
+                    attribute = f"{attribute} if obj.{name} else None"
+
+            if f.default is not MISSING:
+                self._namespace[f"_default_{name}"] = f.default
+                default = f"_default_{name}"
+            elif f.default_factory is not MISSING:
+                self._namespace[f"_factory_{name}"] = f.default_factory
+                default = f"_factory_{name}()"
+            else:
+                default = None
+
+            if kind[0] == 'timestamp' and kind[1]:
+                # Empty values mean no timestamp, as in the original from_dict methods
+                value = f"{value} if data.get({name!r}) else {default or 'None'}"
+            elif default is not None:
+                value = f"{value} if {name!r} in data else {default}"
+            decode.append(f"    obj.{name} = {value}")
+            encode.append(f"        {name!r}: {attribute},")
+
+        if hasattr(cls, '__post_init__'):
+            decode.append("    obj.__post_init__()")
+        self.to_dict: Callable[[Any], Dict[str, Any]] = self._compile(
+            "to_dict", "obj", ["    return {", *encode, "    }"])
+        self.from_dict: Callable[[Dict[str, Any]], Any] = self._compile(
+            "from_dict", "data", ["    obj = _new(_cls)", *decode, "    return obj"])
+
+    def _compile(self, name: str, argument: str, body: List[str]) -> Callable:
+        source = "\n".join([f"def {name}({argument}):", *body])
+        namespace: Dict[str, Any] = {}
+        exec(source, self._namespace, namespace)
+        function = namespace[name]
+        function.__qualname__ = f"{self.cls.__qualname__}Codec.{name}"
+        return function
@@ -8,6 +8,9 @@ from typing import List, Optional
 from enum import Enum
 import uuid
 
+from .codec import ModelCodec
+from .slots import add_slots
+
 
 class CustomerStatus(Enum):
     """Customer status enumeration"""
@@ -17,6 +20,7 @@ class CustomerStatus(Enum):
     BLACKLISTED = "blacklisted"
 
 
+@add_slots
 @dataclass
 class Customer:
     """Customer model for the bank"""
@@ -90,28 +94,12 @@ class Customer:
     
     def to_dict(self) -> dict:
         """Convert customer to dictionary"""
-        return {
-            'customer_id': self.customer_id,
-            'first_name': self.first_name,
-            'last_name': self.last_name,
-            'email': self.email,
-            'phone': self.phone,
-            'address': self.address,
-            'date_of_birth': self.date_of_birth.isoformat() if self.date_of_birth else None,
-            'status': self.status.value,
-            'created_date': self.created_date.isoformat(),
-            'last_updated': self.last_updated.isoformat(),
-            'kyc_verified': self.kyc_verified,
-            'risk_level': self.risk_level,
-            'accounts': self.accounts
-        }
+        return _codec.to_dict(self)
     
     @classmethod
     def from_dict(cls, data: dict) -> 'Customer':
-        """Create customer from dictionary"""
-        data['status'] = CustomerStatus(data['status'])
-        data['created_date'] = datetime.fromisoformat(data['created_date'])
-        data['last_updated'] = datetime.fromisoformat(data['last_updated'])
-        if data.get('date_of_birth'):
-            data['date_of_birth'] = datetime.fromisoformat(data['date_of_birth'])
-        return cls(**data) 
\ No newline at end of file
+        """Create customer from dictionary, leaving the dictionary unchanged"""
+        return _codec.from_dict(data)
+
+
+_codec = ModelCodec(Customer)
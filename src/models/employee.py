@@ -8,6 +8,9 @@ from typing import Optional
 from enum import Enum
 import uuid
 
+from .codec import ModelCodec
+from .money import Money
+
 class Department(Enum):
     AdminHR = "Admin/HR Department"
     Accounts = "Accounts Department"
@@ -41,50 +44,25 @@ class Employee:
     created_date: datetime = field(default_factory=datetime.now)
     last_login: Optional[datetime] = None
     account_number: Optional[str] = None
-    account_balance: Optional[float] = None
+    account_balance: Optional[Money] = None
     account_type: Optional[str] = None
 
+    def __post_init__(self):
+        """Hold the account balance as Money"""
+        if self.account_balance is not None:
+            self.account_balance = Money(self.account_balance)
+
     def full_name(self) -> str:
         return f"{self.first_name} {self.last_name}"
 
     def to_dict(self) -> dict:
-        return {
-            'employee_id': self.employee_id,
-            'username': self.username,
-            'password_hash': self.password_hash,
-            'first_name': self.first_name,
-            'last_name': self.last_name,
-            'email': self.email,
-            'department': self.department.value,
-            'role': self.role.value,
-            'is_active': self.is_active,
-            'created_date': self.created_date.isoformat(),
-            'last_login': self.last_login.isoformat() if self.last_login else None,
-            'account_number': self.account_number,
-            'account_balance': self.account_balance,
-            'account_type': self.account_type
-        }
+        """Convert employee to dictionary"""
+        return _codec.to_dict(self)
 
     @classmethod
     def from_dict(cls, data: dict) -> 'Employee':
-        # Create a copy to avoid modifying the original
-        employee_data = data.copy()
-        
-        # Convert enum values
-        employee_data['department'] = Department(employee_data['department'])
-        employee_data['role'] = Role(employee_data['role'])
-        
-        # Convert datetime values
-        employee_data['created_date'] = datetime.fromisoformat(employee_data['created_date'])
-        if employee_data.get('last_login'):
-            employee_data['last_login'] = datetime.fromisoformat(employee_data['last_login'])
-        
-        # Handle customer fields - ensure they exist
-        if 'account_number' not in employee_data:
-            employee_data['account_number'] = None
-        if 'account_balance' not in employee_data:
-            employee_data['account_balance'] = None
-        if 'account_type' not in employee_data:
-            employee_data['account_type'] = None
-            
-        return cls(**employee_data) 
\ No newline at end of file
+        """Create employee from dictionary, leaving the dictionary unchanged"""
+        return _codec.from_dict(data)
+
+
+_codec = ModelCodec(Employee)
@@ -0,0 +1,135 @@
+"""
+Fixed-point money for Tobey Finance Bank
+"""
+
+from array import array
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
+from typing import Any, Iterable, Optional
+
+_WHOLE_CENTS = Decimal(1)
+
+
+def to_cents(amount: Any) -> int:
+    """Convert an amount in currency units to integer cents, rounding half up
+
+    Floats are taken as the decimal they print as, so ``0.285`` is 29 cents
+    even though the nearest double is slightly below 0.285.
+    """
+    if type(amount) is Money:
+        return amount.cents
+    if isinstance(amount, int):
+        return amount * 100
+    if isinstance(amount, float):
+        cents = round(amount * 100)
+        if cents / 100 == amount:
+            return cents
+        amount = repr(amount)
+    try:
+        return int((Decimal(amount) * 100).quantize(_WHOLE_CENTS, rounding=ROUND_HALF_UP))
+    except (InvalidOperation, TypeError):
+        raise ValueError(f"Invalid amount: {amount!r}") from None
+
+
+class Money(float):
+    """Amount of money held to a whole number of cents
+
+    Behaves as the float of its value, so it compares, formats and
+    serializes to JSON like the plain floats it replaces, but sums and
+    differences are computed on integer cents and never drift. Amounts are
+    rounded to the cent (half up) when they become Money; multiplying by a
+    rate rounds the result the same way.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, amount: Any = 0):
+        if type(amount) is float:
+            # Fast path for stored amounts, which are already whole cents
+            cents = round(amount * 100)
+            if cents / 100 == amount:
+                return float.__new__(cls, amount) if cents else _ZERO
+        elif type(amount) is cls:
+            return amount
+        return float.__new__(cls, to_cents(amount) / 100)
+
+    @classmethod
+    def from_cents(cls, cents: int) -> 'Money':
+        """Money for an integer number of cents"""
+        return float.__new__(cls, cents / 100)
+
+    @property
+    def cents(self) -> int:
+        """The amount as integer cents"""
+        # Exact: the value is the double nearest to cents / 100
+        return round(float.__mul__(self, 100))
+
+    def __add__(self, other):
+        if not isinstance(other, (int, float, Decimal)):
+            return NotImplemented
+        return Money.from_cents(self.cents + to_cents(other))
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if not isinstance(other, (int, float, Decimal)):
+            return NotImplemented
+        return Money.from_cents(self.cents - to_cents(other))
+
+    def __rsub__(self, other):
+        if not isinstance(other, (int, float, Decimal)):
+            return NotImplemented
+        return Money.from_cents(to_cents(other) - self.cents)
+
+    def __mul__(self, other):
+        if isinstance(other, int):
+            return Money.from_cents(self.cents * other)
+        if isinstance(other, float) and not isinstance(other, Money):
+            return Money(float.__mul__(self, other))
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def __neg__(self):
+        return Money.from_cents(-self.cents)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return self if self >= 0 else -self
+
+
+_ZERO = float.__new__(Money, 0.0)
+
+
+class MoneyColumn:
+    """Amounts packed as integer cents in an ``array('q')``
+
+    Keeps one machine word per amount instead of an object, and totals
+    the column with a single ``sum`` over the array, which runs in C and
+    is exact since the cents are integers.
+    """
+
+    __slots__ = ('cents',)
+
+    def __init__(self, amounts: Iterable[Any] = ()):
+        self.cents = array('q', [to_cents(amount) for amount in amounts])
+
+    def __len__(self) -> int:
+        return len(self.cents)
+
+    def __getitem__(self, row: int) -> Money:
+        return Money.from_cents(self.cents[row])
+
+    def __setitem__(self, row: int, amount: Any):
+        self.cents[row] = to_cents(amount)
+
+    def append(self, amount: Any):
+        """Add an amount as the next row"""
+        self.cents.append(to_cents(amount))
+
+    def total(self, rows: Optional[Iterable[int]] = None) -> Money:
+        """Exact sum of the column, or of the given rows of it"""
+        if rows is None:
+            return Money.from_cents(sum(self.cents))
+        return Money.from_cents(sum(map(self.cents.__getitem__, rows)))
@@ -0,0 +1,45 @@
+"""
+Compact storage helpers for Tobey Finance Bank models
+"""
+
+import sys
+from dataclasses import fields
+from typing import Optional
+
+
+def add_slots(cls):
+    """Rebuild a dataclass to store its fields in ``__slots__``
+
+    Drops the per-instance ``__dict__``, which costs more than the fields
+    themselves for the models kept in memory by the millions. Equivalent
+    to ``@dataclass(slots=True)``, which needs Python 3.10. Apply it above
+    ``@dataclass``; instances can then only hold their declared fields.
+    """
+    field_names = tuple(f.name for f in fields(cls))
+
+    def __getstate__(self):
+        return [getattr(self, name) for name in field_names]
+
+    def __setstate__(self, state):
+        # A dict is the state pickled before the model was slotted
+        items = state.items() if isinstance(state, dict) else zip(field_names, state)
+        for name, value in items:
+            object.__setattr__(self, name, value)
+
+    namespace = dict(cls.__dict__)
+    namespace['__slots__'] = field_names
+    namespace['__getstate__'] = __getstate__
+    namespace['__setstate__'] = __setstate__
+    # Class-level defaults would clash with the slots; __init__ keeps its own copies
+    for name in field_names:
+        namespace.pop(name, None)
+    namespace.pop('__dict__', None)
+    namespace.pop('__weakref__', None)
+    slotted = type(cls)(cls.__name__, cls.__bases__, namespace)
+    slotted.__qualname__ = cls.__qualname__
+    return slotted
+
+
+def intern_str(value: Optional[str]) -> Optional[str]:
+    """Share one copy of a frequently repeated string, such as an account number"""
+    return sys.intern(value) if type(value) is str else value
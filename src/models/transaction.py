@@ -6,7 +6,11 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 from enum import Enum
-import uuid
+
+from .codec import ModelCodec
+from .ids import new_ulid
+from .money import Money
+from .slots import add_slots, intern_str
 
 
 class TransactionType(Enum):
@@ -27,31 +31,44 @@ class TransactionStatus(Enum):
     CANCELLED = "cancelled"
 
 
+@add_slots
 @dataclass
 class Transaction:
-    """Transaction model for the bank"""
+    """Transaction model for the bank
+    
+    Slotted, with account numbers, currency and description shared between
+    instances, since the full history is kept in memory.
+    """
     
-    transaction_id: str = field(default_factory=lambda: str(uuid.uuid4())[:16])
+    transaction_id: str = field(default_factory=new_ulid)
     account_number: str = ""
     transaction_type: TransactionType = TransactionType.DEPOSIT
-    amount: float = 0.0
+    amount: Money = Money(0)
     currency: str = "USD"
     description: str = ""
     status: TransactionStatus = TransactionStatus.PENDING
     timestamp: datetime = field(default_factory=datetime.now)
     reference_number: Optional[str] = None
     target_account: Optional[str] = None  # For transfers
-    fee: float = 0.0
-    balance_after: Optional[float] = None
+    fee: Money = Money(0)
+    balance_after: Optional[Money] = None
     
     def __post_init__(self):
         """Validate transaction data after initialization"""
+        self.amount = Money(self.amount)
+        self.fee = Money(self.fee)
+        if self.balance_after is not None:
+            self.balance_after = Money(self.balance_after)
         if self.amount <= 0:
             raise ValueError("Transaction amount must be positive")
         if not self.account_number:
             raise ValueError("Account number is required")
         if self.transaction_type == TransactionType.TRANSFER and not self.target_account:
             raise ValueError("Target account required for transfers")
+        self.account_number = intern_str(self.account_number)
+        self.currency = intern_str(self.currency)
+        self.description = intern_str(self.description)
+        self.target_account = intern_str(self.target_account)
     
     def process(self) -> bool:
         """Process the transaction"""
@@ -76,7 +93,7 @@ class Transaction:
             return True
         return False
     
-    def get_total_amount(self) -> float:
+    def get_total_amount(self) -> Money:
         """Get total amount including fees"""
         return self.amount + self.fee
     
@@ -90,25 +107,12 @@ class Transaction:
     
     def to_dict(self) -> dict:
         """Convert transaction to dictionary"""
-        return {
-            'transaction_id': self.transaction_id,
-            'account_number': self.account_number,
-            'transaction_type': self.transaction_type.value,
-            'amount': self.amount,
-            'currency': self.currency,
-            'description': self.description,
-            'status': self.status.value,
-            'timestamp': self.timestamp.isoformat(),
-            'reference_number': self.reference_number,
-            'target_account': self.target_account,
-            'fee': self.fee,
-            'balance_after': self.balance_after
-        }
+        return _codec.to_dict(self)
     
     @classmethod
     def from_dict(cls, data: dict) -> 'Transaction':
-        """Create transaction from dictionary"""
-        data['transaction_type'] = TransactionType(data['transaction_type'])
-        data['status'] = TransactionStatus(data['status'])
-        data['timestamp'] = datetime.fromisoformat(data['timestamp'])
-        return cls(**data) 
\ No newline at end of file
+        """Create transaction from dictionary, leaving the dictionary unchanged"""
+        return _codec.from_dict(data)
+
+
+_codec = ModelCodec(Transaction)
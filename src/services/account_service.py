@@ -2,28 +2,91 @@
 Account service for Tobey Finance Bank
 """
 
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Iterable, Tuple, Any
 from datetime import datetime
+import os
 import uuid
 
 from ..models.account import Account, AccountType, AccountStatus
+from ..models.money import Money
 from ..models.transaction import Transaction, TransactionType, TransactionStatus
+from ..utils.snapshot import TrackedVersion, load_service_snapshot, save_service_snapshot
+from ..utils.write_behind import WriteBehindBuffer
 
 
 class AccountService:
-    """Service class for account operations"""
+    """Service class for account operations
     
-    def __init__(self, database_manager):
+    With ``write_behind=True`` balance and status updates are kept in
+    memory and written to the database in batches, every
+    ``flush_interval`` seconds or once ``flush_threshold`` accounts are
+    dirty, instead of one full accounts write per posting. Each update is
+    first fsynced to an intent log in the data directory, which is
+    replayed after a crash. The database then lags the service, so this
+    mode assumes a single process owns the accounts; call ``close`` on
+    shutdown.
+    """
+    
+    def __init__(self, database_manager, write_behind: bool = False,
+                 flush_interval: float = 1.0, flush_threshold: int = 100):
         self.db = database_manager
         self.accounts: Dict[str, Account] = {}
+        self._version = TrackedVersion(self.db, 'accounts')
+        self._write_behind: Optional[WriteBehindBuffer] = None
+        if write_behind:
+            data_dir = getattr(self.db, 'data_dir', None)
+            intent_log = os.path.join(data_dir, "accounts.intent.jsonl") if data_dir else None
+            # Replays any intent log left by a crash before accounts are loaded
+            self._write_behind = WriteBehindBuffer(self._write_accounts, 'account_number',
+                                                   intent_log, flush_interval, flush_threshold)
         self._load_accounts()
     
     def _load_accounts(self):
-        """Load accounts from database"""
+        """Load accounts from a snapshot, falling back to the database"""
+        self._version.track()
+        accounts = load_service_snapshot(self.db, 'accounts', self._version)
+        if accounts is not None:
+            self.accounts = accounts
+            return
+        
         accounts_data = self.db.get_all_accounts()
         for account_data in accounts_data:
             account = Account.from_dict(account_data)
             self.accounts[account.account_number] = account
+        self.save_snapshot()
+    
+    def save_snapshot(self):
+        """Snapshot the accounts for fast startup
+        
+        Called after a cold load and on shutdown. Queued updates are
+        flushed first; nothing is saved if another writer has changed the
+        accounts since they were loaded.
+        """
+        self.flush()
+        save_service_snapshot(self.db, 'accounts', self.accounts, self._version)
+    
+    def _save_account(self, account: Account):
+        """Persist an updated account, or queue it in write-behind mode"""
+        if self._write_behind is not None:
+            self._write_behind.put(account.to_dict())
+        else:
+            with self._version.writing():
+                self.db.update_account(account.to_dict())
+    
+    def _write_accounts(self, records: List[Dict[str, Any]]):
+        """Write a batch of queued account updates"""
+        with self._version.writing():
+            self.db.save_accounts(records)
+    
+    def flush(self):
+        """Write any queued account updates to the database"""
+        if self._write_behind is not None:
+            self._write_behind.flush()
+    
+    def close(self):
+        """Flush queued account updates and stop the background flusher"""
+        if self._write_behind is not None:
+            self._write_behind.close()
     
     def create_account(self, customer_id: str, account_type: AccountType, 
                       initial_balance: float = 0.0) -> Optional[Account]:
@@ -36,7 +99,8 @@ class AccountService:
             )
             
             # Save to database
-            self.db.save_account(account.to_dict())
+            with self._version.writing():
+                self.db.save_account(account.to_dict())
             self.accounts[account.account_number] = account
             
             return account
@@ -44,6 +108,32 @@ class AccountService:
             print(f"Error creating account: {e}")
             return None
     
+    def create_accounts(self, account_specs: Iterable[Dict[str, Any]]) -> List[Optional[Account]]:
+        """Create many accounts and persist them with a single write
+        
+        Each spec holds the keyword arguments of ``create_account``; invalid
+        specs yield None in the result, like ``create_account`` does.
+        """
+        results: List[Optional[Account]] = []
+        for spec in account_specs:
+            try:
+                results.append(Account(
+                    customer_id=spec['customer_id'],
+                    account_type=spec['account_type'],
+                    balance=spec.get('initial_balance', 0.0)
+                ))
+            except Exception as e:
+                print(f"Error creating account: {e}")
+                results.append(None)
+        
+        accounts = [account for account in results if account is not None]
+        with self._version.writing():
+            self.db.save_accounts(account.to_dict() for account in accounts)
+        for account in accounts:
+            self.accounts[account.account_number] = account
+        
+        return results
+    
     def get_account(self, account_number: str) -> Optional[Account]:
         """Get account by account number"""
         return self.accounts.get(account_number)
@@ -74,11 +164,43 @@ class AccountService:
             self.db.save_transaction(transaction.to_dict())
             
             # Update account in database
-            self.db.update_account(account.to_dict())
+            self._save_account(account)
             
             return True
         return False
     
+    def deposit_many(self, deposits: Iterable[Tuple[str, float]],
+                     description: str = "Deposit") -> List[bool]:
+        """Post many deposits (e.g. payroll) with one batched write per collection"""
+        results = []
+        transactions = []
+        updated_accounts: Dict[str, Account] = {}
+        
+        for account_number, amount in deposits:
+            account = self.get_account(account_number)
+            if not account or not account.deposit(amount):
+                results.append(False)
+                continue
+            
+            transactions.append(Transaction(
+                account_number=account_number,
+                transaction_type=TransactionType.DEPOSIT,
+                amount=amount,
+                description=description,
+                balance_after=account.balance
+            ))
+            updated_accounts[account_number] = account
+            results.append(True)
+        
+        if transactions:
+            self.db.save_transactions(transaction.to_dict() for transaction in transactions)
+            if self._write_behind is not None:
+                self._write_behind.put_many([account.to_dict() for account in updated_accounts.values()])
+            else:
+                self._write_accounts([account.to_dict() for account in updated_accounts.values()])
+        
+        return results
+    
     def withdraw(self, account_number: str, amount: float, 
                  description: str = "Withdrawal") -> bool:
         """Withdraw money from account"""
@@ -100,7 +222,7 @@ class AccountService:
             self.db.save_transaction(transaction.to_dict())
             
             # Update account in database
-            self.db.update_account(account.to_dict())
+            self._save_account(account)
             
             return True
         return False
@@ -139,13 +261,13 @@ class AccountService:
             self.db.save_transaction(credit_transaction.to_dict())
             
             # Update accounts in database
-            self.db.update_account(source_account.to_dict())
-            self.db.update_account(target_account.to_dict())
+            self._save_account(source_account)
+            self._save_account(target_account)
             
             return True
         return False
     
-    def get_account_balance(self, account_number: str) -> Optional[float]:
+    def get_account_balance(self, account_number: str) -> Optional[Money]:
         """Get account balance"""
         account = self.get_account(account_number)
         return account.balance if account else None
@@ -170,15 +292,15 @@ class AccountService:
         account.last_updated = datetime.now()
         
         # Update account in database
-        self.db.update_account(account.to_dict())
+        self._save_account(account)
         
         return True
     
-    def calculate_interest(self, account_number: str) -> float:
+    def calculate_interest(self, account_number: str) -> Money:
         """Calculate interest for an account"""
         account = self.get_account(account_number)
         if not account:
-            return 0.0
+            return Money(0)
         
         return account.calculate_interest()
     
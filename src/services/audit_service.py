@@ -5,12 +5,12 @@ Audit service for Tobey Finance Bank
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
 from ..models.audit_log import AuditLog, AuditAction
-from ..utils.database import DatabaseManager
+from ..utils.storage import StorageBackend
 
 class AuditService:
     """Service class for audit operations"""
     
-    def __init__(self, database_manager: DatabaseManager):
+    def __init__(self, database_manager: StorageBackend):
         self.db = database_manager
     
     def log_action(self, employee_id: str, action: AuditAction, target_type: str = "", 
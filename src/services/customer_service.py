@@ -6,6 +6,8 @@ from typing import List, Optional, Dict
 from datetime import datetime
 
 from ..models.customer import Customer, CustomerStatus
+from ..utils.snapshot import TrackedVersion, load_service_snapshot, save_service_snapshot
+from ..utils.text_index import TrigramIndex
 
 
 class CustomerService:
@@ -14,14 +16,49 @@ class CustomerService:
     def __init__(self, database_manager):
         self.db = database_manager
         self.customers: Dict[str, Customer] = {}
+        self._search_index = TrigramIndex()
+        self._version = TrackedVersion(self.db, 'customers')
         self._load_customers()
     
     def _load_customers(self):
-        """Load customers from database"""
+        """Load customers from a snapshot, falling back to the database"""
+        self._version.track()
+        customers = load_service_snapshot(self.db, 'customers', self._version)
+        if customers is not None:
+            self.customers = customers
+            search_index = load_service_snapshot(self.db, 'customers_search', self._version)
+            if search_index is not None and len(search_index) == len(customers):
+                self._search_index = search_index
+            else:
+                for customer in customers.values():
+                    self._index_customer(customer)
+            return
+        
         customers_data = self.db.get_all_customers()
         for customer_data in customers_data:
             customer = Customer.from_dict(customer_data)
             self.customers[customer.customer_id] = customer
+            self._index_customer(customer)
+        self.save_snapshot()
+    
+    def save_snapshot(self):
+        """Snapshot the customers and their search index for fast startup
+        
+        Called after a cold load and on shutdown; nothing is saved if
+        another writer has changed the customers since they were loaded.
+        """
+        save_service_snapshot(self.db, 'customers', self.customers, self._version)
+        save_service_snapshot(self.db, 'customers_search', self._search_index, self._version)
+    
+    def _update_customer(self, customer: Customer):
+        """Write an updated customer to the database"""
+        with self._version.writing():
+            self.db.update_customer(customer.to_dict())
+    
+    def _index_customer(self, customer: Customer):
+        """(Re)index the fields a customer is searched by"""
+        self._search_index.add(customer.customer_id, customer.first_name, customer.last_name,
+                               customer.full_name, customer.email)
     
     def create_customer(self, first_name: str, last_name: str, email: str = "",
                        phone: str = "", address: str = "") -> Optional[Customer]:
@@ -36,8 +73,10 @@ class CustomerService:
             )
             
             # Save to database
-            self.db.save_customer(customer.to_dict())
+            with self._version.writing():
+                self.db.save_customer(customer.to_dict())
             self.customers[customer.customer_id] = customer
+            self._index_customer(customer)
             
             return customer
         except Exception as e:
@@ -71,9 +110,10 @@ class CustomerService:
                     setattr(customer, key, value)
             
             customer.last_updated = datetime.now()
+            self._index_customer(customer)
             
             # Update in database
-            self.db.update_customer(customer.to_dict())
+            self._update_customer(customer)
             
             return True
         except Exception as e:
@@ -90,7 +130,7 @@ class CustomerService:
         customer.last_updated = datetime.now()
         
         # Update in database
-        self.db.update_customer(customer.to_dict())
+        self._update_customer(customer)
         
         return True
     
@@ -103,7 +143,7 @@ class CustomerService:
         customer.update_kyc_status(verified)
         
         # Update in database
-        self.db.update_customer(customer.to_dict())
+        self._update_customer(customer)
         
         return True
     
@@ -115,7 +155,7 @@ class CustomerService:
         
         if customer.update_risk_level(risk_level):
             # Update in database
-            self.db.update_customer(customer.to_dict())
+            self._update_customer(customer)
             return True
         
         return False
@@ -128,7 +168,7 @@ class CustomerService:
         
         if customer.add_account(account_number):
             # Update in database
-            self.db.update_customer(customer.to_dict())
+            self._update_customer(customer)
             return True
         
         return False
@@ -141,24 +181,21 @@ class CustomerService:
         
         if customer.remove_account(account_number):
             # Update in database
-            self.db.update_customer(customer.to_dict())
+            self._update_customer(customer)
             return True
         
         return False
     
     def search_customers(self, search_term: str) -> List[Customer]:
-        """Search customers by name or email"""
-        results = []
-        search_term = search_term.lower()
-        
-        for customer in self.customers.values():
-            if (search_term in customer.first_name.lower() or
-                search_term in customer.last_name.lower() or
-                search_term in customer.full_name.lower() or
-                search_term in customer.email.lower()):
-                results.append(customer)
+        """Search customers by name or email, best matches first
         
-        return results
+        Matches any customer with a name or email containing the search
+        term, ignoring case. Customers matching it whole come first, then
+        those it starts, then those with a word it starts.
+        """
+        customers = self.customers
+        return [customers[customer_id] for customer_id in self._search_index.search(search_term)
+                if customer_id in customers]
     
     def get_active_customers(self) -> List[Customer]:
         """Get all active customers"""
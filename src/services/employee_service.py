@@ -7,6 +7,8 @@ from datetime import datetime
 from ..models.employee import Employee, Department, Role
 from ..utils.security import SecurityManager
 from ..models.audit_log import AuditLog, AuditAction
+from ..utils.snapshot import TrackedVersion
+from ..utils.text_index import TrigramIndex
 
 class EmployeeService:
     """Service class for employee (user/admin) operations"""
@@ -14,6 +16,7 @@ class EmployeeService:
         self.db = database_manager
         self.security = SecurityManager()
         self.employees: Dict[str, Employee] = {}
+        self._version = TrackedVersion(self.db, 'employees')
         self._load_employees()
         self.audit_service = None  # Will be set by CLI
 
@@ -28,12 +31,38 @@ class EmployeeService:
             self.audit_service.log_action(employee_id, action, target_type, target_id, details, success)
 
     def _load_employees(self):
+        self._version.track()
+        employees: Dict[str, Employee] = {}
+        self._search_index = TrigramIndex()
         employees_data = self.db.get_all_employees()
         for emp_data in employees_data:
             emp = Employee.from_dict(emp_data)
-            self.employees[emp.employee_id] = emp
+            employees[emp.employee_id] = emp
+            self._index_employee(emp)
+        self.employees = employees
+
+    def _index_employee(self, emp: Employee):
+        """(Re)index the fields an employee is searched by"""
+        self._search_index.add(emp.employee_id, emp.first_name, emp.last_name,
+                               emp.full_name(), emp.username, emp.email)
+
+    def _refresh_if_changed(self):
+        """Reload employees if the collection changed, e.g. in another worker process
+
+        The service's own writes move the tracked version forward, so they
+        do not trigger a reload.
+        """
+        version = self._version.current()
+        if version is not None and version != self._version.version:
+            self._load_employees()
+
+    def _update_employee(self, emp: Employee):
+        """Write an updated employee to the database"""
+        with self._version.writing():
+            self.db.update_employee(emp.to_dict())
 
     def create_employee(self, username: str, password: str, first_name: str, last_name: str, email: str, department: Department, role: Role = Role.STAFF) -> Optional[Employee]:
+        self._refresh_if_changed()
         if any(emp.username == username for emp in self.employees.values()):
             print("Username already exists.")
             self._log_action("system", AuditAction.CREATE_EMPLOYEE, "employee", "", f"Failed to create employee {username}", False)
@@ -48,28 +77,34 @@ class EmployeeService:
             department=department,
             role=role
         )
-        self.db.save_employee(emp.to_dict())
+        with self._version.writing():
+            self.db.save_employee(emp.to_dict())
         self.employees[emp.employee_id] = emp
+        self._index_employee(emp)
         self._log_action("system", AuditAction.CREATE_EMPLOYEE, "employee", emp.employee_id, f"Created employee {username}")
         return emp
 
     def authenticate(self, username: str, password: str) -> Optional[Employee]:
+        self._refresh_if_changed()
         for emp in self.employees.values():
             if emp.username == username and self.security.verify_password(password, emp.password_hash.encode('utf-8')):
                 emp.last_login = datetime.now()
-                self.db.update_employee(emp.to_dict())
+                self._update_employee(emp)
                 self._log_action(emp.employee_id, AuditAction.LOGIN, "employee", emp.employee_id, f"Login successful for {username}")
                 return emp
         self._log_action("system", AuditAction.LOGIN, "employee", "", f"Failed login attempt for {username}", False)
         return None
 
     def get_employee(self, employee_id: str) -> Optional[Employee]:
+        self._refresh_if_changed()
         return self.employees.get(employee_id)
 
     def get_all_employees(self) -> List[Employee]:
+        self._refresh_if_changed()
         return list(self.employees.values())
 
     def get_department_employees(self, department: Department) -> List[Employee]:
+        self._refresh_if_changed()
         return [emp for emp in self.employees.values() if emp.department == department]
 
     def update_employee(self, employee_id: str, **kwargs) -> bool:
@@ -79,7 +114,8 @@ class EmployeeService:
         for key, value in kwargs.items():
             if hasattr(emp, key):
                 setattr(emp, key, value)
-        self.db.update_employee(emp.to_dict())
+        self._index_employee(emp)
+        self._update_employee(emp)
         return True
 
     def deactivate_employee(self, employee_id: str) -> bool:
@@ -87,7 +123,7 @@ class EmployeeService:
         if not emp:
             return False
         emp.is_active = False
-        self.db.update_employee(emp.to_dict())
+        self._update_employee(emp)
         self._log_action("system", AuditAction.DEACTIVATE_EMPLOYEE, "employee", employee_id, f"Deactivated employee {emp.username}")
         return True
 
@@ -98,8 +134,10 @@ class EmployeeService:
         username = emp.username
         if employee_id in self.employees:
             del self.employees[employee_id]
+        self._search_index.remove(employee_id)
         self._log_action("system", AuditAction.DELETE_EMPLOYEE, "employee", employee_id, f"Deleted employee {username}")
-        return self.db.delete_employee(employee_id)
+        with self._version.writing():
+            return self.db.delete_employee(employee_id)
 
     def change_password(self, employee_id: str, old_password: str, new_password: str) -> bool:
         emp = self.get_employee(employee_id)
@@ -109,7 +147,7 @@ class EmployeeService:
             self._log_action(employee_id, AuditAction.CHANGE_PASSWORD, "employee", employee_id, "Password change failed - wrong old password", False)
             return False
         emp.password_hash = self.security.hash_password(new_password).decode('utf-8')
-        self.db.update_employee(emp.to_dict())
+        self._update_employee(emp)
         self._log_action(employee_id, AuditAction.CHANGE_PASSWORD, "employee", employee_id, "Password changed successfully")
         return True
 
@@ -118,7 +156,7 @@ class EmployeeService:
         if not emp:
             return False
         emp.password_hash = self.security.hash_password(new_password).decode('utf-8')
-        self.db.update_employee(emp.to_dict())
+        self._update_employee(emp)
         self._log_action("system", AuditAction.RESET_PASSWORD, "employee", employee_id, f"Password reset for {emp.username}")
         return True
 
@@ -132,30 +170,24 @@ class EmployeeService:
             emp.role = new_role
         if new_department:
             emp.department = new_department
-        self.db.update_employee(emp.to_dict())
+        self._update_employee(emp)
         self._log_action("system", AuditAction.UPDATE_EMPLOYEE, "employee", employee_id, 
                         f"Updated role from {old_role.value} to {emp.role.value}, dept from {old_dept.value} to {emp.department.value}")
         return True 
 
     def search_employees(self, search_term: str) -> List[Employee]:
-        """Search employees by name, username, or email"""
-        results = []
-        search_term = search_term.lower()
-        
-        for emp in self.employees.values():
-            if (search_term in emp.first_name.lower() or
-                search_term in emp.last_name.lower() or
-                search_term in emp.full_name().lower() or
-                search_term in emp.username.lower() or
-                search_term in emp.email.lower()):
-                results.append(emp)
-        
-        return results
+        """Search employees by name, username, or email, best matches first"""
+        self._refresh_if_changed()
+        employees = self.employees
+        return [employees[employee_id] for employee_id in self._search_index.search(search_term)
+                if employee_id in employees]
 
     def get_employees_by_department(self, department: Department) -> List[Employee]:
         """Get all employees in a specific department"""
+        self._refresh_if_changed()
         return [emp for emp in self.employees.values() if emp.department == department]
 
     def get_employees_by_role(self, role: Role) -> List[Employee]:
         """Get all employees with a specific role"""
+        self._refresh_if_changed()
         return [emp for emp in self.employees.values() if emp.role == role] 
\ No newline at end of file
@@ -2,26 +2,173 @@
 Transaction service for Tobey Finance Bank
 """
 
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Iterable, Any
 from datetime import datetime, timedelta
 
+from ..models.money import Money, MoneyColumn, to_cents
 from ..models.transaction import Transaction, TransactionType, TransactionStatus
+from ..utils.text_index import InvertedIndex
+from ..utils.time_index import TimeIndex
+from ..utils.snapshot import TrackedVersion, load_service_snapshot, save_service_snapshot
+
+
+class TransactionCounters:
+    """Transaction counts and amount totals (in cents) by status and by type
+    
+    Keyed by the enum values rather than the members, since hashing a
+    member runs ``Enum.__hash__`` in Python on every update.
+    """
+    
+    def __init__(self):
+        self.status_counts = dict.fromkeys((status.value for status in TransactionStatus), 0)
+        self.status_cents = dict.fromkeys((status.value for status in TransactionStatus), 0)
+        self.type_counts = dict.fromkeys((kind.value for kind in TransactionType), 0)
+        self.type_cents = dict.fromkeys((kind.value for kind in TransactionType), 0)
+    
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]]) -> 'TransactionCounters':
+        """Count raw transaction records, with the model's defaults for missing fields"""
+        counters = cls()
+        for record in records:
+            counters.add(TransactionStatus(record.get('status', TransactionStatus.PENDING.value)),
+                         TransactionType(record.get('transaction_type', TransactionType.DEPOSIT.value)),
+                         to_cents(record.get('amount', 0)))
+        return counters
+    
+    def add(self, status: TransactionStatus, transaction_type: TransactionType, cents: int):
+        """Count a new transaction"""
+        status = status._value_
+        transaction_type = transaction_type._value_
+        self.status_counts[status] += 1
+        self.status_cents[status] += cents
+        self.type_counts[transaction_type] += 1
+        self.type_cents[transaction_type] += cents
+    
+    def move(self, old_status: TransactionStatus, new_status: TransactionStatus, cents: int):
+        """Count a transaction under its new status"""
+        self.status_counts[old_status._value_] -= 1
+        self.status_cents[old_status._value_] -= cents
+        self.status_counts[new_status._value_] += 1
+        self.status_cents[new_status._value_] += cents
+    
+    def total(self) -> int:
+        """Number of transactions counted"""
+        return sum(self.status_counts.values())
+    
+    def differences(self, expected: 'TransactionCounters') -> List[str]:
+        """Descriptions of the counters that disagree with the expected ones"""
+        differences = []
+        for name in ('status_counts', 'status_cents', 'type_counts', 'type_cents'):
+            ours, theirs = getattr(self, name), getattr(expected, name)
+            for key in ours:
+                if ours[key] != theirs[key]:
+                    differences.append(f"{name}[{key}] is {ours[key]}, expected {theirs[key]}")
+        return differences
 
 
 class TransactionService:
-    """Service class for transaction operations"""
+    """Service class for transaction operations
+    
+    Besides the transactions themselves, the service keeps each
+    transaction's amount in a column of packed integer cents, for exact
+    totals over any set of rows, and counters by status and by type that
+    are updated as transactions are created, processed or cancelled.
+    Statuses must be changed through ``process_transaction`` and
+    ``cancel_transaction`` for the counters to follow;
+    ``rebuild_statistics`` recounts them. Descriptions and reference
+    numbers are indexed word by word for ``search_transactions``. The
+    index and the counters are snapshotted with the transactions and
+    restored as they were saved, so the counters can be checked against
+    the stored transactions (see ``verify_statistics``).
+    """
     
     def __init__(self, database_manager):
         self.db = database_manager
         self.transactions: Dict[str, Transaction] = {}
+        self._timeline = TimeIndex()
+        # Each account's transactions in time order
+        self._account_timelines: Dict[str, TimeIndex] = {}
+        # Keyed by type value, like the counters
+        self._by_type: Dict[str, List[Transaction]] = {
+            transaction_type.value: [] for transaction_type in TransactionType}
+        self._rows: Dict[str, int] = {}
+        self._row_transactions: List[Transaction] = []
+        self._amounts = MoneyColumn()
+        self._search_index = InvertedIndex()
+        self._counters = TransactionCounters()
+        self._version = TrackedVersion(self.db, 'transactions')
         self._load_transactions()
     
     def _load_transactions(self):
-        """Load transactions from database"""
+        """Load transactions from a snapshot, falling back to the database"""
+        self._version.track()
+        transactions = load_service_snapshot(self.db, 'transactions', self._version)
+        if transactions is not None:
+            search_index = load_service_snapshot(self.db, 'transactions_search', self._version)
+            if search_index is not None and len(search_index) == len(transactions):
+                self._search_index = search_index
+            else:
+                search_index = None
+            counters = load_service_snapshot(self.db, 'transactions_statistics', self._version)
+            if counters is not None and counters.total() == len(transactions):
+                self._counters = counters
+            else:
+                counters = None
+            for transaction in transactions.values():
+                self._add_transaction(transaction, index_text=search_index is None,
+                                      count=counters is None)
+            return
+        
         transactions_data = self.db.get_all_transactions()
         for transaction_data in transactions_data:
             transaction = Transaction.from_dict(transaction_data)
-            self.transactions[transaction.transaction_id] = transaction
+            self._add_transaction(transaction)
+        self.save_snapshot()
+    
+    def save_snapshot(self):
+        """Snapshot the transactions, their search index and counters for fast startup
+        
+        Called after a cold load and on shutdown; nothing is saved if
+        another writer, such as ``AccountService`` posting a deposit, has
+        changed the transactions since they were loaded, or if a status
+        was changed only in memory.
+        """
+        save_service_snapshot(self.db, 'transactions', self.transactions, self._version)
+        save_service_snapshot(self.db, 'transactions_search', self._search_index, self._version)
+        save_service_snapshot(self.db, 'transactions_statistics', self._counters, self._version)
+    
+    def _all_transactions(self) -> List[Transaction]:
+        """Copy of the loaded transactions for reports to iterate
+        
+        ``list`` copies the dict's values in one step, so requests adding
+        transactions meanwhile cannot break the iteration.
+        """
+        return list(self.transactions.values())
+    
+    def _add_transaction(self, transaction: Transaction, index_text: bool = True,
+                         count: bool = True):
+        """Register a new transaction in memory, in the indexes and in the counters
+        
+        ``index_text=False`` skips the search index and ``count=False`` the
+        counters, when they were restored from a snapshot that already
+        covers the transaction.
+        """
+        self.transactions[transaction.transaction_id] = transaction
+        self._timeline.add(transaction.timestamp, transaction)
+        account_timeline = self._account_timelines.get(transaction.account_number)
+        if account_timeline is None:
+            account_timeline = self._account_timelines[transaction.account_number] = TimeIndex()
+        account_timeline.add(transaction.timestamp, transaction)
+        self._by_type[transaction.transaction_type._value_].append(transaction)
+        cents = transaction.amount.cents
+        row = len(self._row_transactions)
+        self._rows[transaction.transaction_id] = row
+        self._row_transactions.append(transaction)
+        self._amounts.cents.append(cents)
+        if index_text:
+            self._search_index.add(row, transaction.description, transaction.reference_number)
+        if count:
+            self._counters.add(transaction.status, transaction.transaction_type, cents)
     
     def create_transaction(self, account_number: str, transaction_type: TransactionType,
                           amount: float, description: str = "", 
@@ -37,59 +184,74 @@ class TransactionService:
             )
             
             # Save to database
-            self.db.save_transaction(transaction.to_dict())
-            self.transactions[transaction.transaction_id] = transaction
+            with self._version.writing():
+                self.db.save_transaction(transaction.to_dict())
+            self._add_transaction(transaction)
             
             return transaction
         except Exception as e:
             print(f"Error creating transaction: {e}")
             return None
     
+    def create_transactions(self, transaction_specs: Iterable[Dict[str, Any]]) -> List[Optional[Transaction]]:
+        """Create many transactions and persist them with a single write
+        
+        Each spec holds the keyword arguments of ``create_transaction``;
+        invalid specs yield None in the result.
+        """
+        results: List[Optional[Transaction]] = []
+        for spec in transaction_specs:
+            try:
+                results.append(Transaction(
+                    account_number=spec['account_number'],
+                    transaction_type=spec['transaction_type'],
+                    amount=spec['amount'],
+                    description=spec.get('description', ""),
+                    target_account=spec.get('target_account')
+                ))
+            except Exception as e:
+                print(f"Error creating transaction: {e}")
+                results.append(None)
+        
+        transactions = [transaction for transaction in results if transaction is not None]
+        with self._version.writing():
+            self.db.save_transactions(transaction.to_dict() for transaction in transactions)
+        for transaction in transactions:
+            self._add_transaction(transaction)
+        
+        return results
+    
     def get_transaction(self, transaction_id: str) -> Optional[Transaction]:
         """Get transaction by ID"""
         return self.transactions.get(transaction_id)
     
     def get_account_transactions(self, account_number: str, 
                                start_date: Optional[datetime] = None,
-                               end_date: Optional[datetime] = None) -> List[Transaction]:
-        """Get all transactions for an account"""
-        transactions = []
-        
-        for transaction in self.transactions.values():
-            if transaction.account_number == account_number:
-                # Filter by date if provided
-                if start_date and transaction.timestamp < start_date:
-                    continue
-                if end_date and transaction.timestamp > end_date:
-                    continue
-                transactions.append(transaction)
-        
-        # Sort by timestamp (newest first)
-        transactions.sort(key=lambda x: x.timestamp, reverse=True)
-        return transactions
+                               end_date: Optional[datetime] = None,
+                               limit: Optional[int] = None) -> List[Transaction]:
+        """Get the transactions of an account, newest first
+        
+        Served from the account's own time index, so the cost depends only
+        on the account's history; ``limit`` keeps just the latest ones.
+        """
+        account_timeline = self._account_timelines.get(account_number)
+        if account_timeline is None:
+            return []
+        return account_timeline.newest(start_date, end_date, limit)
     
     def get_transactions_by_type(self, transaction_type: TransactionType) -> List[Transaction]:
         """Get all transactions of a specific type"""
-        return [transaction for transaction in self.transactions.values()
-                if transaction.transaction_type == transaction_type]
+        return list(self._by_type[transaction_type.value])
     
     def get_transactions_by_status(self, status: TransactionStatus) -> List[Transaction]:
         """Get all transactions with a specific status"""
-        return [transaction for transaction in self.transactions.values()
+        return [transaction for transaction in self._all_transactions()
                 if transaction.status == status]
     
     def get_transactions_by_date_range(self, start_date: datetime, 
                                      end_date: datetime) -> List[Transaction]:
         """Get all transactions within a date range"""
-        transactions = []
-        
-        for transaction in self.transactions.values():
-            if start_date <= transaction.timestamp <= end_date:
-                transactions.append(transaction)
-        
-        # Sort by timestamp (newest first)
-        transactions.sort(key=lambda x: x.timestamp, reverse=True)
-        return transactions
+        return self._timeline.newest(start_date, end_date)
     
     def get_recent_transactions(self, days: int = 30) -> List[Transaction]:
         """Get recent transactions from the last N days"""
@@ -103,7 +265,13 @@ class TransactionService:
         if not transaction:
             return False
         
-        return transaction.process()
+        old_status = transaction.status
+        if not transaction.process():
+            return False
+        self._counters.move(old_status, transaction.status, transaction.amount.cents)
+        # The new status is not written to the database
+        self._version.invalidate()
+        return True
     
     def cancel_transaction(self, transaction_id: str) -> bool:
         """Cancel a pending transaction"""
@@ -111,7 +279,13 @@ class TransactionService:
         if not transaction:
             return False
         
-        return transaction.cancel()
+        old_status = transaction.status
+        if not transaction.cancel():
+            return False
+        self._counters.move(old_status, transaction.status, transaction.amount.cents)
+        # The new status is not written to the database
+        self._version.invalidate()
+        return True
     
     def get_transaction_summary(self, account_number: str, 
                                start_date: Optional[datetime] = None,
@@ -121,24 +295,19 @@ class TransactionService:
         
         summary = {
             'total_transactions': len(transactions),
-            'total_deposits': 0.0,
-            'total_withdrawals': 0.0,
-            'total_transfers': 0.0,
-            'total_fees': 0.0,
+            'total_deposits': Money(0),
+            'total_withdrawals': Money(0),
+            'total_transfers': Money(0),
+            'total_fees': Money(0),
             'completed_transactions': 0,
             'failed_transactions': 0,
             'pending_transactions': 0
         }
         
+        # Rows of each type, totalled over the amount column below
+        rows: Dict[TransactionType, List[int]] = {transaction_type: [] for transaction_type in TransactionType}
         for transaction in transactions:
-            if transaction.transaction_type == TransactionType.DEPOSIT:
-                summary['total_deposits'] += transaction.amount
-            elif transaction.transaction_type == TransactionType.WITHDRAWAL:
-                summary['total_withdrawals'] += transaction.amount
-            elif transaction.transaction_type == TransactionType.TRANSFER:
-                summary['total_transfers'] += transaction.amount
-            elif transaction.transaction_type == TransactionType.FEE:
-                summary['total_fees'] += transaction.amount
+            rows[transaction.transaction_type].append(self._rows[transaction.transaction_id])
             
             if transaction.status == TransactionStatus.COMPLETED:
                 summary['completed_transactions'] += 1
@@ -147,29 +316,32 @@ class TransactionService:
             elif transaction.status == TransactionStatus.PENDING:
                 summary['pending_transactions'] += 1
         
+        summary['total_deposits'] = self._amounts.total(rows[TransactionType.DEPOSIT])
+        summary['total_withdrawals'] = self._amounts.total(rows[TransactionType.WITHDRAWAL])
+        summary['total_transfers'] = self._amounts.total(rows[TransactionType.TRANSFER])
+        summary['total_fees'] = self._amounts.total(rows[TransactionType.FEE])
         return summary
     
     def search_transactions(self, search_term: str) -> List[Transaction]:
-        """Search transactions by description or reference number"""
-        results = []
-        search_term = search_term.lower()
-        
-        for transaction in self.transactions.values():
-            if (search_term in transaction.description.lower() or
-                (transaction.reference_number and search_term in transaction.reference_number.lower())):
-                results.append(transaction)
+        """Search transactions by description or reference number
         
-        return results
+        Every word of the search term must start a word of the description
+        or reference number, case-insensitively; a term without words
+        matches every transaction.
+        """
+        rows = self._search_index.search(search_term)
+        if rows is None:
+            return self._all_transactions()
+        row_transactions = self._row_transactions
+        return [row_transactions[row] for row in rows]
     
     def get_transaction_statistics(self) -> dict:
         """Get overall transaction statistics"""
-        total_transactions = len(self.transactions)
-        completed_transactions = len(self.get_transactions_by_status(TransactionStatus.COMPLETED))
-        failed_transactions = len(self.get_transactions_by_status(TransactionStatus.FAILED))
-        pending_transactions = len(self.get_transactions_by_status(TransactionStatus.PENDING))
-        
-        total_amount = sum(t.amount for t in self.transactions.values() 
-                          if t.status == TransactionStatus.COMPLETED)
+        counters = self._counters
+        total_transactions = counters.total()
+        completed_transactions = counters.status_counts[TransactionStatus.COMPLETED.value]
+        failed_transactions = counters.status_counts[TransactionStatus.FAILED.value]
+        pending_transactions = counters.status_counts[TransactionStatus.PENDING.value]
         
         return {
             'total_transactions': total_transactions,
@@ -177,5 +349,28 @@ class TransactionService:
             'failed_transactions': failed_transactions,
             'pending_transactions': pending_transactions,
             'success_rate': (completed_transactions / total_transactions * 100) if total_transactions > 0 else 0,
-            'total_amount_processed': total_amount
-        } 
\ No newline at end of file
+            'total_amount_processed': Money.from_cents(counters.status_cents[TransactionStatus.COMPLETED.value]),
+            'by_status': {status: {'count': count, 'total_amount': Money.from_cents(counters.status_cents[status])}
+                          for status, count in counters.status_counts.items()},
+            'by_type': {transaction_type: {'count': count,
+                                           'total_amount': Money.from_cents(counters.type_cents[transaction_type])}
+                        for transaction_type, count in counters.type_counts.items()}
+        }
+    
+    def rebuild_statistics(self, records: Optional[Iterable[Dict[str, Any]]] = None) -> List[str]:
+        """Recount the statistics counters and return how the old ones differed
+        
+        Counts the loaded transactions, or the raw transaction records
+        given (such as ``db.iter_transactions()``), and replaces the
+        counters with the result. An empty list means they were correct.
+        """
+        if records is None:
+            counters = TransactionCounters()
+            for transaction in self._all_transactions():
+                counters.add(transaction.status, transaction.transaction_type, transaction.amount.cents)
+        else:
+            counters = TransactionCounters.from_records(records)
+        differences = self._counters.differences(counters)
+        self._counters = counters
+        return differences
+
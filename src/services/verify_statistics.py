@@ -0,0 +1,48 @@
+"""
+Transaction statistics verification for Tobey Finance Bank
+
+Recounts the stored transaction records and compares the result with the
+counters ``TransactionService`` restored from its snapshot, that is, the
+counters as they were maintained incrementally and saved. Counters that
+disagree are replaced by the recount and the snapshot is saved again.
+
+Usage::
+
+    python -m src.services.verify_statistics data --backend json
+"""
+
+import argparse
+import sys
+from typing import List, Optional
+
+from ..utils.backends import available_backends, create_database_manager
+from .transaction_service import TransactionService
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point; exits with 1 if any counter had to be rebuilt"""
+    parser = argparse.ArgumentParser(description="Rebuild the transaction statistics counters "
+                                                 "and verify them against the stored transactions")
+    parser.add_argument("data_dir", nargs="?", default=None)
+    parser.add_argument("--backend", default=None, choices=available_backends())
+    args = parser.parse_args(argv)
+
+    db = create_database_manager(args.backend, args.data_dir)
+    try:
+        service = TransactionService(db)
+        differences = service.rebuild_statistics(db.iter_transactions())
+        if differences:
+            service.save_snapshot()
+    finally:
+        db.close()
+    for difference in differences:
+        print(difference)
+    statistics = service.get_transaction_statistics()
+    outcome = f"{len(differences)} counters rebuilt" if differences else "counters verified"
+    print(f"{statistics['total_transactions']} transactions, "
+          f"{statistics['total_amount_processed']:,.2f} processed: {outcome}")
+    return 1 if differences else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,12 +8,13 @@ from src.services.transaction_service import TransactionService
 from src.services.employee_service import EmployeeService
 from src.services.audit_service import AuditService
 from src.models.audit_log import AuditAction
-from src.utils.database import DatabaseManager
+from src.utils.backends import create_database_manager
+from src.utils.storage import StorageBackend
 from src.models.employee import Department, Role
 
 class BankingCLI:
-    def __init__(self):
-        self.db = DatabaseManager()
+    def __init__(self, database_manager: StorageBackend = None):
+        self.db = database_manager or create_database_manager()
         self.account_service = AccountService(self.db)
         self.customer_service = CustomerService(self.db)
         self.transaction_service = TransactionService(self.db)
@@ -49,6 +50,13 @@ class BankingCLI:
                     role=Role.ADMIN
                 )
 
+    def close(self):
+        """Snapshot service state on shutdown so the next start skips a full load"""
+        self.account_service.save_snapshot()
+        self.account_service.close()
+        self.customer_service.save_snapshot()
+        self.transaction_service.save_snapshot()
+
     def login(self):
         print("\n==== Employee Login ====")
         for _ in range(3):
@@ -2,7 +2,12 @@
 Utility modules for Tobey Finance Bank
 """
 
+from .storage import StorageBackend
 from .database import DatabaseManager
+from .sqlite_database import SQLiteDatabaseManager
+from .memory_database import InMemoryDatabaseManager
+from .backends import available_backends, create_database_manager, register_backend
 from .security import SecurityManager
 
-__all__ = ['DatabaseManager', 'SecurityManager'] 
\ No newline at end of file
+__all__ = ['StorageBackend', 'DatabaseManager', 'SQLiteDatabaseManager', 'InMemoryDatabaseManager',
+           'available_backends', 'create_database_manager', 'register_backend', 'SecurityManager'] 
@@ -0,0 +1,54 @@
+"""
+Storage backend registry for Tobey Finance Bank
+"""
+
+import os
+from typing import Callable, Dict, List, Optional
+
+from .database import DatabaseManager
+from .memory_database import InMemoryDatabaseManager
+from .sqlite_database import SQLiteDatabaseManager
+from .storage import StorageBackend
+
+BACKEND_ENV_VAR = "TFB_STORAGE_BACKEND"
+DATA_DIR_ENV_VAR = "TFB_DATA_DIR"
+DEFAULT_BACKEND = "json"
+
+_BACKENDS: Dict[str, Callable[..., StorageBackend]] = {}
+
+
+def register_backend(name: str, factory: Callable[..., StorageBackend]):
+    """Register a storage backend factory under a name
+
+    The factory is called with ``data_dir`` and any extra options passed to
+    ``create_database_manager``.
+    """
+    _BACKENDS[name] = factory
+
+
+def available_backends() -> List[str]:
+    """Names of all registered storage backends"""
+    return sorted(_BACKENDS)
+
+
+def create_database_manager(backend: Optional[str] = None, data_dir: Optional[str] = None,
+                            **options) -> StorageBackend:
+    """Create the configured database manager
+
+    The backend and data directory default to the ``TFB_STORAGE_BACKEND``
+    and ``TFB_DATA_DIR`` environment variables, then to the JSON backend in
+    ``data``.
+    """
+    backend = backend or os.environ.get(BACKEND_ENV_VAR) or DEFAULT_BACKEND
+    data_dir = data_dir or os.environ.get(DATA_DIR_ENV_VAR) or "data"
+    factory = _BACKENDS.get(backend)
+    if factory is None:
+        raise ValueError(f"Unknown storage backend '{backend}'. "
+                         f"Available backends: {', '.join(available_backends())}")
+    return factory(data_dir=data_dir, **options)
+
+
+register_backend("json", DatabaseManager)
+register_backend("jsonl", lambda data_dir, **options: DatabaseManager(data_dir, log_format="jsonl", **options))
+register_backend("sqlite", SQLiteDatabaseManager)
+register_backend("memory", lambda data_dir, **options: InMemoryDatabaseManager(**options))
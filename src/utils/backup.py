@@ -0,0 +1,140 @@
+"""
+Incremental compressed backups for Tobey Finance Bank
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from datetime import datetime
+from typing import Any, BinaryIO, Dict, List, Optional
+
+
+class BackupWriter:
+    """Builds one backup set inside a backup directory
+
+    Each backup set is a directory named after its creation time holding
+    gzip-compressed copies of the database files and a ``manifest.json``
+    with the size, source signature and SHA-256 of every file. Files whose
+    signature matches the previous backup set are hard-linked from it rather
+    than copied. The set is assembled in a hidden staging directory and only
+    renamed into place once its manifest is durable, so an interrupted
+    backup never looks complete.
+    """
+
+    MANIFEST_NAME = "manifest.json"
+    CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, backup_dir: str, name: Optional[str] = None):
+        self.backup_dir = backup_dir
+        self.name = name or datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        self.path = os.path.join(backup_dir, self.name)
+        os.makedirs(backup_dir, exist_ok=True)
+        self._previous_path = latest_backup(backup_dir)
+        self._previous = read_manifest(self._previous_path)['files'] if self._previous_path else {}
+        self._staging = tempfile.mkdtemp(dir=backup_dir, prefix=f".{self.name}.")
+        self.files: Dict[str, Dict[str, Any]] = {}
+
+    def _target(self, relative_path: str) -> str:
+        """Staging path of the compressed copy of a file"""
+        target = os.path.join(self._staging, relative_path + ".gz")
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        return target
+
+    def link_unchanged(self, relative_path: str, signature: Any) -> bool:
+        """Hard-link a file from the previous backup if its signature is unchanged"""
+        # Round-trip through JSON so tuples compare equal to the stored lists
+        signature = json.loads(json.dumps(signature))
+        previous = self._previous.get(relative_path)
+        if previous is None or previous['signature'] != signature:
+            return False
+        try:
+            os.link(os.path.join(self._previous_path, previous['file']), self._target(relative_path))
+        except OSError:
+            return False
+        self.files[relative_path] = dict(previous)
+        return True
+
+    def add(self, relative_path: str, source: BinaryIO, size: int, signature: Any):
+        """Stream the first ``size`` bytes of source into a compressed copy"""
+        digest = hashlib.sha256()
+        remaining = size
+        with open(self._target(relative_path), 'wb') as raw:
+            with gzip.GzipFile(fileobj=raw, mode='wb') as dst:
+                while remaining > 0:
+                    chunk = source.read(min(self.CHUNK_SIZE, remaining))
+                    if not chunk:
+                        raise IOError(f"{relative_path} was truncated during backup")
+                    digest.update(chunk)
+                    dst.write(chunk)
+                    remaining -= len(chunk)
+            raw.flush()
+            os.fsync(raw.fileno())
+        self.files[relative_path] = {
+            'file': relative_path + ".gz",
+            'size': size,
+            'sha256': digest.hexdigest(),
+            'signature': json.loads(json.dumps(signature)),
+        }
+
+    def commit(self) -> str:
+        """Write the manifest and publish the backup set"""
+        manifest = {
+            'created': datetime.now().isoformat(),
+            'base': os.path.basename(self._previous_path) if self._previous_path else None,
+            'files': self.files,
+        }
+        with open(os.path.join(self._staging, self.MANIFEST_NAME), 'w') as f:
+            json.dump(manifest, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.rename(self._staging, self.path)
+        return self.path
+
+    def abort(self):
+        """Discard a partially written backup set"""
+        shutil.rmtree(self._staging, ignore_errors=True)
+
+
+def latest_backup(backup_dir: str) -> Optional[str]:
+    """Most recent complete backup set in a backup directory"""
+    try:
+        names = sorted(os.listdir(backup_dir), reverse=True)
+    except FileNotFoundError:
+        return None
+    for name in names:
+        path = os.path.join(backup_dir, name)
+        if not name.startswith('.') and os.path.exists(os.path.join(path, BackupWriter.MANIFEST_NAME)):
+            return path
+    return None
+
+
+def read_manifest(backup_path: str) -> Dict[str, Any]:
+    """Load the manifest of a backup set"""
+    with open(os.path.join(backup_path, BackupWriter.MANIFEST_NAME), 'r') as f:
+        return json.load(f)
+
+
+def verify_backup(backup_path: str) -> List[str]:
+    """Check every file of a backup set against its manifest
+
+    Returns the relative paths of missing or corrupt files; an empty list
+    means the backup is intact.
+    """
+    failures = []
+    for relative_path, entry in read_manifest(backup_path)['files'].items():
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            with gzip.open(os.path.join(backup_path, entry['file']), 'rb') as f:
+                for chunk in iter(lambda: f.read(BackupWriter.CHUNK_SIZE), b''):
+                    digest.update(chunk)
+                    size += len(chunk)
+        except (OSError, EOFError):
+            failures.append(relative_path)
+            continue
+        if size != entry['size'] or digest.hexdigest() != entry['sha256']:
+            failures.append(relative_path)
+    return failures
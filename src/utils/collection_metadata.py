@@ -0,0 +1,109 @@
+"""
+Collection metadata sidecars for Tobey Finance Bank
+"""
+
+import json
+import os
+import tempfile
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+from .time_index import parse_timestamp
+
+
+def summarize_records(records: Iterable[Dict[str, Any]], timestamp_field: str) -> Dict[str, Any]:
+    """Record count and timestamp range of some records"""
+    count = 0
+    earliest = latest = None
+    earliest_value = latest_value = None
+    for record in records:
+        count += 1
+        value = record.get(timestamp_field)
+        timestamp = parse_timestamp(value)
+        if timestamp == datetime.min:
+            continue
+        if earliest is None or timestamp < earliest:
+            earliest, earliest_value = timestamp, value
+        if latest is None or timestamp > latest:
+            latest, latest_value = timestamp, value
+    return {'count': count, 'min_timestamp': earliest_value, 'max_timestamp': latest_value}
+
+
+def combine_summaries(summaries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Merge summaries of disjoint record sets (e.g. partitions)"""
+    combined: Dict[str, Any] = {'count': 0, 'bytes': 0, 'min_timestamp': None,
+                                'max_timestamp': None, 'last_write': None}
+    for summary in summaries:
+        combined['count'] += summary['count']
+        combined['bytes'] += summary.get('bytes', 0)
+        for field, pick in (('min_timestamp', min), ('max_timestamp', max)):
+            values = [value for value in (combined[field], summary[field]) if value is not None]
+            if values:
+                combined[field] = pick(values, key=parse_timestamp)
+        if summary.get('last_write') is not None:
+            combined['last_write'] = max(filter(None, (combined['last_write'], summary['last_write'])))
+    return combined
+
+
+class MetadataSidecar:
+    """Small metadata file kept next to a data file
+
+    Holds the record count, byte size, timestamp range and last write time
+    of the data file together with the file signature it describes. A
+    sidecar whose signature no longer matches (the data file was edited
+    externally, or a crash hit between the two writes) is treated as
+    missing, so callers rebuild it from the data instead of trusting it.
+    Sidecars are derived data and are not fsynced.
+    """
+
+    def __init__(self, data_file: str):
+        directory, name = os.path.split(data_file)
+        self.directory = directory or "."
+        self.path = os.path.join(self.directory, f".{name}.meta")
+
+    def load(self, signature: Optional[tuple]) -> Optional[Dict[str, Any]]:
+        """Metadata for the given data file signature, if the sidecar is current"""
+        try:
+            with open(self.path, 'r') as f:
+                metadata = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+        if signature is None or metadata.get('signature') != list(signature):
+            return None
+        return metadata
+
+    def save(self, signature: tuple, summary: Dict[str, Any]) -> Dict[str, Any]:
+        """Record a summary of the data file at this signature
+
+        Failing to write the sidecar is not an error; it is rebuilt from the
+        data on the next read.
+        """
+        mtime_ns, size, _ = signature
+        metadata = {
+            'signature': list(signature),
+            'count': summary['count'],
+            'bytes': size,
+            'min_timestamp': summary['min_timestamp'],
+            'max_timestamp': summary['max_timestamp'],
+            'last_write': datetime.fromtimestamp(mtime_ns / 1e9).isoformat(),
+        }
+        try:
+            fd, temp_path = tempfile.mkstemp(dir=self.directory, prefix=".meta.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(metadata, f)
+                os.replace(temp_path, self.path)
+            except BaseException:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                raise
+        except OSError:
+            pass
+        return metadata
+
+    def remove(self):
+        """Delete the sidecar once its data file is gone"""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
@@ -2,79 +2,867 @@
 Database manager for Tobey Finance Bank
 """
 
+import io
 import json
 import os
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+import tempfile
+import threading
+from typing import List, Dict, Any, Optional, Iterator, Iterable, Callable, Tuple
+from datetime import datetime, timedelta
 
+from .backup import BackupWriter
+from .collection_metadata import MetadataSidecar, combine_summaries, summarize_records
+from .file_lock import FileLock
+from .group_commit import GroupCommitWriter
+from .partitions import MonthlyPartitions
+from .read_snapshot import CollectionSnapshot, ReadSnapshot
+from .schema import SCHEMA_VERSION_FILE, check_schema_version
+from .storage import KEY_FIELDS, StorageBackend
+from .time_index import TimeIndex, parse_timestamp
 
-class DatabaseManager:
-    """Simple database manager using JSON files"""
+
+LOG_FORMATS = ("json", "jsonl")
+
+
+class _CachedCollection:
+    """Parsed copy of a data file with a primary-key index
+    
+    Timestamp-ordered secondary indexes of record positions, either global
+    or grouped by a field such as ``account_number``, are built on first use
+    and kept up to date by appends.
+    
+    The records list can be shared with read snapshots; the first write
+    after ``share`` copies it, so shared lists never change.
+    
+    Between ``track_changes`` and ``take_changes`` the records added and
+    removed are kept (an update counts as both) so metadata can follow a
+    write without rescanning the collection; outside of that nothing is
+    kept.
+    """
+    
+    def __init__(self, signature: Optional[tuple], records: List[Dict[str, Any]], key_field: str):
+        self.signature = signature
+        self.records = records
+        self.key_field = key_field
+        self.positions: Dict[Any, int] = {}
+        self._time_indexes: Dict[Optional[str], Any] = {}
+        self._shared = False
+        self._added: Optional[List[Dict[str, Any]]] = None
+        self._removed: Optional[List[Dict[str, Any]]] = None
+        self.reindex()
+    
+    def reindex(self):
+        """Rebuild the primary-key index (first occurrence wins)"""
+        self.positions = {}
+        for position, record in enumerate(self.records):
+            self.positions.setdefault(record.get(self.key_field), position)
+        self._time_indexes.clear()
+    
+    def share(self) -> List[Dict[str, Any]]:
+        """Hand the records list to a snapshot, copying it before the next write"""
+        self._shared = True
+        return self.records
+    
+    def _unshare(self):
+        """Take a private copy of the records list if a snapshot holds it"""
+        if self._shared:
+            self.records = list(self.records)
+            self._shared = False
+    
+    def track_changes(self):
+        """Start keeping the records added and removed by writes"""
+        self._added, self._removed = [], []
+    
+    def take_changes(self) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Records added and removed since ``track_changes``, which stops tracking"""
+        changes = (self._added or [], self._removed or [])
+        self._added = self._removed = None
+        return changes
     
-    def __init__(self, data_dir: str = "data"):
+    def time_index(self) -> TimeIndex:
+        """Positions of all records ordered by timestamp"""
+        if None not in self._time_indexes:
+            index = TimeIndex()
+            for position, record in enumerate(self.records):
+                index.add(parse_timestamp(record.get('timestamp')), position)
+            self._time_indexes[None] = index
+        return self._time_indexes[None]
+    
+    def grouped_time_index(self, field: str) -> Dict[Any, TimeIndex]:
+        """Positions of records ordered by timestamp, per value of a field"""
+        if field not in self._time_indexes:
+            groups: Dict[Any, TimeIndex] = {}
+            for position, record in enumerate(self.records):
+                groups.setdefault(record.get(field), TimeIndex()).add(
+                    parse_timestamp(record.get('timestamp')), position)
+            self._time_indexes[field] = groups
+        return self._time_indexes[field]
+    
+    def _index_record(self, record: Dict[str, Any], position: int):
+        """Add a newly appended record to the built secondary indexes"""
+        if not self._time_indexes:
+            return
+        timestamp = parse_timestamp(record.get('timestamp'))
+        for field, index in self._time_indexes.items():
+            if field is None:
+                index.add(timestamp, position)
+            else:
+                index.setdefault(record.get(field), TimeIndex()).add(timestamp, position)
+    
+    def get(self, key: Any) -> Optional[Dict[str, Any]]:
+        """Look up a record by primary key"""
+        position = self.positions.get(key)
+        return self.records[position] if position is not None else None
+    
+    def append(self, record: Dict[str, Any]):
+        """Append a record and index it"""
+        self._unshare()
+        position = len(self.records)
+        self.positions.setdefault(record.get(self.key_field), position)
+        self.records.append(record)
+        if self._added is not None:
+            self._added.append(record)
+        self._index_record(record, position)
+    
+    def upsert(self, record: Dict[str, Any], insert: bool = True):
+        """Replace a record by primary key, appending it if it is new"""
+        position = self.positions.get(record.get(self.key_field))
+        if position is not None:
+            self._unshare()
+            previous = self.records[position]
+            self.records[position] = record
+            if self._added is not None:
+                self._removed.append(previous)
+                self._added.append(record)
+            # Secondary indexes only go stale if an indexed field changed
+            if any(previous.get(field) != record.get(field)
+                   for field in ['timestamp', *self._time_indexes] if field is not None):
+                self._time_indexes.clear()
+        elif insert:
+            self.append(record)
+    
+    def delete(self, key: Any) -> bool:
+        """Delete a record by primary key"""
+        position = self.positions.get(key)
+        if position is None:
+            return False
+        self._unshare()
+        if self._removed is not None:
+            self._removed.append(self.records[position])
+        del self.records[position]
+        self.reindex()
+        return True
+
+
+class _AppendOperation:
+    """Queued append of records to a collection"""
+    
+    def __init__(self, records: List[Dict[str, Any]]):
+        self.records = records
+    
+    def __call__(self, collection: _CachedCollection):
+        for record in self.records:
+            collection.append(record)
+
+
+class _PinnedFile(io.RawIOBase):
+    """Read-only stream over the first ``size`` bytes of an open file
+    
+    Reads go through ``os.pread`` at the stream's own offset, so any number
+    of streams can share one descriptor without moving each other.
+    """
+    
+    def __init__(self, fd: int, size: int):
+        self._fd = fd
+        self._size = size
+        self._offset = 0
+    
+    def readable(self) -> bool:
+        return True
+    
+    def readinto(self, buffer) -> int:
+        length = min(len(buffer), self._size - self._offset)
+        if length <= 0:
+            return 0
+        data = os.pread(self._fd, length, self._offset)
+        buffer[:len(data)] = data
+        self._offset += len(data)
+        return len(data)
+
+
+class _FileSegment:
+    """Records of a data file as they were when the segment was taken
+    
+    The file is held open: rewrites rename a new file into place and
+    archiving removes live files, neither of which changes what an open
+    descriptor reads, and appends made afterwards lie past the recorded
+    size. Nothing is parsed until the segment is iterated, which may happen
+    any number of times until ``close``.
+    """
+    
+    def __init__(self, file_path: str, fd: int, size: int):
+        self.file_path = file_path
+        self._fd = fd
+        self._size = size
+    
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        if self._fd is None:
+            raise ValueError("Read from a closed snapshot")
+        raw = io.BufferedReader(_PinnedFile(self._fd, self._size))
+        opener = MonthlyPartitions.archive_opener(self.file_path)
+        f = opener(raw, 'rt') if opener is not None else io.TextIOWrapper(raw)
+        with f:
+            if DatabaseManager._is_jsonl(self.file_path):
+                yield from DatabaseManager._parse_jsonl(f)
+            else:
+                yield from DatabaseManager._parse_json_array(f)
+    
+    def close(self):
+        """Release the file"""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+class DatabaseManager(StorageBackend):
+    """Simple database manager using JSON files
+    
+    Transactions and audit logs can be kept in an append-only JSONL
+    file (one record per line) by passing ``log_format="jsonl"``, so that
+    saving a record appends a single line instead of rewriting the file.
+    
+    Each collection is parsed once and kept in memory keyed by its primary
+    key; the copy is reloaded only when the file's mtime, size or inode
+    changes, so point lookups are dictionary hits.
+    
+    Files are replaced atomically (temp file, fsync, rename). With
+    ``group_commit=True`` writes are handed to a background writer that
+    coalesces everything arriving within ``commit_window`` seconds into one
+    rewrite and one fsync per file.
+    
+    Mutations hold an advisory lock on ``<data_dir>/.lock`` so several
+    processes can share a data directory; each re-checks the file version
+    under the lock and reloads its cached copy if another process wrote.
+    
+    With ``partition_logs=True`` transactions and audit logs are split into
+    monthly partition files, date-range queries only open the partitions
+    they overlap, and months before the current one are sealed read-only.
+    A backdated record, or an update or delete of an old transaction,
+    reopens its month until the next rollover or startup seals it again.
+    With ``archive_format`` set to ``'gzip'`` or ``'lzma'`` sealed months are
+    also compressed into archive files; they stay readable through the
+    normal APIs, and per-account and per-employee lookups skip archives
+    whose segment index shows they hold no matching records. Bulk loads
+    such as migrations pass ``seal_partitions=False`` to leave every month
+    open; the next manager that seals does so in ``initialize_database``.
+    """
+    
+    # Field each log collection's archive segments are indexed by
+    ARCHIVE_INDEX_FIELDS = {'transactions': 'account_number', 'audit_logs': 'employee_id'}
+    
+    def __init__(self, data_dir: str = "data", log_format: str = "json",
+                 group_commit: bool = False, commit_window: float = 0.005,
+                 partition_logs: bool = False, archive_format: Optional[str] = None,
+                 seal_partitions: bool = True):
+        if log_format not in LOG_FORMATS:
+            raise ValueError(f"Unsupported log format: {log_format}")
+        if archive_format is not None:
+            if archive_format not in MonthlyPartitions.ARCHIVE_FORMATS:
+                raise ValueError(f"Unsupported archive format: {archive_format}")
+            if not partition_logs:
+                raise ValueError("Archiving requires partition_logs=True")
+        
         self.data_dir = data_dir
+        self.log_format = log_format
+        log_extension = f".{log_format}"
         self.accounts_file = os.path.join(data_dir, "accounts.json")
         self.customers_file = os.path.join(data_dir, "customers.json")
-        self.transactions_file = os.path.join(data_dir, "transactions.json")
+        self.transactions_file = os.path.join(data_dir, "transactions" + log_extension)
         self.employees_file = os.path.join(data_dir, "employees.json")
-        self.audit_logs_file = os.path.join(data_dir, "audit_logs.json")
+        self.audit_logs_file = os.path.join(data_dir, "audit_logs" + log_extension)
+        
+        self._key_fields = {
+            self.accounts_file: 'account_number',
+            self.customers_file: 'customer_id',
+            self.transactions_file: 'transaction_id',
+            self.employees_file: 'employee_id',
+            self.audit_logs_file: 'log_id',
+        }
+        
+        self.partition_logs = partition_logs
+        self.archive_format = archive_format
+        self.seal_partitions = seal_partitions
+        self._partitions: Dict[str, MonthlyPartitions] = {}
+        if partition_logs:
+            for log_file in (self.transactions_file, self.audit_logs_file):
+                partitions = MonthlyPartitions(os.path.splitext(log_file)[0], log_extension)
+                self._partitions[log_file] = partitions
+                self._key_fields[partitions.directory] = self._key_fields[log_file]
+        
+        self._cache: Dict[str, _CachedCollection] = {}
+        self._lock = threading.RLock()
+        self._process_lock = FileLock(os.path.join(data_dir, ".lock"))
+        self._writer = GroupCommitWriter(self._commit, commit_window) if group_commit else None
         
         # Create data directory if it doesn't exist
         os.makedirs(data_dir, exist_ok=True)
     
     def initialize_database(self):
-        """Initialize database files if they don't exist"""
-        self._ensure_file_exists(self.accounts_file)
-        self._ensure_file_exists(self.customers_file)
-        self._ensure_file_exists(self.transactions_file)
-        self._ensure_file_exists(self.employees_file)
-        self._ensure_file_exists(self.audit_logs_file)
+        """Initialize database files if they don't exist
+        
+        Raises SchemaVersionError if existing data is at another schema
+        version than this release's (see ``src.utils.migrations``).
+        """
+        with self._lock, self._process_lock:
+            has_data = any(not name.startswith(".") and name != SCHEMA_VERSION_FILE
+                           for name in os.listdir(self.data_dir))
+            check_schema_version(self.data_dir, has_data)
+            self._ensure_file_exists(self.accounts_file)
+            self._ensure_file_exists(self.customers_file)
+            self._ensure_file_exists(self.employees_file)
+            for log_file in (self.transactions_file, self.audit_logs_file):
+                if log_file in self._partitions:
+                    self._ensure_partitions_exist(log_file)
+                else:
+                    self._ensure_file_exists(log_file)
+    
+    def _ensure_partitions_exist(self, log_file: str):
+        """Create a partition directory, splitting an existing log file into it"""
+        partitions = self._partitions[log_file]
+        if not os.path.isdir(partitions.directory):
+            legacy_file = log_file
+            if not os.path.exists(legacy_file) and self._is_jsonl(log_file):
+                legacy_file = log_file[:-len(".jsonl")] + ".json"
+            
+            by_month: Dict[str, List[Dict[str, Any]]] = {}
+            for record in self._read_json_file(legacy_file):
+                path = partitions.path_for(parse_timestamp(record.get('timestamp')))
+                by_month.setdefault(path, []).append(record)
+            
+            os.makedirs(partitions.directory, exist_ok=True)
+            for path, records in by_month.items():
+                self._write_json_file(path, records)
+        
+        if self.seal_partitions:
+            partitions.seal_closed()
+            self._archive_sealed(log_file)
+    
+    def _archive_sealed(self, log_file: str):
+        """Compress sealed partitions that are still stored uncompressed"""
+        if self.archive_format is None:
+            return
+        partitions = self._partitions[log_file]
+        index_field = self.ARCHIVE_INDEX_FIELDS[os.path.basename(partitions.directory)]
+        for file_path in partitions.paths():
+            if partitions.is_archived(file_path) or not partitions.is_sealed(file_path):
+                continue
+            partitions.archive(partitions.month_of_path(file_path), self._stream_records(file_path),
+                               self.archive_format, index_field)
+            self._cache.pop(file_path, None)
+            MetadataSidecar(file_path).remove()
+            self._fsync_directory(partitions.directory)
+    
+    def _skip_archive(self, log_file: str, file_path: str, value: Any) -> bool:
+        """Check whether an archive's segment index rules out records with a value"""
+        partitions = self._partitions.get(log_file)
+        if partitions is None or not partitions.is_archived(file_path):
+            return False
+        index = partitions.segment_index(file_path)
+        return index is not None and value not in index['values']
     
     def _ensure_file_exists(self, file_path: str):
-        """Ensure a JSON file exists with empty array"""
-        if not os.path.exists(file_path):
+        """Ensure a data file exists, converting a legacy JSON file to JSONL"""
+        if os.path.exists(file_path):
+            return
+        if self._is_jsonl(file_path):
+            legacy_file = file_path[:-len(".jsonl")] + ".json"
+            self._write_json_file(file_path, self._read_json_file(legacy_file))
+        else:
             with open(file_path, 'w') as f:
                 json.dump([], f)
     
+    @staticmethod
+    def _is_jsonl(file_path: str) -> bool:
+        """Check whether a data file uses the line-delimited format"""
+        return file_path.endswith(".jsonl") or MonthlyPartitions.archive_opener(file_path) is not None
+    
+    @staticmethod
+    def _open_data_file(file_path: str):
+        """Open a data file for reading text, decompressing archived partitions"""
+        opener = MonthlyPartitions.archive_opener(file_path)
+        if opener is not None:
+            return opener(file_path, 'rt')
+        return open(file_path, 'r')
+    
+    @staticmethod
+    def _parse_jsonl(f) -> Iterator[Dict[str, Any]]:
+        """Parse records from an open JSONL text file one line at a time"""
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                # A torn trailing line from an interrupted append
+                continue
+    
+    @staticmethod
+    def _parse_json_array(f, chunk_size: int = 64 * 1024) -> Iterator[Dict[str, Any]]:
+        """Parse the elements of an open JSON array text file without reading it whole"""
+        decoder = json.JSONDecoder()
+        buffer = ""
+        position = 0
+        eof = False
+        started = False
+        while True:
+            # Skip whitespace and separators, refilling the buffer as needed
+            while True:
+                while position < len(buffer) and buffer[position] in " \t\r\n,":
+                    position += 1
+                if position < len(buffer) or eof:
+                    break
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buffer = buffer[position:] + chunk
+                position = 0
+            
+            if position >= len(buffer):
+                return
+            if not started:
+                if buffer[position] != "[":
+                    return
+                started = True
+                position += 1
+                continue
+            if buffer[position] == "]":
+                return
+            
+            try:
+                record, position = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if eof:
+                    return
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buffer = buffer[position:] + chunk
+                position = 0
+                continue
+            yield record
+    
+    def _iter_jsonl_file(self, file_path: str) -> Iterator[Dict[str, Any]]:
+        """Stream records from a JSONL file one line at a time"""
+        try:
+            f = self._open_data_file(file_path)
+        except FileNotFoundError:
+            return
+        with f:
+            yield from self._parse_jsonl(f)
+    
+    def _iter_json_array_file(self, file_path: str,
+                              chunk_size: int = 64 * 1024) -> Iterator[Dict[str, Any]]:
+        """Stream the elements of a JSON array file without loading it whole"""
+        try:
+            f = open(file_path, 'r')
+        except FileNotFoundError:
+            return
+        with f:
+            yield from self._parse_json_array(f, chunk_size)
+    
+    def _stream_records(self, file_path: str) -> Iterator[Dict[str, Any]]:
+        """Stream records from a data file in constant memory"""
+        if self._is_jsonl(file_path):
+            return self._iter_jsonl_file(file_path)
+        return self._iter_json_array_file(file_path)
+    
+    def _iter_log_records(self, log_file: str, start_date: Optional[datetime] = None,
+                          end_date: Optional[datetime] = None,
+                          record_filter: Optional[Callable[[Dict[str, Any]], bool]] = None
+                          ) -> Iterator[Dict[str, Any]]:
+        """Stream a log collection, pruning partitions outside a date range"""
+        for file_path in self._log_files(log_file, start_date, end_date):
+            for record in self._stream_records(file_path):
+                if start_date or end_date:
+                    timestamp = parse_timestamp(record.get('timestamp'))
+                    if start_date and timestamp < start_date:
+                        continue
+                    if end_date and timestamp > end_date:
+                        continue
+                if record_filter is None or record_filter(record):
+                    yield record
+    
     def _read_json_file(self, file_path: str) -> List[Dict[str, Any]]:
         """Read JSON file and return list of dictionaries"""
+        if self._is_jsonl(file_path):
+            return list(self._iter_jsonl_file(file_path))
         try:
-            with open(file_path, 'r') as f:
+            with self._open_data_file(file_path) as f:
                 return json.load(f)
         except (json.JSONDecodeError, FileNotFoundError):
             return []
     
     def _write_json_file(self, file_path: str, data: List[Dict[str, Any]]):
-        """Write list of dictionaries to JSON file"""
-        with open(file_path, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
+        """Atomically replace a data file with a list of dictionaries"""
+        directory = os.path.dirname(file_path) or "."
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp",
+                                         prefix=f".{os.path.basename(file_path)}.")
+        try:
+            with os.fdopen(fd, 'w') as f:
+                if self._is_jsonl(file_path):
+                    f.writelines(self._encode_jsonl_record(record) for record in data)
+                else:
+                    json.dump(data, f, indent=2, default=str)
+                f.flush()
+                os.fsync(f.fileno())
+            try:
+                os.chmod(temp_path, os.stat(file_path).st_mode)
+            except FileNotFoundError:
+                os.chmod(temp_path, 0o644)
+            os.replace(temp_path, file_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        self._fsync_directory(directory)
     
-    # Account operations
-    def save_account(self, account_data: Dict[str, Any]):
-        """Save account to database"""
-        accounts = self._read_json_file(self.accounts_file)
+    @staticmethod
+    def _fsync_directory(directory: str):
+        """Make a rename in a directory durable where the platform allows it"""
+        try:
+            fd = os.open(directory, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+    
+    def _append_jsonl_records(self, file_path: str, records: List[Dict[str, Any]]):
+        """Append records to a JSONL file with one write and one fsync"""
+        signature = self._file_signature(file_path)
+        with open(file_path, 'ab+') as f:
+            self._terminate_last_line(f)
+            f.write("".join(self._encode_jsonl_record(record) for record in records).encode())
+            f.flush()
+            os.fsync(f.fileno())
         
-        # Check if account already exists
-        for i, account in enumerate(accounts):
-            if account.get('account_number') == account_data.get('account_number'):
-                accounts[i] = account_data
+        # Extend the cached copy only if nobody else touched the file
+        cached = self._cache.get(file_path)
+        if cached is not None and cached.signature == signature:
+            for record in records:
+                cached.append(record)
+            cached.signature = self._file_signature(file_path)
+        else:
+            self._cache.pop(file_path, None)
+    
+    @staticmethod
+    def _terminate_last_line(f, block_size: int = 4096):
+        """Make a JSONL file opened for appending end with a complete line
+
+        A line torn by an interrupted append is cut off, as readers skip it
+        anyway and the next record would otherwise be glued onto it; a
+        complete record that only lacks its newline gets one.
+        """
+        end = f.seek(0, os.SEEK_END)
+        if end == 0:
+            return
+        f.seek(end - 1)
+        if f.read(1) == b"\n":
+            return
+
+        # Walk back to the start of the last line
+        line_start = end
+        while line_start > 0:
+            block_start = max(0, line_start - block_size)
+            f.seek(block_start)
+            newline = f.read(line_start - block_start).rfind(b"\n")
+            if newline >= 0:
+                line_start = block_start + newline + 1
                 break
+            line_start = block_start
+
+        f.seek(line_start)
+        try:
+            json.loads(f.read())
+        except ValueError:
+            f.truncate(line_start)
         else:
-            accounts.append(account_data)
+            f.write(b"\n")
+
+    @staticmethod
+    def _encode_jsonl_record(record: Dict[str, Any]) -> str:
+        """Encode a record as a single JSONL line"""
+        return json.dumps(record, separators=(',', ':'), default=str) + "\n"
+    
+    @staticmethod
+    def _file_signature(file_path: str) -> Optional[tuple]:
+        """Identify a file version by mtime, size and inode"""
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    
+    @staticmethod
+    def _copy_record(record: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Copy a record so callers cannot mutate the cached version"""
+        if record is None:
+            return None
+        return {key: value.copy() if isinstance(value, (list, dict)) else value
+                for key, value in record.items()}
+    
+    def _key_field(self, file_path: str) -> str:
+        """Primary key field of a data file or partition file"""
+        if file_path in self._key_fields:
+            return self._key_fields[file_path]
+        return self._key_fields[os.path.dirname(file_path)]
+    
+    def _partitions_of(self, file_path: str) -> Optional[MonthlyPartitions]:
+        """Partition set a partition file belongs to, if any"""
+        directory = os.path.dirname(file_path)
+        for partitions in self._partitions.values():
+            if partitions.directory == directory:
+                return partitions
+        return None
+    
+    def _is_sealed(self, file_path: str) -> bool:
+        """Check whether a file is a sealed (immutable) partition"""
+        partitions = self._partitions_of(file_path)
+        return partitions is not None and partitions.is_sealed(file_path)
+    
+    def _load_collection(self, file_path: str) -> _CachedCollection:
+        """Return the cached collection, reloading it if the file changed"""
+        cached = self._cache.get(file_path)
+        signature = self._file_signature(file_path)
+        if cached is None or cached.signature != signature:
+            cached = _CachedCollection(signature, self._read_json_file(file_path),
+                                       self._key_field(file_path))
+            self._cache[file_path] = cached
+        return cached
+    
+    def _log_files(self, log_file: str, start_date: Optional[datetime] = None,
+                   end_date: Optional[datetime] = None) -> List[str]:
+        """Files of a log collection overlapping a date range, oldest first"""
+        partitions = self._partitions.get(log_file)
+        if partitions is None:
+            return [log_file]
+        return partitions.paths(start_date, end_date)
+    
+    def _log_file_for(self, log_file: str, record: Dict[str, Any]) -> str:
+        """File of a log collection that a new record belongs in"""
+        partitions = self._partitions.get(log_file)
+        if partitions is None:
+            return log_file
+        return partitions.path_for(parse_timestamp(record.get('timestamp')))
+    
+    def _prepare_log_file(self, log_file: str, path: str) -> str:
+        """Get the partition file a write is routed to ready, returning its path
         
-        self._write_json_file(self.accounts_file, accounts)
+        The first write of a new month seals the months before it. A write
+        to a sealed month reopens it, restoring its live file from the
+        archive if it was compressed; it is sealed again by the next
+        rollover or startup.
+        """
+        partitions = self._partitions.get(log_file)
+        if partitions is None:
+            return path
+        month = partitions.month_of_path(path)
+        if os.path.exists(path) and not partitions.is_archived(path) and \
+                month not in partitions.sealed():
+            return path
+        with self._lock, self._process_lock:
+            if partitions.is_archived(path) or month in partitions.sealed():
+                return self._reopen_partition(log_file, month)
+            os.makedirs(partitions.directory, exist_ok=True)
+            if self.seal_partitions and path == partitions.path_for(datetime.now()) and \
+                    not os.path.exists(path):
+                # A new month has started, so earlier months are now closed
+                partitions.seal_closed()
+                self._archive_sealed(log_file)
+            return path
+    
+    def _reopen_partition(self, log_file: str, month: str) -> str:
+        """Make a sealed month writable again and return its live file"""
+        partitions = self._partitions[log_file]
+        live_path = os.path.join(partitions.directory, month + partitions.extension)
+        current_path = {partitions.month_of_path(path): path for path in partitions.paths()}.get(month)
+        if current_path is not None and current_path != live_path:
+            self._write_json_file(live_path, list(self._stream_records(current_path)))
+            self._cache.pop(current_path, None)
+            MetadataSidecar(current_path).remove()
+        partitions.reopen(month)
+        return live_path
+    
+    def _find_log_file(self, log_file: str, key: Any) -> Optional[str]:
+        """File of a log collection holding a record, newest partition first"""
+        with self._lock:
+            for path in reversed(self._log_files(log_file)):
+                if key in self._load_collection(path).positions:
+                    return path
+        return None
+    
+    def _iter_records(self, file_path: str) -> Iterator[Dict[str, Any]]:
+        """Iterate over the cached records of a data file"""
+        return iter(self._load_collection(file_path).records)
+    
+    def _store_collection(self, file_path: str, collection: _CachedCollection):
+        """Persist a cached collection and record the new file version"""
+        try:
+            self._write_json_file(file_path, collection.records)
+        except Exception:
+            self._cache.pop(file_path, None)
+            raise
+        collection.signature = self._file_signature(file_path)
+    
+    def _commit(self, file_path: str, operations: List[Callable[[_CachedCollection], Any]]) -> List[Any]:
+        """Apply operations to a collection and persist them with a single write"""
+        with self._lock, self._process_lock:
+            if self._is_sealed(file_path):
+                # Sealed by a rollover in another process since this write was routed
+                partitions = self._partitions_of(file_path)
+                if partitions.is_archived(file_path):
+                    raise PermissionError(f"Partition {file_path} is archived")
+                partitions.reopen(partitions.month_of_path(file_path))
+            
+            if self._is_jsonl(file_path) and all(isinstance(operation, _AppendOperation)
+                                                 for operation in operations):
+                records = [record for operation in operations for record in operation.records]
+                previous_signature = self._file_signature(file_path)
+                self._append_jsonl_records(file_path, records)
+                self._update_metadata(file_path, previous_signature, records)
+                return [None] * len(operations)
+            
+            collection = self._load_collection(file_path)
+            previous_signature = collection.signature
+            collection.track_changes()
+            try:
+                results = [operation(collection) for operation in operations]
+            except Exception:
+                self._cache.pop(file_path, None)
+                raise
+            self._store_collection(file_path, collection)
+            added, removed = collection.take_changes()
+            self._update_metadata(file_path, previous_signature, added, removed, collection.records)
+            return results
+    
+    def _timestamp_field(self, file_path: str) -> str:
+        """Field that orders the records of a data file in time"""
+        if file_path in (self.transactions_file, self.audit_logs_file) or self._partitions_of(file_path):
+            return 'timestamp'
+        return 'created_date'
+    
+    def _update_metadata(self, file_path: str, previous_signature: Optional[tuple],
+                         added: List[Dict[str, Any]], removed: List[Dict[str, Any]] = (),
+                         records: Optional[List[Dict[str, Any]]] = None):
+        """Refresh a data file's metadata sidecar after a write
+        
+        The sidecar describing the file at ``previous_signature`` is moved
+        forward by the records the write added and removed. The whole
+        collection, ``records``, is only summarized if that sidecar was
+        missing or stale, or a removed record may have held the earliest or
+        latest timestamp. Without ``records`` (an append) a stale sidecar is
+        left for the next read to rebuild.
+        """
+        sidecar = MetadataSidecar(file_path)
+        timestamp_field = self._timestamp_field(file_path)
+        previous = sidecar.load(previous_signature)
+        summary = None
+        if previous is not None:
+            added_summary = summarize_records(added, timestamp_field)
+            summary = combine_summaries([previous, added_summary])
+            if removed:
+                removed_summary = summarize_records(removed, timestamp_field)
+                summary['count'] -= removed_summary['count']
+                for field in ('min_timestamp', 'max_timestamp'):
+                    bound = previous[field]
+                    if (removed_summary[field] is not None
+                            and parse_timestamp(removed_summary[field]) == parse_timestamp(bound)
+                            and (added_summary[field] is None
+                                 or parse_timestamp(added_summary[field]) != parse_timestamp(bound))):
+                        summary = None  # the range may have shrunk
+                        break
+        if summary is None:
+            if records is None:
+                return
+            summary = summarize_records(records, timestamp_field)
+        sidecar.save(self._file_signature(file_path), summary)
+    
+    def _submit(self, file_path: str, operation: Callable[[_CachedCollection], Any]) -> Any:
+        """Run a write operation, through the group-commit writer if enabled"""
+        if self._writer is not None:
+            return self._writer.submit(file_path, operation)
+        return self._commit(file_path, [operation])[0]
+    
+    def close(self):
+        """Flush pending group commits and stop the writer"""
+        if self._writer is not None:
+            self._writer.close()
+    
+    def _get_record(self, file_path: str, key: Any) -> Optional[Dict[str, Any]]:
+        """Get a record by primary key"""
+        with self._lock:
+            return self._copy_record(self._load_collection(file_path).get(key))
+    
+    def _get_all_records(self, file_path: str) -> List[Dict[str, Any]]:
+        """Get copies of every record in a collection"""
+        with self._lock:
+            return [self._copy_record(record) for record in self._iter_records(file_path)]
+    
+    def _upsert_record(self, file_path: str, record: Dict[str, Any], insert: bool = True):
+        """Replace a record by primary key, appending it if it is new"""
+        record = self._copy_record(record)
+        self._submit(file_path, lambda collection: collection.upsert(record, insert))
+    
+    def _upsert_records(self, file_path: str, records: Iterable[Dict[str, Any]]):
+        """Replace or append many records with a single read-merge-write"""
+        records = [self._copy_record(record) for record in records]
+        if not records:
+            return
+        
+        def upsert_all(collection: _CachedCollection):
+            for record in records:
+                collection.upsert(record)
+        
+        self._submit(file_path, upsert_all)
+    
+    def _delete_record(self, file_path: str, key: Any) -> bool:
+        """Delete a record by primary key"""
+        return self._submit(file_path, lambda collection: collection.delete(key))
+    
+    def _append_log_records(self, log_file: str, records: Iterable[Dict[str, Any]]):
+        """Append many records to a log collection, one write per target file"""
+        by_file: Dict[str, List[Dict[str, Any]]] = {}
+        for record in records:
+            by_file.setdefault(self._log_file_for(log_file, record), []).append(self._copy_record(record))
+        # In record order, so a batch running into a new month fills the old one before sealing it
+        for file_path, file_records in by_file.items():
+            file_path = self._prepare_log_file(log_file, file_path)
+            self._submit(file_path, _AppendOperation(file_records))
+    
+    # Account operations
+    def save_account(self, account_data: Dict[str, Any]):
+        """Save account to database"""
+        self._upsert_record(self.accounts_file, account_data)
+    
+    def save_accounts(self, accounts_data: Iterable[Dict[str, Any]]):
+        """Save many accounts with a single write"""
+        self._upsert_records(self.accounts_file, accounts_data)
     
     def get_account(self, account_number: str) -> Optional[Dict[str, Any]]:
         """Get account by account number"""
-        accounts = self._read_json_file(self.accounts_file)
-        for account in accounts:
-            if account.get('account_number') == account_number:
-                return account
-        return None
+        return self._get_record(self.accounts_file, account_number)
     
     def get_all_accounts(self) -> List[Dict[str, Any]]:
         """Get all accounts"""
-        return self._read_json_file(self.accounts_file)
+        return self._get_all_records(self.accounts_file)
+    
+    def iter_accounts(self, filter: Optional[Callable[[Dict[str, Any]], bool]] = None
+                      ) -> Iterator[Dict[str, Any]]:
+        """Stream accounts matching an optional predicate"""
+        return (account for account in self._stream_records(self.accounts_file)
+                if filter is None or filter(account))
     
     def update_account(self, account_data: Dict[str, Any]):
         """Update account in database"""
@@ -82,40 +870,30 @@ class DatabaseManager:
     
     def delete_account(self, account_number: str) -> bool:
         """Delete account from database"""
-        accounts = self._read_json_file(self.accounts_file)
-        for i, account in enumerate(accounts):
-            if account.get('account_number') == account_number:
-                del accounts[i]
-                self._write_json_file(self.accounts_file, accounts)
-                return True
-        return False
+        return self._delete_record(self.accounts_file, account_number)
     
     # Customer operations
     def save_customer(self, customer_data: Dict[str, Any]):
         """Save customer to database"""
-        customers = self._read_json_file(self.customers_file)
-        
-        # Check if customer already exists
-        for i, customer in enumerate(customers):
-            if customer.get('customer_id') == customer_data.get('customer_id'):
-                customers[i] = customer_data
-                break
-        else:
-            customers.append(customer_data)
-        
-        self._write_json_file(self.customers_file, customers)
+        self._upsert_record(self.customers_file, customer_data)
+    
+    def upsert_customers(self, customers_data: Iterable[Dict[str, Any]]):
+        """Save many customers with a single write"""
+        self._upsert_records(self.customers_file, customers_data)
     
     def get_customer(self, customer_id: str) -> Optional[Dict[str, Any]]:
         """Get customer by customer ID"""
-        customers = self._read_json_file(self.customers_file)
-        for customer in customers:
-            if customer.get('customer_id') == customer_id:
-                return customer
-        return None
+        return self._get_record(self.customers_file, customer_id)
     
     def get_all_customers(self) -> List[Dict[str, Any]]:
         """Get all customers"""
-        return self._read_json_file(self.customers_file)
+        return self._get_all_records(self.customers_file)
+    
+    def iter_customers(self, filter: Optional[Callable[[Dict[str, Any]], bool]] = None
+                       ) -> Iterator[Dict[str, Any]]:
+        """Stream customers matching an optional predicate"""
+        return (customer for customer in self._stream_records(self.customers_file)
+                if filter is None or filter(customer))
     
     def update_customer(self, customer_data: Dict[str, Any]):
         """Update customer in database"""
@@ -123,96 +901,117 @@ class DatabaseManager:
     
     def delete_customer(self, customer_id: str) -> bool:
         """Delete customer from database"""
-        customers = self._read_json_file(self.customers_file)
-        for i, customer in enumerate(customers):
-            if customer.get('customer_id') == customer_id:
-                del customers[i]
-                self._write_json_file(self.customers_file, customers)
-                return True
-        return False
+        return self._delete_record(self.customers_file, customer_id)
     
     # Transaction operations
     def save_transaction(self, transaction_data: Dict[str, Any]):
         """Save transaction to database"""
-        transactions = self._read_json_file(self.transactions_file)
-        transactions.append(transaction_data)
-        self._write_json_file(self.transactions_file, transactions)
+        self._append_log_records(self.transactions_file, [transaction_data])
+    
+    def save_transactions(self, transactions_data: Iterable[Dict[str, Any]]):
+        """Save many transactions with a single write per file"""
+        self._append_log_records(self.transactions_file, transactions_data)
     
     def get_transaction(self, transaction_id: str) -> Optional[Dict[str, Any]]:
         """Get transaction by transaction ID"""
-        transactions = self._read_json_file(self.transactions_file)
-        for transaction in transactions:
-            if transaction.get('transaction_id') == transaction_id:
-                return transaction
-        return None
+        file_path = self._find_log_file(self.transactions_file, transaction_id)
+        return self._get_record(file_path, transaction_id) if file_path else None
     
     def get_all_transactions(self) -> List[Dict[str, Any]]:
         """Get all transactions"""
-        return self._read_json_file(self.transactions_file)
+        transactions = []
+        for file_path in self._log_files(self.transactions_file):
+            transactions.extend(self._get_all_records(file_path))
+        return transactions
+    
+    def iter_transactions(self, filter: Optional[Callable[[Dict[str, Any]], bool]] = None,
+                          account_number: Optional[str] = None,
+                          start_date: Optional[datetime] = None,
+                          end_date: Optional[datetime] = None) -> Iterator[Dict[str, Any]]:
+        """Stream transactions in storage order, parsing one record at a time"""
+        def matches(transaction: Dict[str, Any]) -> bool:
+            if account_number and transaction.get('account_number') != account_number:
+                return False
+            return filter is None or filter(transaction)
+        
+        return self._iter_log_records(self.transactions_file, start_date, end_date, matches)
     
     def get_account_transactions(self, account_number: str, 
                                start_date: Optional[datetime] = None,
                                end_date: Optional[datetime] = None) -> List[Dict[str, Any]]:
         """Get transactions for a specific account"""
-        transactions = self._read_json_file(self.transactions_file)
-        filtered_transactions = []
+        transactions = []
         
-        for transaction in transactions:
-            if transaction.get('account_number') == account_number:
-                # Filter by date if provided
-                if start_date or end_date:
-                    transaction_date = datetime.fromisoformat(transaction.get('timestamp', ''))
-                    if start_date and transaction_date < start_date:
-                        continue
-                    if end_date and transaction_date > end_date:
-                        continue
-                filtered_transactions.append(transaction)
+        with self._lock:
+            for file_path in self._log_files(self.transactions_file, start_date, end_date):
+                if self._skip_archive(self.transactions_file, file_path, account_number):
+                    continue
+                collection = self._load_collection(file_path)
+                account_index = collection.grouped_time_index('account_number').get(account_number)
+                if account_index is None:
+                    continue
+                
+                # Range scan over the account's time-ordered positions
+                transactions.extend(self._copy_record(collection.records[position])
+                                    for position in account_index.range(start_date, end_date))
         
-        return filtered_transactions
+        return transactions
+    
+    def get_transactions_by_date_range(self, start_date: datetime,
+                                       end_date: datetime) -> List[Dict[str, Any]]:
+        """Get all transactions within a date range (newest first)"""
+        transactions = []
+        
+        with self._lock:
+            for file_path in reversed(self._log_files(self.transactions_file, start_date, end_date)):
+                collection = self._load_collection(file_path)
+                transactions.extend(self._copy_record(collection.records[position])
+                                    for position in reversed(collection.time_index().range(start_date, end_date)))
+        
+        return transactions
+    
+    def get_recent_transactions(self, days: int = 30) -> List[Dict[str, Any]]:
+        """Get transactions from the last N days (newest first)"""
+        end_date = datetime.now()
+        return self.get_transactions_by_date_range(end_date - timedelta(days=days), end_date)
     
     def update_transaction(self, transaction_data: Dict[str, Any]):
         """Update transaction in database"""
-        transactions = self._read_json_file(self.transactions_file)
-        for i, transaction in enumerate(transactions):
-            if transaction.get('transaction_id') == transaction_data.get('transaction_id'):
-                transactions[i] = transaction_data
-                break
-        
-        self._write_json_file(self.transactions_file, transactions)
+        file_path = self._find_log_file(self.transactions_file, transaction_data.get('transaction_id'))
+        if file_path:
+            file_path = self._prepare_log_file(self.transactions_file, file_path)
+            self._upsert_record(file_path, transaction_data, insert=False)
     
     def delete_transaction(self, transaction_id: str) -> bool:
         """Delete transaction from database"""
-        transactions = self._read_json_file(self.transactions_file)
-        for i, transaction in enumerate(transactions):
-            if transaction.get('transaction_id') == transaction_id:
-                del transactions[i]
-                self._write_json_file(self.transactions_file, transactions)
-                return True
-        return False
+        file_path = self._find_log_file(self.transactions_file, transaction_id)
+        if not file_path:
+            return False
+        return self._delete_record(self._prepare_log_file(self.transactions_file, file_path),
+                                   transaction_id)
     
     # Employee operations
     def save_employee(self, employee_data: Dict[str, Any]):
         """Save employee to database"""
-        employees = self._read_json_file(self.employees_file)
-        for i, employee in enumerate(employees):
-            if employee.get('employee_id') == employee_data.get('employee_id'):
-                employees[i] = employee_data
-                break
-        else:
-            employees.append(employee_data)
-        self._write_json_file(self.employees_file, employees)
+        self._upsert_record(self.employees_file, employee_data)
+
+    def save_employees(self, employees_data: Iterable[Dict[str, Any]]):
+        """Save many employees with a single write"""
+        self._upsert_records(self.employees_file, employees_data)
 
     def get_employee(self, employee_id: str) -> Optional[Dict[str, Any]]:
         """Get employee by employee ID"""
-        employees = self._read_json_file(self.employees_file)
-        for employee in employees:
-            if employee.get('employee_id') == employee_id:
-                return employee
-        return None
+        return self._get_record(self.employees_file, employee_id)
 
     def get_all_employees(self) -> List[Dict[str, Any]]:
         """Get all employees"""
-        return self._read_json_file(self.employees_file)
+        return self._get_all_records(self.employees_file)
+
+    def iter_employees(self, filter: Optional[Callable[[Dict[str, Any]], bool]] = None
+                       ) -> Iterator[Dict[str, Any]]:
+        """Stream employees matching an optional predicate"""
+        return (employee for employee in self._stream_records(self.employees_file)
+                if filter is None or filter(employee))
 
     def update_employee(self, employee_data: Dict[str, Any]):
         """Update employee in database"""
@@ -220,75 +1019,196 @@ class DatabaseManager:
 
     def delete_employee(self, employee_id: str) -> bool:
         """Delete employee from database"""
-        employees = self._read_json_file(self.employees_file)
-        for i, employee in enumerate(employees):
-            if employee.get('employee_id') == employee_id:
-                del employees[i]
-                self._write_json_file(self.employees_file, employees)
-                return True
-        return False
+        return self._delete_record(self.employees_file, employee_id)
     
     # Audit log operations
     def save_audit_log(self, audit_log_data: Dict[str, Any]):
         """Save audit log to database"""
-        audit_logs = self._read_json_file(self.audit_logs_file)
-        audit_logs.append(audit_log_data)
-        self._write_json_file(self.audit_logs_file, audit_logs)
+        self._append_log_records(self.audit_logs_file, [audit_log_data])
+
+    def save_audit_logs(self, audit_logs_data: Iterable[Dict[str, Any]]):
+        """Save many audit logs, one write per target file"""
+        self._append_log_records(self.audit_logs_file, audit_logs_data)
+
+    def get_audit_log(self, log_id: str) -> Optional[Dict[str, Any]]:
+        """Get audit log by log ID"""
+        file_path = self._find_log_file(self.audit_logs_file, log_id)
+        return self._get_record(file_path, log_id) if file_path else None
 
     def get_audit_logs(self, employee_id: str = None, action: str = None, 
                        start_date: datetime = None, end_date: datetime = None) -> List[Dict[str, Any]]:
         """Get audit logs with optional filtering"""
-        audit_logs = self._read_json_file(self.audit_logs_file)
         filtered_logs = []
         
-        for log in audit_logs:
-            # Filter by employee_id
-            if employee_id and log.get('employee_id') != employee_id:
-                continue
-            # Filter by action
-            if action and log.get('action') != action:
-                continue
-            # Filter by date range
-            if start_date or end_date:
-                log_timestamp = datetime.fromisoformat(log.get('timestamp', ''))
-                if start_date and log_timestamp < start_date:
+        with self._lock:
+            for file_path in reversed(self._log_files(self.audit_logs_file, start_date, end_date)):
+                if employee_id and self._skip_archive(self.audit_logs_file, file_path, employee_id):
                     continue
-                if end_date and log_timestamp > end_date:
+                collection = self._load_collection(file_path)
+                if employee_id:
+                    time_index = collection.grouped_time_index('employee_id').get(employee_id)
+                else:
+                    time_index = collection.time_index()
+                if time_index is None:
                     continue
-            filtered_logs.append(log)
+                
+                # Reverse range scan yields the logs newest first
+                for position in reversed(time_index.range(start_date, end_date)):
+                    log = collection.records[position]
+                    # Filter by action
+                    if action and log.get('action') != action:
+                        continue
+                    filtered_logs.append(self._copy_record(log))
         
-        # Sort by timestamp (newest first)
-        filtered_logs.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
         return filtered_logs
 
+    def iter_audit_logs(self, employee_id: str = None, action: str = None,
+                        start_date: datetime = None, end_date: datetime = None,
+                        filter: Optional[Callable[[Dict[str, Any]], bool]] = None
+                        ) -> Iterator[Dict[str, Any]]:
+        """Stream audit logs in storage (oldest first) order, parsing one record at a time"""
+        def matches(log: Dict[str, Any]) -> bool:
+            if employee_id and log.get('employee_id') != employee_id:
+                return False
+            if action and log.get('action') != action:
+                return False
+            return filter is None or filter(log)
+        
+        return self._iter_log_records(self.audit_logs_file, start_date, end_date, matches)
+
     def get_employee_audit_logs(self, employee_id: str) -> List[Dict[str, Any]]:
         """Get all audit logs for a specific employee"""
         return self.get_audit_logs(employee_id=employee_id)
     
-    # Backup and restore operations
-    def backup_database(self, backup_dir: str = "backup"):
-        """Create backup of all database files"""
-        os.makedirs(backup_dir, exist_ok=True)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    def _collection_files(self, name: str) -> List[str]:
+        """Data files of a collection by name"""
+        return {
+            'accounts': [self.accounts_file],
+            'customers': [self.customers_file],
+            'transactions': self._log_files(self.transactions_file),
+            'employees': [self.employees_file],
+            'audit_logs': self._log_files(self.audit_logs_file),
+        }[name]
+    
+    def get_collection_version(self, name: str) -> tuple:
+        """Identify the current on-disk version of a collection"""
+        return tuple((os.path.basename(file_path), self._file_signature(file_path))
+                     for file_path in self._collection_files(name))
+    
+    def snapshot(self, collections: Optional[Iterable[str]] = None) -> ReadSnapshot:
+        """Point-in-time, read-only view of collections for long reports
+        
+        Covers the named ``collections``, or all of them. Taken under the
+        write locks without parsing anything: a collection already cached
+        shares its record list copy-on-write (a writer copies the list the
+        first time it changes one a snapshot holds), and any other data
+        file is only opened, with its size noted, and read lazily. Readers
+        never block writers. Close the snapshot to release the files.
+        """
+        names = list(KEY_FIELDS) if collections is None else list(collections)
+        for name in names:
+            if name not in KEY_FIELDS:
+                raise ValueError(f"Unknown collection '{name}'")
+        
+        sources: Dict[str, List[Iterable[Dict[str, Any]]]] = {}
+        try:
+            with self._lock, self._process_lock:
+                for name in names:
+                    sources[name] = []
+                    for file_path in self._collection_files(name):
+                        sources[name].append(self._snapshot_source(file_path))
+                versions = {name: self.get_collection_version(name) for name in names}
+        except BaseException:
+            CollectionSnapshot(sources, KEY_FIELDS, {}).close()
+            raise
+        return CollectionSnapshot(sources, KEY_FIELDS, versions)
+    
+    def _snapshot_source(self, file_path: str) -> Iterable[Dict[str, Any]]:
+        """Records of a data file for a snapshot, shared from the cache or read lazily"""
+        cached = self._cache.get(file_path)
+        if cached is not None and cached.signature == self._file_signature(file_path):
+            return cached.share()
+        try:
+            fd = os.open(file_path, os.O_RDONLY)
+        except FileNotFoundError:
+            return []
+        return _FileSegment(file_path, fd, os.fstat(fd).st_size)
+    
+    def get_collection_metadata(self, name: str) -> Dict[str, Any]:
+        """Record count, byte size, timestamp range and last write of a collection
         
-        files_to_backup = [
-            (self.accounts_file, f"accounts_{timestamp}.json"),
-            (self.customers_file, f"customers_{timestamp}.json"),
-            (self.transactions_file, f"transactions_{timestamp}.json")
-        ]
+        Read from the metadata sidecars that every write keeps current, so
+        no data is parsed unless a sidecar is missing or stale.
+        """
+        summaries = []
+        for file_path in self._collection_files(name):
+            sidecar = MetadataSidecar(file_path)
+            metadata = sidecar.load(self._file_signature(file_path))
+            if metadata is None:
+                with self._lock, self._process_lock:
+                    signature = self._file_signature(file_path)
+                    if signature is None:
+                        continue
+                    summary = summarize_records(self._stream_records(file_path),
+                                                self._timestamp_field(file_path))
+                    metadata = sidecar.save(signature, summary)
+            summaries.append(metadata)
+        return combine_summaries(summaries)
+    
+    # Backup and restore operations
+    def _data_files(self) -> List[str]:
+        """Every file holding database state, partition manifests and segment indexes included"""
+        files = [os.path.join(self.data_dir, SCHEMA_VERSION_FILE),
+                 self.accounts_file, self.customers_file, self.employees_file]
+        for log_file in (self.transactions_file, self.audit_logs_file):
+            partitions = self._partitions.get(log_file)
+            if partitions is not None:
+                files.append(partitions.manifest_file)
+            for file_path in self._log_files(log_file):
+                files.append(file_path)
+                if partitions is not None and partitions.is_archived(file_path):
+                    files.append(partitions.index_file(file_path))
+        return files
+    
+    def backup_database(self, backup_dir: str = "backup") -> str:
+        """Create an incremental, compressed backup of every collection
         
-        for source_file, backup_name in files_to_backup:
-            if os.path.exists(source_file):
-                backup_path = os.path.join(backup_dir, backup_name)
-                with open(source_file, 'r') as src, open(backup_path, 'w') as dst:
-                    dst.write(src.read())
+        All data files are opened under the write locks, which fixes a
+        point-in-time view: rewrites replace files instead of modifying
+        them, and bytes appended after the recorded size are left out. The
+        copy itself then runs while writes continue. Files unchanged since
+        the previous backup in ``backup_dir`` (such as sealed partitions)
+        are hard-linked instead of copied. Returns the new backup set's path.
+        """
+        sources = []
+        try:
+            with self._lock, self._process_lock:
+                for file_path in self._data_files():
+                    try:
+                        source = open(file_path, 'rb')
+                    except FileNotFoundError:
+                        continue
+                    sources.append((file_path, source, os.fstat(source.fileno())))
+            
+            writer = BackupWriter(backup_dir)
+            try:
+                for file_path, source, stat in sources:
+                    relative_path = os.path.relpath(file_path, self.data_dir)
+                    signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+                    if not writer.link_unchanged(relative_path, signature):
+                        writer.add(relative_path, source, stat.st_size, signature)
+                backup_path = writer.commit()
+            except BaseException:
+                writer.abort()
+                raise
+        finally:
+            for _, source, _ in sources:
+                source.close()
         
-        print(f"Database backup created in {backup_dir}")
+        print(f"Database backup created in {backup_path}")
+        return backup_path
     
     def get_database_stats(self) -> Dict[str, int]:
         """Get database statistics"""
-        return {
-            'accounts': len(self.get_all_accounts()),
-            'customers': len(self.get_all_customers()),
-            'transactions': len(self.get_all_transactions())
-        } 
\ No newline at end of file
+        return {name: self.get_collection_metadata(name)['count']
+                for name in ('accounts', 'customers', 'transactions')} 
\ No newline at end of file
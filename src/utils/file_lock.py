@@ -0,0 +1,60 @@
+"""
+Inter-process file locking for Tobey Finance Bank
+"""
+
+import os
+import threading
+
+try:
+    import fcntl
+except ImportError:  # Windows has no fcntl; fall back to in-process locking
+    fcntl = None
+
+
+class FileLock:
+    """Reentrant advisory lock shared between processes
+
+    Uses ``fcntl.flock`` on a lock file so that several workers (e.g. WSGI
+    processes) serialize their read-modify-write cycles on the same data
+    directory. Within a process it behaves like an ``RLock``. On platforms
+    without ``fcntl`` only the in-process lock is taken.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._thread_lock = threading.RLock()
+        self._fd = None
+        self._depth = 0
+
+    def acquire(self):
+        """Acquire the lock, blocking until other processes release it"""
+        self._thread_lock.acquire()
+        if self._depth == 0 and fcntl is not None:
+            try:
+                self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+                fcntl.flock(self._fd, fcntl.LOCK_EX)
+            except BaseException:
+                if self._fd is not None:
+                    os.close(self._fd)
+                    self._fd = None
+                self._thread_lock.release()
+                raise
+        self._depth += 1
+
+    def release(self):
+        """Release one level of the lock"""
+        self._depth -= 1
+        if self._depth == 0 and self._fd is not None:
+            try:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            finally:
+                os.close(self._fd)
+                self._fd = None
+        self._thread_lock.release()
+
+    def __enter__(self) -> 'FileLock':
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
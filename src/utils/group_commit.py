@@ -0,0 +1,106 @@
+"""
+Group-commit writer for Tobey Finance Bank
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+
+class _PendingWrite:
+    """A submitted operation waiting for its batch to be committed"""
+
+    __slots__ = ('operation', 'done', 'result', 'error')
+
+    def __init__(self, operation: Any):
+        self.operation = operation
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class GroupCommitWriter:
+    """Background writer that coalesces concurrent writes into one commit
+
+    Callers submit an operation for a key (a data file) and block until it
+    is durable. Operations arriving within ``window`` seconds of each other
+    are handed to ``commit`` together, which applies them and persists the
+    result once; every caller in the batch is then acknowledged with its own
+    result, or with the error if the commit failed.
+    """
+
+    def __init__(self, commit: Callable[[str, List[Any]], List[Any]],
+                 window: float = 0.005, max_batch: int = 1000):
+        self.commit = commit
+        self.window = window
+        self.max_batch = max_batch
+        self._queue: Dict[str, List[_PendingWrite]] = {}
+        self._queued = 0
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def submit(self, key: str, operation: Any) -> Any:
+        """Queue an operation and wait until its batch has been committed"""
+        pending = _PendingWrite(operation)
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Group commit writer is closed")
+            self._queue.setdefault(key, []).append(pending)
+            self._queued += 1
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="group-commit-writer",
+                                                daemon=True)
+                self._thread.start()
+            self._condition.notify_all()
+
+        pending.done.wait()
+        if pending.error is not None:
+            raise pending.error
+        return pending.result
+
+    def close(self):
+        """Commit anything still queued and stop the background thread"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def _run(self):
+        """Collect batches and commit them until closed"""
+        while True:
+            with self._condition:
+                while not self._queue and not self._closed:
+                    self._condition.wait()
+                if not self._queue:
+                    return
+
+                # Give writes arriving within the window a chance to join
+                deadline = time.monotonic() + self.window
+                while not self._closed and self._queued < self.max_batch:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+
+                batch, self._queue = self._queue, {}
+                self._queued = 0
+
+            for key, pending_writes in batch.items():
+                self._commit_batch(key, pending_writes)
+
+    def _commit_batch(self, key: str, pending_writes: List[_PendingWrite]):
+        """Commit one key's batch and acknowledge every caller"""
+        try:
+            results = self.commit(key, [pending.operation for pending in pending_writes])
+        except BaseException as error:
+            for pending in pending_writes:
+                pending.error = error
+                pending.done.set()
+            return
+
+        for pending, result in zip(pending_writes, results):
+            pending.result = result
+            pending.done.set()
@@ -0,0 +1,355 @@
+"""
+In-memory database manager for Tobey Finance Bank
+"""
+
+import io
+import json
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from .backup import BackupWriter
+from .collection_metadata import summarize_records
+from .database import _CachedCollection, DatabaseManager
+from .read_snapshot import CollectionSnapshot, ReadSnapshot
+from .storage import KEY_FIELDS, StorageBackend
+from .time_index import parse_timestamp
+
+
+class InMemoryDatabaseManager(StorageBackend):
+    """Database manager that keeps every collection in process memory
+
+    Nothing is persisted, so benchmarks and tests can measure the services
+    without storage costs. Collections use the same indexed structure as
+    the JSON manager's cache, and records are copied on the way in and out
+    so callers never share stored data.
+    """
+
+    def __init__(self, data_dir: Optional[str] = None):
+        # No data directory: services skip on-disk snapshots for this backend
+        self.data_dir = data_dir
+        self._lock = threading.RLock()
+        self._collections: Dict[str, _CachedCollection] = {}
+        self._versions: Dict[str, int] = {}
+        self._last_writes: Dict[str, Optional[str]] = {}
+        self.initialize_database()
+
+    def initialize_database(self):
+        """Create any missing collections"""
+        with self._lock:
+            for name, key_field in KEY_FIELDS.items():
+                if name not in self._collections:
+                    self._collections[name] = _CachedCollection(None, [], key_field)
+                    self._versions[name] = 0
+                    self._last_writes[name] = None
+
+    def close(self):
+        """Nothing to flush"""
+
+    _copy_record = staticmethod(DatabaseManager._copy_record)
+
+    def _write(self, name: str, operation: Callable[[_CachedCollection], Any]) -> Any:
+        """Apply a write to a collection and bump its version"""
+        with self._lock:
+            result = operation(self._collections[name])
+            self._versions[name] += 1
+            self._last_writes[name] = datetime.now().isoformat()
+            return result
+
+    def _upsert_records(self, name: str, records: Iterable[Dict[str, Any]], insert: bool = True):
+        """Replace or append records by primary key"""
+        records = [self._copy_record(record) for record in records]
+
+        def upsert_all(collection: _CachedCollection):
+            for record in records:
+                collection.upsert(record, insert)
+        self._write(name, upsert_all)
+
+    def _append_records(self, name: str, records: Iterable[Dict[str, Any]]):
+        """Append records to a log collection"""
+        records = [self._copy_record(record) for record in records]
+
+        def append_all(collection: _CachedCollection):
+            for record in records:
+                collection.append(record)
+        self._write(name, append_all)
+
+    def _delete_record(self, name: str, key: Any) -> bool:
+        """Delete a record by primary key"""
+        return self._write(name, lambda collection: collection.delete(key))
+
+    def _get_record(self, name: str, key: Any) -> Optional[Dict[str, Any]]:
+        """Get a copy of a record by primary key"""
+        with self._lock:
+            return self._copy_record(self._collections[name].get(key))
+
+    def _get_all_records(self, name: str) -> List[Dict[str, Any]]:
+        """Get copies of every record in a collection"""
+        with self._lock:
+            return [self._copy_record(record) for record in self._collections[name].records]
+
+    def _iter_records(self, name: str, matches: Callable[[Dict[str, Any]], bool],
+                      start_date: Optional[datetime] = None,
+                      end_date: Optional[datetime] = None) -> Iterator[Dict[str, Any]]:
+        """Stream copies of matching records from a snapshot of the collection"""
+        with self._lock:
+            records = list(self._collections[name].records)
+        for record in records:
+            if start_date or end_date:
+                timestamp = parse_timestamp(record.get('timestamp'))
+                if start_date and timestamp < start_date:
+                    continue
+                if end_date and timestamp > end_date:
+                    continue
+            if matches(record):
+                yield self._copy_record(record)
+
+    # Account operations
+    def save_account(self, account_data: Dict[str, Any]):
+        """Save account to database"""
+        self._upsert_records('accounts', [account_data])
+
+    def save_accounts(self, accounts_data: Iterable[Dict[str, Any]]):
+        """Save many accounts in one write"""
+        self._upsert_records('accounts', accounts_data)
+
+    def get_account(self, account_number: str) -> Optional[Dict[str, Any]]:
+        """Get account by account number"""
+        return self._get_record('accounts', account_number)
+
+    def get_all_accounts(self) -> List[Dict[str, Any]]:
+        """Get all accounts"""
+        return self._get_all_records('accounts')
+
+    def iter_accounts(self, filter: Optional[Callable[[Dict[str, Any]], bool]] = None
+                      ) -> Iterator[Dict[str, Any]]:
+        """Stream accounts matching an optional predicate"""
+        return self._iter_records('accounts', lambda account: filter is None or filter(account))
+
+    def update_account(self, account_data: Dict[str, Any]):
+        """Update account in database"""
+        self.save_account(account_data)
+
+    def delete_account(self, account_number: str) -> bool:
+        """Delete account from database"""
+        return self._delete_record('accounts', account_number)
+
+    # Customer operations
+    def save_customer(self, customer_data: Dict[str, Any]):
+        """Save customer to database"""
+        self._upsert_records('customers', [customer_data])
+
+    def upsert_customers(self, customers_data: Iterable[Dict[str, Any]]):
+        """Save many customers in one write"""
+        self._upsert_records('customers', customers_data)
+
+    def get_customer(self, customer_id: str) -> Optional[Dict[str, Any]]:
+        """Get customer by customer ID"""
+        return self._get_record('customers', customer_id)
+
+    def get_all_customers(self) -> List[Dict[str, Any]]:
+        """Get all customers"""
+        return self._get_all_records('customers')
+
+    def iter_customers(self, filter: Optional[Callable[[Dict[str, Any]], bool]] = None
+                       ) -> Iterator[Dict[str, Any]]:
+        """Stream customers matching an optional predicate"""
+        return self._iter_records('customers', lambda customer: filter is None or filter(customer))
+
+    def update_customer(self, customer_data: Dict[str, Any]):
+        """Update customer in database"""
+        self.save_customer(customer_data)
+
+    def delete_customer(self, customer_id: str) -> bool:
+        """Delete customer from database"""
+        return self._delete_record('customers', customer_id)
+
+    # Transaction operations
+    def save_transaction(self, transaction_data: Dict[str, Any]):
+        """Save transaction to database"""
+        self._append_records('transactions', [transaction_data])
+
+    def save_transactions(self, transactions_data: Iterable[Dict[str, Any]]):
+        """Save many transactions in one write"""
+        self._append_records('transactions', transactions_data)
+
+    def get_transaction(self, transaction_id: str) -> Optional[Dict[str, Any]]:
+        """Get transaction by transaction ID"""
+        return self._get_record('transactions', transaction_id)
+
+    def get_all_transactions(self) -> List[Dict[str, Any]]:
+        """Get all transactions"""
+        return self._get_all_records('transactions')
+
+    def iter_transactions(self, filter: Optional[Callable[[Dict[str, Any]], bool]] = None,
+                          account_number: Optional[str] = None,
+                          start_date: Optional[datetime] = None,
+                          end_date: Optional[datetime] = None) -> Iterator[Dict[str, Any]]:
+        """Stream transactions in storage order"""
+        def matches(transaction: Dict[str, Any]) -> bool:
+            if account_number and transaction.get('account_number') != account_number:
+                return False
+            return filter is None or filter(transaction)
+        return self._iter_records('transactions', matches, start_date, end_date)
+
+    def get_account_transactions(self, account_number: str,
+                                 start_date: Optional[datetime] = None,
+                                 end_date: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """Get transactions for a specific account"""
+        with self._lock:
+            collection = self._collections['transactions']
+            account_index = collection.grouped_time_index('account_number').get(account_number)
+            if account_index is None:
+                return []
+            return [self._copy_record(collection.records[position])
+                    for position in account_index.range(start_date, end_date)]
+
+    def get_transactions_by_date_range(self, start_date: datetime,
+                                       end_date: datetime) -> List[Dict[str, Any]]:
+        """Get all transactions within a date range (newest first)"""
+        with self._lock:
+            collection = self._collections['transactions']
+            return [self._copy_record(collection.records[position])
+                    for position in reversed(collection.time_index().range(start_date, end_date))]
+
+    def get_recent_transactions(self, days: int = 30) -> List[Dict[str, Any]]:
+        """Get transactions from the last N days (newest first)"""
+        end_date = datetime.now()
+        return self.get_transactions_by_date_range(end_date - timedelta(days=days), end_date)
+
+    def update_transaction(self, transaction_data: Dict[str, Any]):
+        """Update transaction in database"""
+        self._upsert_records('transactions', [transaction_data], insert=False)
+
+    def delete_transaction(self, transaction_id: str) -> bool:
+        """Delete transaction from database"""
+        return self._delete_record('transactions', transaction_id)
+
+    # Employee operations
+    def save_employee(self, employee_data: Dict[str, Any]):
+        """Save employee to database"""
+        self._upsert_records('employees', [employee_data])
+
+    def save_employees(self, employees_data: Iterable[Dict[str, Any]]):
+        """Save many employees in one write"""
+        self._upsert_records('employees', employees_data)
+
+    def get_employee(self, employee_id: str) -> Optional[Dict[str, Any]]:
+        """Get employee by employee ID"""
+        return self._get_record('employees', employee_id)
+
+    def get_all_employees(self) -> List[Dict[str, Any]]:
+        """Get all employees"""
+        return self._get_all_records('employees')
+
+    def iter_employees(self, filter: Optional[Callable[[Dict[str, Any]], bool]] = None
+                       ) -> Iterator[Dict[str, Any]]:
+        """Stream employees matching an optional predicate"""
+        return self._iter_records('employees', lambda employee: filter is None or filter(employee))
+
+    def update_employee(self, employee_data: Dict[str, Any]):
+        """Update employee in database"""
+        self.save_employee(employee_data)
+
+    def delete_employee(self, employee_id: str) -> bool:
+        """Delete employee from database"""
+        return self._delete_record('employees', employee_id)
+
+    # Audit log operations
+    def save_audit_log(self, audit_log_data: Dict[str, Any]):
+        """Save audit log to database"""
+        self._append_records('audit_logs', [audit_log_data])
+
+    def save_audit_logs(self, audit_logs_data: Iterable[Dict[str, Any]]):
+        """Save many audit logs in one write"""
+        self._append_records('audit_logs', audit_logs_data)
+
+    def get_audit_log(self, log_id: str) -> Optional[Dict[str, Any]]:
+        """Get audit log by log ID"""
+        return self._get_record('audit_logs', log_id)
+
+    def get_audit_logs(self, employee_id: str = None, action: str = None,
+                       start_date: datetime = None, end_date: datetime = None) -> List[Dict[str, Any]]:
+        """Get audit logs with optional filtering (newest first)"""
+        with self._lock:
+            collection = self._collections['audit_logs']
+            if employee_id:
+                time_index = collection.grouped_time_index('employee_id').get(employee_id)
+            else:
+                time_index = collection.time_index()
+            if time_index is None:
+                return []
+            logs = (collection.records[position]
+                    for position in reversed(time_index.range(start_date, end_date)))
+            return [self._copy_record(log) for log in logs
+                    if not action or log.get('action') == action]
+
+    def iter_audit_logs(self, employee_id: str = None, action: str = None,
+                        start_date: datetime = None, end_date: datetime = None,
+                        filter: Optional[Callable[[Dict[str, Any]], bool]] = None
+                        ) -> Iterator[Dict[str, Any]]:
+        """Stream audit logs in storage (oldest first) order"""
+        def matches(log: Dict[str, Any]) -> bool:
+            if employee_id and log.get('employee_id') != employee_id:
+                return False
+            if action and log.get('action') != action:
+                return False
+            return filter is None or filter(log)
+        return self._iter_records('audit_logs', matches, start_date, end_date)
+
+    def get_employee_audit_logs(self, employee_id: str) -> List[Dict[str, Any]]:
+        """Get all audit logs for a specific employee"""
+        return self.get_audit_logs(employee_id=employee_id)
+
+    # Collection information
+    def get_collection_version(self, name: str) -> tuple:
+        """Identify the current version of a collection"""
+        with self._lock:
+            return (self._versions[name],)
+
+    def snapshot(self, collections: Optional[Iterable[str]] = None) -> ReadSnapshot:
+        """Point-in-time, read-only view of some or all collections"""
+        names = list(KEY_FIELDS) if collections is None else list(collections)
+        for name in names:
+            if name not in KEY_FIELDS:
+                raise ValueError(f"Unknown collection '{name}'")
+        with self._lock:
+            collections = {name: [self._collections[name].share()] for name in names}
+            versions = {name: (self._versions[name],) for name in names}
+        return CollectionSnapshot(collections, KEY_FIELDS, versions)
+
+    def get_collection_metadata(self, name: str) -> Dict[str, Any]:
+        """Record count, timestamp range and last write of a collection
+
+        Nothing is stored on disk, so ``bytes`` is always 0.
+        """
+        timestamp_field = 'timestamp' if name in ('transactions', 'audit_logs') else 'created_date'
+        with self._lock:
+            summary = summarize_records(self._collections[name].records, timestamp_field)
+            summary.update(bytes=0, last_write=self._last_writes[name])
+            return summary
+
+    def get_database_stats(self) -> Dict[str, int]:
+        """Get database statistics"""
+        with self._lock:
+            return {name: len(self._collections[name].records)
+                    for name in ('accounts', 'customers', 'transactions')}
+
+    # Backup and restore operations
+    def backup_database(self, backup_dir: str = "backup") -> str:
+        """Write every collection to a compressed JSON backup set"""
+        with self._lock:
+            contents = {name: json.dumps(collection.records, indent=2, default=str).encode()
+                        for name, collection in self._collections.items()}
+
+        writer = BackupWriter(backup_dir)
+        try:
+            for name, content in contents.items():
+                writer.add(f"{name}.json", io.BytesIO(content), len(content), None)
+            backup_path = writer.commit()
+        except BaseException:
+            writer.abort()
+            raise
+
+        print(f"Database backup created in {backup_path}")
+        return backup_path
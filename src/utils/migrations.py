@@ -0,0 +1,227 @@
+"""
+Streaming data directory migrations for Tobey Finance Bank
+
+Usage::
+
+    python -m src.utils.migrations data data_sqlite --from json --to sqlite
+"""
+
+import argparse
+import json
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Dict, List, Optional
+
+from .backends import available_backends, create_database_manager
+from .schema import (LEGACY_SCHEMA_VERSION, MIGRATIONS, Migration, SchemaVersionError,
+                     read_schema_version, write_schema_version)
+from .storage import KEY_FIELDS, StorageBackend
+
+# Stream, batch write and key lookup methods of each collection
+COLLECTION_METHODS = {
+    'accounts': ('iter_accounts', 'save_accounts', 'get_account'),
+    'customers': ('iter_customers', 'upsert_customers', 'get_customer'),
+    'transactions': ('iter_transactions', 'save_transactions', 'get_transaction'),
+    'employees': ('iter_employees', 'save_employees', 'get_employee'),
+    'audit_logs': ('iter_audit_logs', 'save_audit_logs', 'get_audit_log'),
+}
+
+CHECKPOINT_DIR = ".migration"
+
+
+class MigrationRunner:
+    """Copies a data directory into a new one at the current schema version
+
+    Records are streamed from the source one at a time, passed through
+    every pending ``Migration`` and written to the target backend in
+    batches of ``batch_size``, with each collection migrated in its own
+    thread. The source and target may use different backends, so the same
+    runner converts between storage formats.
+
+    The work happens in a staging directory (``<target_dir>.partial``)
+    that is renamed to ``target_dir`` once every collection is done, so a
+    half-migrated directory is never mistaken for a finished one. A
+    partitioned target leaves every month open while records arrive in
+    source order, and seals (and archives) closed months once at the end,
+    rather than reopening a month each time one of its records follows a
+    later month's. After
+    each batch the number of source records done is checkpointed in the
+    staging directory, and running the migration again resumes from there.
+    Records of the one batch that may have been written without being
+    checkpointed are skipped by primary key. The source must not be
+    written while a migration runs; resuming refuses if it was.
+    """
+
+    def __init__(self, source_dir: str, target_dir: str, source_backend: str = "json",
+                 target_backend: str = "json", source_options: Optional[Dict[str, Any]] = None,
+                 target_options: Optional[Dict[str, Any]] = None, batch_size: int = 10000,
+                 workers: Optional[int] = None):
+        self.source_dir = source_dir
+        self.target_dir = target_dir
+        self.source_backend = source_backend
+        self.target_backend = target_backend
+        self.source_options = source_options or {}
+        self.target_options = target_options or {}
+        self.batch_size = batch_size
+        self.workers = workers or len(KEY_FIELDS)
+        self.staging_dir = target_dir.rstrip(os.sep) + ".partial"
+        self.checkpoint_dir = os.path.join(self.staging_dir, CHECKPOINT_DIR)
+
+    def source_version(self) -> int:
+        """Schema version of the source data"""
+        version = read_schema_version(self.source_dir)
+        return LEGACY_SCHEMA_VERSION if version is None else version
+
+    def pending_migrations(self) -> List[Migration]:
+        """Migrations to apply to the source data, oldest first"""
+        source_version = self.source_version()
+        if source_version > MIGRATIONS[-1].version:
+            raise SchemaVersionError(
+                f"Data in {self.source_dir} is at schema version {source_version}, "
+                f"which is newer than this release supports.")
+        return [migration for migration in MIGRATIONS if migration.version > source_version]
+
+    def _checkpoint_path(self, name: str) -> str:
+        return os.path.join(self.checkpoint_dir, f"{name}.json")
+
+    def _read_checkpoint(self, name: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._checkpoint_path(name), 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def _write_checkpoint(self, name: str, checkpoint: Dict[str, Any]):
+        """Atomically replace a checkpoint file"""
+        path = self._checkpoint_path(name)
+        temp_path = path + ".tmp"
+        with open(temp_path, 'w') as f:
+            json.dump(checkpoint, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+
+    def _loading_options(self) -> Dict[str, Any]:
+        """Target options for the copy, keeping partitions open until it is done"""
+        if self.target_options.get('partition_logs'):
+            return dict(self.target_options, seal_partitions=False)
+        return self.target_options
+
+    def _source_state(self, source: StorageBackend) -> Dict[str, Any]:
+        """Fingerprint of the source collections, to detect writes between runs"""
+        state = {name: source.get_collection_metadata(name) for name in KEY_FIELDS}
+        return json.loads(json.dumps(state, default=str))
+
+    def run(self) -> str:
+        """Migrate every collection, resuming an interrupted run, and return the target path"""
+        if os.path.exists(self.target_dir):
+            raise ValueError(f"Migration target {self.target_dir} already exists")
+        migrations = self.pending_migrations()
+        resuming = os.path.isdir(self.checkpoint_dir)
+
+        source = create_database_manager(self.source_backend, self.source_dir, **self.source_options)
+        target = None
+        try:
+            source_state = self._source_state(source)
+            if resuming:
+                started = self._read_checkpoint("source")
+                if started is None or started['state'] != source_state:
+                    raise RuntimeError(f"{self.source_dir} changed since the migration started; "
+                                       f"delete {self.staging_dir} to start over")
+            else:
+                os.makedirs(self.staging_dir, exist_ok=True)
+            target = create_database_manager(self.target_backend, self.staging_dir,
+                                             **self._loading_options())
+            if not resuming:
+                target.initialize_database()
+                os.makedirs(self.checkpoint_dir)
+                self._write_checkpoint("source", {'state': source_state})
+
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                futures = {name: executor.submit(self._migrate_collection, name, source, target,
+                                                 migrations)
+                           for name in KEY_FIELDS}
+                for name, future in futures.items():
+                    print(f"Migrated {future.result()} {name}")
+        finally:
+            source.close()
+            if target is not None:
+                target.close()
+
+        # Seals and archives the closed partitions in one pass
+        target = create_database_manager(self.target_backend, self.staging_dir, **self.target_options)
+        try:
+            target.initialize_database()
+        finally:
+            target.close()
+
+        write_schema_version(self.staging_dir, MIGRATIONS[-1].version)
+        shutil.rmtree(self.checkpoint_dir)
+        os.replace(self.staging_dir, self.target_dir)
+        print(f"Migration to schema version {MIGRATIONS[-1].version} created in {self.target_dir}")
+        return self.target_dir
+
+    def _migrate_collection(self, name: str, source: StorageBackend, target: StorageBackend,
+                            migrations: List[Migration]) -> int:
+        """Stream one collection into the target from its checkpoint; returns records done"""
+        iter_method, save_method, get_method = COLLECTION_METHODS[name]
+        checkpoint = self._read_checkpoint(name) or {'done': 0}
+        done = checkpoint['done']
+        records = islice(getattr(source, iter_method)(), done, None)
+        save = getattr(target, save_method)
+        get = getattr(target, get_method)
+        key_field = KEY_FIELDS[name]
+
+        first_batch = True
+        while True:
+            batch = list(islice(records, self.batch_size))
+            if not batch:
+                return done
+            migrated = []
+            for record in batch:
+                for migration in migrations:
+                    record = migration.apply(name, record)
+                migrated.append(record)
+            if first_batch:
+                # May already have been written by a run interrupted before its checkpoint
+                migrated = [record for record in migrated if get(record.get(key_field)) is None]
+                first_batch = False
+            if migrated:
+                save(migrated)
+            done += len(batch)
+            self._write_checkpoint(name, {'done': done})
+
+
+def main(argv: Optional[List[str]] = None):
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Migrate a data directory to the current "
+                                                 "schema version and/or another storage backend")
+    parser.add_argument("source_dir")
+    parser.add_argument("target_dir")
+    parser.add_argument("--from", dest="source_backend", default="json", choices=available_backends())
+    parser.add_argument("--to", dest="target_backend", default="json", choices=available_backends())
+    parser.add_argument("--batch-size", type=int, default=10000)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--source-partition-logs", action="store_true",
+                        help="Read the source's logs from monthly partitions (json/jsonl sources)")
+    parser.add_argument("--partition-logs", action="store_true",
+                        help="Partition the target's logs by month (json/jsonl targets)")
+    parser.add_argument("--archive-format", choices=["gzip", "lzma"],
+                        help="Compress the target's closed partitions (json/jsonl targets)")
+    args = parser.parse_args(argv)
+
+    source_options = {'partition_logs': True} if args.source_partition_logs else {}
+    target_options: Dict[str, Any] = {}
+    if args.partition_logs:
+        target_options['partition_logs'] = True
+    if args.archive_format:
+        target_options['archive_format'] = args.archive_format
+    MigrationRunner(args.source_dir, args.target_dir, args.source_backend, args.target_backend,
+                    source_options=source_options, target_options=target_options, batch_size=args.batch_size,
+                    workers=args.workers).run()
+
+
+if __name__ == "__main__":
+    main()
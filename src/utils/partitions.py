@@ -0,0 +1,256 @@
+"""
+Monthly partitioning of time-ordered collections for Tobey Finance Bank
+"""
+
+import gzip
+import json
+import lzma
+import os
+import re
+import tempfile
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+
+class MonthlyPartitions:
+    """Monthly segment files of a time-ordered collection
+
+    Records live in one file per calendar month (``2024-01.json``) inside
+    the collection's directory. Months before the current one can be sealed:
+    sealed partitions are listed in ``manifest.json`` and made read-only, so
+    they can be archived. A late or corrected record reopens its month,
+    which stays writable until the next ``seal_closed``.
+    
+    Sealed partitions can be archived into compact, compressed JSONL
+    (``2024-01.jsonl.gz`` or ``.jsonl.xz``) with a small index next to them
+    (``.2024-01.index.json``) holding the record count, timestamp range
+    and the distinct values of one lookup field.
+    """
+
+    MANIFEST_NAME = "manifest.json"
+    ARCHIVE_FORMATS = {'gzip': (".jsonl.gz", gzip.open), 'lzma': (".jsonl.xz", lzma.open)}
+    _MONTH_PATTERN = re.compile(r"^(\d{4})-(\d{2})$")
+
+    def __init__(self, directory: str, extension: str):
+        self.directory = directory
+        self.extension = extension
+        self.manifest_file = os.path.join(directory, self.MANIFEST_NAME)
+        self._sealed: Set[str] = set()
+        self._manifest_signature: Optional[tuple] = None
+        self._segment_indexes: Dict[str, tuple] = {}
+
+    @staticmethod
+    def month_of(timestamp: datetime) -> str:
+        """Partition name for a timestamp"""
+        return f"{timestamp.year:04d}-{timestamp.month:02d}"
+
+    @staticmethod
+    def month_bounds(month: str) -> tuple:
+        """First instant of a month and of the month after it"""
+        year, month_number = int(month[:4]), int(month[5:7])
+        start = datetime(year, month_number, 1)
+        if month_number == 12:
+            return start, datetime(year + 1, 1, 1)
+        return start, datetime(year, month_number + 1, 1)
+
+    def path_for(self, timestamp: datetime) -> str:
+        """Partition file holding records with this timestamp"""
+        return os.path.join(self.directory, self.month_of(timestamp) + self.extension)
+
+    def month_of_path(self, path: str) -> Optional[str]:
+        """Partition name of a partition or archive file, or None for other files"""
+        name = os.path.basename(path)
+        for extension in (self.extension, *(suffix for suffix, _ in self.ARCHIVE_FORMATS.values())):
+            if name.endswith(extension):
+                month = name[:-len(extension)]
+                return month if self._MONTH_PATTERN.match(month) else None
+        return None
+
+    @classmethod
+    def archive_opener(cls, path: str):
+        """Decompressing ``open`` for an archived partition, or None"""
+        for suffix, opener in cls.ARCHIVE_FORMATS.values():
+            if path.endswith(suffix):
+                return opener
+        return None
+
+    def _files_by_month(self) -> Dict[str, str]:
+        """Current file of every partition, preferring a live file to its archive"""
+        try:
+            names = sorted(os.listdir(self.directory))
+        except FileNotFoundError:
+            return {}
+        files: Dict[str, str] = {}
+        for name in names:
+            month = self.month_of_path(name)
+            if month and (month not in files or name == month + self.extension):
+                files[month] = os.path.join(self.directory, name)
+        return files
+
+    def months(self) -> List[str]:
+        """All partition names, oldest first"""
+        return sorted(self._files_by_month())
+
+    def paths(self, start: Optional[datetime] = None,
+              end: Optional[datetime] = None) -> List[str]:
+        """Partition files overlapping [start, end], oldest first"""
+        paths = []
+        for month, path in sorted(self._files_by_month().items()):
+            month_start, month_end = self.month_bounds(month)
+            if start is not None and start >= month_end:
+                continue
+            if end is not None and end < month_start:
+                continue
+            paths.append(path)
+        return paths
+
+    def sealed(self) -> Set[str]:
+        """Names of sealed partitions, re-read when the manifest changes"""
+        try:
+            stat = os.stat(self.manifest_file)
+            signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        except FileNotFoundError:
+            return self._sealed
+        if signature != self._manifest_signature:
+            with open(self.manifest_file, 'r') as f:
+                self._sealed = set(json.load(f).get('sealed', []))
+            self._manifest_signature = signature
+        return self._sealed
+
+    def is_sealed(self, path: str) -> bool:
+        """Check whether a partition file is closed for writes"""
+        return self.month_of_path(path) in self.sealed()
+
+    def seal_closed(self, now: Optional[datetime] = None) -> List[str]:
+        """Seal every partition older than the current month"""
+        current_month = self.month_of(now or datetime.now())
+        sealed = set(self.sealed())
+        newly_sealed = [month for month in self.months()
+                        if month < current_month and month not in sealed]
+        if not newly_sealed:
+            return []
+
+        for month in newly_sealed:
+            path = os.path.join(self.directory, month + self.extension)
+            if os.path.exists(path):
+                os.chmod(path, 0o444)
+        self._write_manifest(sealed.union(newly_sealed))
+        return newly_sealed
+
+    def reopen(self, month: str):
+        """Take a sealed partition back for writes, dropping its archive
+
+        The live file must already hold the partition's records (callers
+        restore it from the archive first); it is made writable and the
+        archive and its index are removed, in that order, so a crash leaves
+        the live file in charge.
+        """
+        live_path = os.path.join(self.directory, month + self.extension)
+        if os.path.exists(live_path):
+            os.chmod(live_path, 0o644)
+        sealed = self.sealed()
+        if month in sealed:
+            self._write_manifest(sealed - {month})
+        for suffix, _ in self.ARCHIVE_FORMATS.values():
+            archive_path = os.path.join(self.directory, month + suffix)
+            if os.path.exists(archive_path):
+                os.remove(archive_path)
+        if os.path.exists(self._index_path(month)):
+            os.remove(self._index_path(month))
+
+    def is_archived(self, path: str) -> bool:
+        """Check whether a partition file is a compressed archive"""
+        return self.archive_opener(path) is not None
+
+    def _index_path(self, month: str) -> str:
+        return os.path.join(self.directory, f".{month}.index.json")
+
+    def index_file(self, path: str) -> str:
+        """Segment index file that belongs with an archived partition"""
+        return self._index_path(self.month_of_path(path))
+
+    def archive(self, month: str, records: Iterable[Dict[str, Any]], archive_format: str,
+                index_field: str, timestamp_field: str = 'timestamp') -> str:
+        """Compress a sealed partition into an archive and drop the live file
+
+        The archive and its index are written to temporary files and renamed
+        into place before the live file is removed, so a crash leaves either
+        file complete; a leftover live file simply takes precedence.
+        """
+        suffix, opener = self.ARCHIVE_FORMATS[archive_format]
+        archive_path = os.path.join(self.directory, month + suffix)
+        values: Set[Any] = set()
+        count = 0
+        earliest = latest = None
+
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, prefix=f".{month}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as raw:
+                with opener(raw, 'wt') as f:
+                    for record in records:
+                        f.write(json.dumps(record, default=str, separators=(",", ":")) + "\n")
+                        count += 1
+                        values.add(record.get(index_field))
+                        timestamp = record.get(timestamp_field)
+                        if timestamp is not None:
+                            earliest = timestamp if earliest is None else min(earliest, timestamp)
+                            latest = timestamp if latest is None else max(latest, timestamp)
+                raw.flush()
+                os.fsync(raw.fileno())
+            os.chmod(temp_path, 0o444)
+            os.replace(temp_path, archive_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        index = {'count': count, 'min_timestamp': earliest, 'max_timestamp': latest,
+                 'field': index_field, 'values': sorted(values, key=str)}
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, prefix=f".{month}.", suffix=".tmp")
+        with os.fdopen(fd, 'w') as f:
+            json.dump(index, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self._index_path(month))
+
+        live_path = os.path.join(self.directory, month + self.extension)
+        if os.path.exists(live_path):
+            os.remove(live_path)
+        return archive_path
+
+    def segment_index(self, path: str) -> Optional[Dict[str, Any]]:
+        """Index of an archived partition, or None if it has none
+        
+        Each index is read once per version of its file (a reopened month
+        is archived again with a new one); its ``values`` are returned as a
+        set.
+        """
+        month = self.month_of_path(path)
+        index_path = self._index_path(month)
+        try:
+            stat = os.stat(index_path)
+        except FileNotFoundError:
+            return None
+        signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        cached = self._segment_indexes.get(month)
+        if cached is None or cached[0] != signature:
+            try:
+                with open(index_path, 'r') as f:
+                    index = json.load(f)
+            except (FileNotFoundError, ValueError):
+                return None
+            index['values'] = set(index['values'])
+            cached = self._segment_indexes[month] = (signature, index)
+        return cached[1]
+
+    def _write_manifest(self, sealed: Set[str]):
+        """Atomically replace the manifest"""
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, prefix=".manifest.", suffix=".tmp")
+        with os.fdopen(fd, 'w') as f:
+            json.dump({'sealed': sorted(sealed)}, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, self.manifest_file)
+        self._sealed = set(sealed)
+        self._manifest_signature = None
@@ -0,0 +1,194 @@
+"""
+Point-in-time read snapshots for Tobey Finance Bank
+"""
+
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from .time_index import parse_timestamp
+
+RecordFilter = Optional[Callable[[Dict[str, Any]], bool]]
+
+
+class ReadSnapshot:
+    """Read-only view of every collection as of one moment
+
+    Obtained from a database manager's ``snapshot()``. Reads see the
+    collections exactly as they were when the snapshot was taken, however
+    long they run and whatever is written meanwhile, and taking or reading
+    a snapshot never blocks writers. ``versions`` holds each collection's
+    version at that moment. Release the snapshot with ``close`` (or use it
+    as a context manager) once the report is done.
+    """
+
+    def __init__(self, versions: Dict[str, tuple]):
+        self.versions = versions
+
+    def _segments(self, name: str) -> Sequence[Iterable[Dict[str, Any]]]:
+        """Record sources of a collection, oldest first; overridden per backend
+
+        A time-partitioned collection has one per partition, so segments
+        cover disjoint time ranges. Each is read in storage order.
+        """
+        raise NotImplementedError
+
+    def _iter_collection(self, name: str) -> Iterator[Dict[str, Any]]:
+        """Records of a collection in storage order"""
+        for segment in self._segments(name):
+            yield from segment
+
+    def _get_record(self, name: str, key: Any) -> Optional[Dict[str, Any]]:
+        """Record of a collection by primary key; overridden per backend"""
+        raise NotImplementedError
+
+    def close(self):
+        """Release the snapshot; closing it again does nothing"""
+
+    def __enter__(self) -> 'ReadSnapshot':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @staticmethod
+    def _copy(record: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Copy a record so callers cannot mutate the snapshot"""
+        if record is None:
+            return None
+        return {key: value.copy() if isinstance(value, (list, dict)) else value
+                for key, value in record.items()}
+
+    @staticmethod
+    def _timestamp(record: Dict[str, Any]) -> datetime:
+        """Sort key of a record in time"""
+        return parse_timestamp(record.get('timestamp'))
+
+    def _iter(self, name: str, matches: RecordFilter = None,
+              start_date: Optional[datetime] = None,
+              end_date: Optional[datetime] = None,
+              newest_first: bool = False) -> Iterator[Dict[str, Any]]:
+        """Stream copies of matching records, optionally within a date range
+
+        ``newest_first`` orders them by descending timestamp, holding one
+        segment's matches in memory at a time.
+        """
+        def selected(records: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+            for record in records:
+                if start_date or end_date:
+                    timestamp = self._timestamp(record)
+                    if start_date and timestamp < start_date:
+                        continue
+                    if end_date and timestamp > end_date:
+                        continue
+                if matches is None or matches(record):
+                    yield record
+
+        segments = self._segments(name)
+        if newest_first:
+            # Segments cover disjoint time ranges, so sorting each in turn orders them all
+            for segment in reversed(segments):
+                for record in sorted(selected(segment), key=self._timestamp, reverse=True):
+                    yield self._copy(record)
+        else:
+            for segment in segments:
+                for record in selected(segment):
+                    yield self._copy(record)
+
+    def get_account(self, account_number: str) -> Optional[Dict[str, Any]]:
+        """Get account by account number"""
+        return self._copy(self._get_record('accounts', account_number))
+
+    def iter_accounts(self, filter: RecordFilter = None) -> Iterator[Dict[str, Any]]:
+        """Stream accounts matching an optional predicate"""
+        return self._iter('accounts', filter)
+
+    def get_customer(self, customer_id: str) -> Optional[Dict[str, Any]]:
+        """Get customer by customer ID"""
+        return self._copy(self._get_record('customers', customer_id))
+
+    def iter_customers(self, filter: RecordFilter = None) -> Iterator[Dict[str, Any]]:
+        """Stream customers matching an optional predicate"""
+        return self._iter('customers', filter)
+
+    def get_transaction(self, transaction_id: str) -> Optional[Dict[str, Any]]:
+        """Get transaction by transaction ID"""
+        return self._copy(self._get_record('transactions', transaction_id))
+
+    def iter_transactions(self, filter: RecordFilter = None,
+                          account_number: Optional[str] = None,
+                          start_date: Optional[datetime] = None,
+                          end_date: Optional[datetime] = None) -> Iterator[Dict[str, Any]]:
+        """Stream transactions in storage order"""
+        def matches(transaction: Dict[str, Any]) -> bool:
+            if account_number and transaction.get('account_number') != account_number:
+                return False
+            return filter is None or filter(transaction)
+        return self._iter('transactions', matches, start_date, end_date)
+
+    def get_employee(self, employee_id: str) -> Optional[Dict[str, Any]]:
+        """Get employee by employee ID"""
+        return self._copy(self._get_record('employees', employee_id))
+
+    def iter_employees(self, filter: RecordFilter = None) -> Iterator[Dict[str, Any]]:
+        """Stream employees matching an optional predicate"""
+        return self._iter('employees', filter)
+
+    def get_audit_log(self, log_id: str) -> Optional[Dict[str, Any]]:
+        """Get audit log by log ID"""
+        return self._copy(self._get_record('audit_logs', log_id))
+
+    def iter_audit_logs(self, employee_id: str = None, action: str = None,
+                        start_date: datetime = None, end_date: datetime = None,
+                        filter: RecordFilter = None,
+                        newest_first: bool = False) -> Iterator[Dict[str, Any]]:
+        """Stream audit logs in storage (oldest first) order, or newest first"""
+        def matches(log: Dict[str, Any]) -> bool:
+            if employee_id and log.get('employee_id') != employee_id:
+                return False
+            if action and log.get('action') != action:
+                return False
+            return filter is None or filter(log)
+        return self._iter('audit_logs', matches, start_date, end_date, newest_first)
+
+
+class CollectionSnapshot(ReadSnapshot):
+    """Snapshot over fixed record sources of some collections
+
+    A source is either a record list shared copy-on-write with a live
+    cache, or a lazily read segment of a data file with a ``close`` method.
+    Shared lists are never modified once handed out: the owning collection
+    copies its list before its next write. Record dictionaries are only
+    ever replaced, never changed in place, so sharing them is safe too.
+    """
+
+    def __init__(self, collections: Dict[str, List[Iterable[Dict[str, Any]]]],
+                 key_fields: Dict[str, str], versions: Dict[str, tuple]):
+        super().__init__(versions)
+        self._collections = collections
+        self._key_fields = key_fields
+        self._indexes: Dict[str, Dict[Any, Dict[str, Any]]] = {}
+
+    def _segments(self, name: str) -> Sequence[Iterable[Dict[str, Any]]]:
+        try:
+            return self._collections[name]
+        except KeyError:
+            raise ValueError(f"Collection '{name}' is not in this snapshot") from None
+
+    def _get_record(self, name: str, key: Any) -> Optional[Dict[str, Any]]:
+        if name not in self._indexes:
+            # Built on first lookup; the first occurrence of a key wins
+            index: Dict[Any, Dict[str, Any]] = {}
+            key_field = self._key_fields[name]
+            for record in self._iter_collection(name):
+                index.setdefault(record.get(key_field), record)
+            self._indexes[name] = index
+        return self._indexes[name].get(key)
+
+    def close(self):
+        for sources in self._collections.values():
+            for source in sources:
+                close = getattr(source, 'close', None)
+                if close is not None:
+                    close()
+        self._collections = {name: [] for name in self._collections}
+        self._indexes.clear()
@@ -0,0 +1,104 @@
+"""
+Data directory schema versions for Tobey Finance Bank
+"""
+
+import json
+import os
+import tempfile
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+SCHEMA_VERSION_FILE = "schema_version.json"
+
+# Version of data directories created before versions were recorded
+LEGACY_SCHEMA_VERSION = 1
+
+RecordTransform = Callable[[Dict[str, Any]], Dict[str, Any]]
+
+
+class SchemaVersionError(RuntimeError):
+    """Raised when a data directory's schema version does not match the code"""
+
+
+class Migration:
+    """One schema version step, as per-record transforms of each collection
+
+    ``transforms`` maps collection names to functions taking a record as
+    stored at the previous version and returning it at this version.
+    Collections without a transform are copied unchanged.
+    """
+
+    def __init__(self, version: int, description: str,
+                 transforms: Optional[Dict[str, RecordTransform]] = None):
+        self.version = version
+        self.description = description
+        self.transforms = transforms or {}
+
+    def apply(self, collection: str, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Bring one record of a collection up to this version"""
+        transform = self.transforms.get(collection)
+        return transform(record) if transform else record
+
+
+# Every schema version, oldest first; append a Migration to change the schema
+MIGRATIONS: List[Migration] = [
+    Migration(1, "Initial schema"),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1].version
+
+
+def read_schema_version(data_dir: str) -> Optional[int]:
+    """Schema version recorded in a data directory, or None if none is
+
+    Raises SchemaVersionError if the version file cannot be understood.
+    """
+    path = os.path.join(data_dir, SCHEMA_VERSION_FILE)
+    try:
+        with open(path, 'r') as f:
+            return int(json.load(f)['version'])
+    except FileNotFoundError:
+        return None
+    except (ValueError, KeyError, TypeError) as e:
+        raise SchemaVersionError(f"Unreadable schema version file {path}: {e}") from e
+
+
+def write_schema_version(data_dir: str, version: int):
+    """Atomically record the schema version of a data directory"""
+    fd, temp_path = tempfile.mkstemp(dir=data_dir, prefix=".schema.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump({'version': version, 'updated': datetime.now().isoformat()}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, os.path.join(data_dir, SCHEMA_VERSION_FILE))
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def check_schema_version(data_dir: str, has_data: bool) -> int:
+    """Verify a data directory matches the code's schema, recording it if new
+
+    A directory holding data but no recorded version predates versioning
+    and counts as ``LEGACY_SCHEMA_VERSION``. Raises SchemaVersionError if
+    the data needs migrating, or was written by a newer release.
+    """
+    version = read_schema_version(data_dir)
+    recorded = version is not None
+    if version is None:
+        version = LEGACY_SCHEMA_VERSION if has_data else SCHEMA_VERSION
+
+    if version < SCHEMA_VERSION:
+        raise SchemaVersionError(
+            f"Data in {data_dir} is at schema version {version}, but this release needs "
+            f"version {SCHEMA_VERSION}. Run 'python -m src.utils.migrations' to migrate it.")
+    if version > SCHEMA_VERSION:
+        raise SchemaVersionError(
+            f"Data in {data_dir} is at schema version {version}, which is newer than "
+            f"this release supports (version {SCHEMA_VERSION}).")
+
+    if not recorded:
+        write_schema_version(data_dir, version)
+    return version
@@ -0,0 +1,166 @@
+"""
+Binary snapshots of service state for Tobey Finance Bank
+"""
+
+import gc
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import Any, Optional
+
+
+class SnapshotStore:
+    """Checksummed binary snapshots of in-memory service state
+
+    A snapshot records the version of the collection it was built from (as
+    reported by the database manager's ``get_collection_version``); it is
+    only restored while that version is unchanged. Snapshots with a bad
+    header, checksum or version are ignored so callers fall back to loading
+    from the database. Snapshots are pickles and must only be read from a
+    trusted data directory.
+    """
+
+    # Version 2: model amounts are Money, so older snapshots are rebuilt
+    MAGIC = b"TFBSNAP2"
+    DIGEST_SIZE = 16
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def _path(self, name: str) -> str:
+        """Snapshot file for a collection name"""
+        return os.path.join(self.directory, f"{name}.snapshot")
+
+    def save(self, name: str, version: Any, state: Any):
+        """Atomically write a snapshot of state for a collection version"""
+        os.makedirs(self.directory, exist_ok=True)
+        body = pickle.dumps((version, state), protocol=pickle.HIGHEST_PROTOCOL)
+        checksum = hashlib.blake2b(body, digest_size=self.DIGEST_SIZE).digest()
+
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, prefix=f".{name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(self.MAGIC)
+                f.write(checksum)
+                f.write(body)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self._path(name))
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def load(self, name: str, version: Any) -> Optional[Any]:
+        """Restore state if a valid snapshot exists for this exact version"""
+        try:
+            with open(self._path(name), 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+
+        header_size = len(self.MAGIC) + self.DIGEST_SIZE
+        if len(data) < header_size or not data.startswith(self.MAGIC):
+            return None
+        checksum = data[len(self.MAGIC):header_size]
+        body = data[header_size:]
+        if hashlib.blake2b(body, digest_size=self.DIGEST_SIZE).digest() != checksum:
+            return None
+
+        # Unpickling allocates many objects at once; pause the cyclic GC
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            stored_version, state = pickle.loads(body)
+        except Exception:
+            return None
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        return state if stored_version == version else None
+
+
+class TrackedVersion:
+    """Collection version that a service's in-memory state matches
+
+    Set with ``track`` before the state is loaded, and carried forward by
+    ``writing`` around each of the service's own writes to the collection.
+    If anything else wrote in between, or a write failed, the state matches
+    no version any more and ``version`` becomes None until the next
+    ``track``. ``invalidate`` does the same for changes a service makes
+    only in memory.
+    """
+
+    def __init__(self, database_manager, collection: str):
+        self.db = database_manager
+        self.collection = collection
+        self.version: Optional[Any] = None
+        self._lock = threading.Lock()
+
+    def current(self) -> Optional[Any]:
+        """Current version of the collection, if the database tracks one"""
+        get_version = getattr(self.db, 'get_collection_version', None)
+        return get_version(self.collection) if get_version else None
+
+    def track(self) -> Optional[Any]:
+        """Take the current version as the one the state is loaded from"""
+        with self._lock:
+            self.version = self.current()
+            return self.version
+
+    def invalidate(self):
+        """Mark the state as matching no version of the collection"""
+        with self._lock:
+            self.version = None
+
+    def in_sync(self) -> bool:
+        """Whether the state matches the current version of the collection"""
+        version = self.version
+        return version is not None and version == self.current()
+
+    @contextmanager
+    def writing(self):
+        """Carry the version across one write made by the service"""
+        before = self.current()
+        try:
+            yield
+        except BaseException:
+            self.invalidate()
+            raise
+        after = self.current()
+        with self._lock:
+            self.version = after if self.version is not None and self.version == before else None
+
+
+def _snapshot_store(database_manager) -> Optional[SnapshotStore]:
+    """Snapshot store in the data directory, if the database supports versioned snapshots"""
+    get_version = getattr(database_manager, 'get_collection_version', None)
+    if get_version is None or getattr(database_manager, 'data_dir', None) is None:
+        return None
+    return SnapshotStore(os.path.join(database_manager.data_dir, "snapshots"))
+
+
+def load_service_snapshot(database_manager, name: str, tracked: TrackedVersion) -> Optional[Any]:
+    """Restore a service's state if a snapshot exists for the tracked version"""
+    store = _snapshot_store(database_manager)
+    if store is None or tracked.version is None:
+        return None
+    return store.load(name, tracked.version)
+
+
+def save_service_snapshot(database_manager, name: str, state: Any, tracked: TrackedVersion):
+    """Snapshot a service's state if it matches the current collection version
+
+    Nothing is written while the state is out of step with the database,
+    so a snapshot is never labelled with a version it does not reflect.
+    """
+    store = _snapshot_store(database_manager)
+    if store is None or not tracked.in_sync():
+        return
+    try:
+        store.save(name, tracked.version, state)
+    except OSError as e:
+        print(f"Error saving {name} snapshot: {e}")
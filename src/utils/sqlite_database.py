@@ -0,0 +1,675 @@
+"""
+SQLite database manager for Tobey Finance Bank
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Callable, Sequence
+from datetime import datetime, timedelta
+
+from .backup import BackupWriter
+from .read_snapshot import ReadSnapshot
+from .schema import check_schema_version
+from .storage import KEY_FIELDS, StorageBackend
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS accounts (
+    account_number TEXT PRIMARY KEY,
+    customer_id TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_accounts_customer_id ON accounts (customer_id);
+
+CREATE TABLE IF NOT EXISTS customers (
+    customer_id TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS transactions (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    transaction_id TEXT NOT NULL UNIQUE,
+    account_number TEXT,
+    timestamp TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_transactions_account_timestamp
+    ON transactions (account_number, timestamp);
+CREATE INDEX IF NOT EXISTS idx_transactions_timestamp ON transactions (timestamp);
+
+CREATE TABLE IF NOT EXISTS employees (
+    employee_id TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS audit_logs (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    log_id TEXT,
+    employee_id TEXT,
+    action TEXT,
+    timestamp TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_audit_logs_log_id ON audit_logs (log_id);
+CREATE INDEX IF NOT EXISTS idx_audit_logs_employee_id ON audit_logs (employee_id, timestamp);
+CREATE INDEX IF NOT EXISTS idx_audit_logs_action ON audit_logs (action, timestamp);
+CREATE INDEX IF NOT EXISTS idx_audit_logs_timestamp ON audit_logs (timestamp);
+
+CREATE TABLE IF NOT EXISTS collection_stats (
+    name TEXT PRIMARY KEY,
+    count INTEGER NOT NULL,
+    bytes INTEGER NOT NULL,
+    min_timestamp TEXT,
+    max_timestamp TEXT,
+    last_write TEXT,
+    version INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+# Timestamp that orders each table's rows, as an expression on a row alias
+TIMESTAMP_EXPRESSIONS = {
+    'accounts': "json_extract({row}.data, '$.created_date')",
+    'customers': "json_extract({row}.data, '$.created_date')",
+    'transactions': "{row}.timestamp",
+    'employees': "json_extract({row}.data, '$.created_date')",
+    'audit_logs': "{row}.timestamp",
+}
+
+# Seeds a table's collection_stats row once, then keeps it current on every write;
+# ``version`` counts the writes to the table
+STATS_TRIGGERS = """
+INSERT OR IGNORE INTO collection_stats
+    SELECT '{table}', COUNT(*), COALESCE(SUM(length(data)), 0), MIN({ts}), MAX({ts}), NULL, 0
+    FROM {table} WHERE NOT EXISTS (SELECT 1 FROM collection_stats WHERE name = '{table}');
+
+CREATE TRIGGER IF NOT EXISTS {table}_stats_insert AFTER INSERT ON {table} BEGIN
+    UPDATE collection_stats SET
+        count = count + 1,
+        bytes = bytes + length(NEW.data),
+        min_timestamp = COALESCE(min(min_timestamp, {new_ts}), min_timestamp, {new_ts}),
+        max_timestamp = COALESCE(max(max_timestamp, {new_ts}), max_timestamp, {new_ts}),
+        last_write = strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime'),
+        version = version + 1
+    WHERE name = '{table}';
+END;
+
+CREATE TRIGGER IF NOT EXISTS {table}_stats_update AFTER UPDATE ON {table} BEGIN
+    UPDATE collection_stats SET
+        bytes = bytes + length(NEW.data) - length(OLD.data),
+        min_timestamp = CASE WHEN {old_ts} IS {new_ts} THEN min_timestamp
+                             ELSE (SELECT MIN({ts}) FROM {table}) END,
+        max_timestamp = CASE WHEN {old_ts} IS {new_ts} THEN max_timestamp
+                             ELSE (SELECT MAX({ts}) FROM {table}) END,
+        last_write = strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime'),
+        version = version + 1
+    WHERE name = '{table}';
+END;
+
+CREATE TRIGGER IF NOT EXISTS {table}_stats_delete AFTER DELETE ON {table} BEGIN
+    UPDATE collection_stats SET
+        count = count - 1,
+        bytes = bytes - length(OLD.data),
+        min_timestamp = (SELECT MIN({ts}) FROM {table}),
+        max_timestamp = (SELECT MAX({ts}) FROM {table}),
+        last_write = strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime'),
+        version = version + 1
+    WHERE name = '{table}';
+END;
+"""
+
+
+class SQLiteReadSnapshot(ReadSnapshot):
+    """Snapshot held open as a read transaction on a private connection
+
+    In WAL mode a read transaction sees the database as of its first read
+    and never blocks writers. While it is open, checkpoints cannot recycle
+    the WAL, so close the snapshot when the report is done.
+    """
+
+    def __init__(self, database_file: str, collections: Iterable[str]):
+        self._connection = sqlite3.connect(database_file, timeout=30, isolation_level=None,
+                                           check_same_thread=False)
+        self._connection.execute("BEGIN")
+        # The snapshot is fixed by the transaction's first read, which takes
+        # the collection versions as SQLiteDatabaseManager reports them
+        inode = os.stat(database_file).st_ino
+        names = set(collections)
+        super().__init__({name: (inode, version, last_write) for name, version, last_write in
+                          self._connection.execute(
+                              "SELECT name, version, last_write FROM collection_stats")
+                          if name in names})
+
+    def _segments(self, name: str) -> Sequence[Iterable[Dict[str, Any]]]:
+        if name not in self.versions:
+            raise ValueError(f"Collection '{name}' is not in this snapshot")
+        return [self._rows(name)]
+
+    def _rows(self, name: str) -> Iterator[Dict[str, Any]]:
+        """Records of a table in storage order, none once the snapshot is closed"""
+        if self._connection is None:
+            return
+        order = "seq" if name in ('transactions', 'audit_logs') else "rowid"
+        for (data,) in self._connection.execute(f"SELECT data FROM {name} ORDER BY {order}"):
+            yield json.loads(data)
+
+    def _get_record(self, name: str, key: Any) -> Optional[Dict[str, Any]]:
+        if self._connection is None:
+            return None
+        row = self._connection.execute(
+            f"SELECT data FROM {name} WHERE {KEY_FIELDS[name]} = ? LIMIT 1", (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    @staticmethod
+    def _copy(record: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        # Rows are decoded afresh on every read, so there is nothing to protect
+        return record
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.execute("COMMIT")
+            self._connection.close()
+            self._connection = None
+
+
+class SQLiteDatabaseManager(StorageBackend):
+    """Database manager backed by SQLite
+
+    Exposes the same methods as the JSON ``DatabaseManager`` so that the
+    services can run on it unchanged. Records are stored as JSON documents
+    next to indexed lookup columns, the database runs in WAL mode and each
+    thread gets its own connection.
+    """
+
+    def __init__(self, data_dir: str = "data", database_name: str = "bank.db"):
+        self.data_dir = data_dir
+        self.database_file = os.path.join(data_dir, database_name)
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
+        # Create data directory if it doesn't exist
+        os.makedirs(data_dir, exist_ok=True)
+        self._create_schema()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get the connection owned by the current thread"""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            # Only this thread uses it, but close() may run on another thread
+            connection = sqlite3.connect(self.database_file, timeout=30, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            with self._connections_lock:
+                self._connections.append(connection)
+        return connection
+
+    def close(self):
+        """Close every pooled connection"""
+        with self._connections_lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+    def _create_schema(self):
+        """Create tables, indexes and statistics triggers if they don't exist"""
+        connection = self._get_connection()
+        with connection:
+            connection.executescript(SCHEMA)
+            self._add_version_column(connection)
+            for table, expression in TIMESTAMP_EXPRESSIONS.items():
+                connection.executescript(STATS_TRIGGERS.format(
+                    table=table, ts=expression.format(row=table),
+                    new_ts=expression.format(row='NEW'), old_ts=expression.format(row='OLD')))
+
+    @staticmethod
+    def _add_version_column(connection: sqlite3.Connection):
+        """Upgrade a collection_stats table from before per-collection versions
+
+        The old statistics triggers are dropped so that ``_create_schema``
+        recreates them counting versions.
+        """
+        def has_version() -> bool:
+            return any(row[1] == 'version'
+                       for row in connection.execute("PRAGMA table_info(collection_stats)"))
+
+        if has_version():
+            return
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            if not has_version():  # another process may have upgraded it meanwhile
+                connection.execute(
+                    "ALTER TABLE collection_stats ADD COLUMN version INTEGER NOT NULL DEFAULT 0")
+                for table in TIMESTAMP_EXPRESSIONS:
+                    for event in ('insert', 'update', 'delete'):
+                        connection.execute(f"DROP TRIGGER IF EXISTS {table}_stats_{event}")
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+    def initialize_database(self):
+        """Create the schema if needed and check the data's schema version"""
+        self._create_schema()
+        has_data = self._get_connection().execute(
+            "SELECT 1 FROM collection_stats WHERE count > 0 LIMIT 1").fetchone() is not None
+        check_schema_version(self.data_dir, has_data)
+
+    @staticmethod
+    def _encode(record: Dict[str, Any]) -> str:
+        """Serialize a record to JSON"""
+        return json.dumps(record, default=str)
+
+    def _fetch_one(self, query: str, params: tuple = ()) -> Optional[Dict[str, Any]]:
+        """Run a query and decode the first row's document"""
+        row = self._get_connection().execute(query, params).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _fetch_all(self, query: str, params: tuple = ()) -> List[Dict[str, Any]]:
+        """Run a query and decode every row's document"""
+        rows = self._get_connection().execute(query, params).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def _iter_rows(self, query: str, params: tuple = (),
+                   filter: Optional[Callable[[Dict[str, Any]], bool]] = None
+                   ) -> Iterator[Dict[str, Any]]:
+        """Stream documents from a query on a dedicated cursor"""
+        cursor = self._get_connection().execute(query, params)
+        try:
+            for row in cursor:
+                record = json.loads(row[0])
+                if filter is None or filter(record):
+                    yield record
+        finally:
+            cursor.close()
+
+    def _execute(self, query: str, params: tuple = ()) -> int:
+        """Run a write statement in its own transaction and return the row count"""
+        connection = self._get_connection()
+        with connection:
+            return connection.execute(query, params).rowcount
+
+    def _execute_many(self, query: str, params: Iterable[tuple]):
+        """Run a write statement for many rows in a single transaction"""
+        connection = self._get_connection()
+        with connection:
+            connection.executemany(query, params)
+
+    @staticmethod
+    def _date_filter(column: str, start_date: Optional[datetime],
+                     end_date: Optional[datetime]) -> tuple:
+        """Build SQL conditions and parameters for a date range"""
+        conditions = []
+        params = []
+        if start_date:
+            conditions.append(f"{column} >= ?")
+            params.append(start_date.isoformat())
+        if end_date:
+            conditions.append(f"{column} <= ?")
+            params.append(end_date.isoformat())
+        return conditions, params
+
+    # Account operations
+    _UPSERT_ACCOUNT = (
+        "INSERT INTO accounts (account_number, customer_id, data) VALUES (?, ?, ?) "
+        "ON CONFLICT(account_number) DO UPDATE SET "
+        "customer_id = excluded.customer_id, data = excluded.data"
+    )
+
+    def _account_row(self, account_data: Dict[str, Any]) -> tuple:
+        """Build the upsert parameters for an account"""
+        return (account_data.get('account_number'), account_data.get('customer_id'),
+                self._encode(account_data))
+
+    def save_account(self, account_data: Dict[str, Any]):
+        """Save account to database"""
+        self._execute(self._UPSERT_ACCOUNT, self._account_row(account_data))
+
+    def save_accounts(self, accounts_data: Iterable[Dict[str, Any]]):
+        """Save many accounts in a single transaction"""
+        self._execute_many(self._UPSERT_ACCOUNT, map(self._account_row, accounts_data))
+
+    def get_account(self, account_number: str) -> Optional[Dict[str, Any]]:
+        """Get account by account number"""
+        return self._fetch_one("SELECT data FROM accounts WHERE account_number = ?",
+                               (account_number,))
+
+    def get_all_accounts(self) -> List[Dict[str, Any]]:
+        """Get all accounts"""
+        return self._fetch_all("SELECT data FROM accounts ORDER BY rowid")
+
+    def iter_accounts(self, filter: Optional[Callable[[Dict[str, Any]], bool]] = None
+                      ) -> Iterator[Dict[str, Any]]:
+        """Stream accounts matching an optional predicate"""
+        return self._iter_rows("SELECT data FROM accounts ORDER BY rowid", filter=filter)
+
+    def update_account(self, account_data: Dict[str, Any]):
+        """Update account in database"""
+        self.save_account(account_data)
+
+    def delete_account(self, account_number: str) -> bool:
+        """Delete account from database"""
+        return self._execute("DELETE FROM accounts WHERE account_number = ?",
+                             (account_number,)) > 0
+
+    # Customer operations
+    _UPSERT_CUSTOMER = (
+        "INSERT INTO customers (customer_id, data) VALUES (?, ?) "
+        "ON CONFLICT(customer_id) DO UPDATE SET data = excluded.data"
+    )
+
+    def _customer_row(self, customer_data: Dict[str, Any]) -> tuple:
+        """Build the upsert parameters for a customer"""
+        return (customer_data.get('customer_id'), self._encode(customer_data))
+
+    def save_customer(self, customer_data: Dict[str, Any]):
+        """Save customer to database"""
+        self._execute(self._UPSERT_CUSTOMER, self._customer_row(customer_data))
+
+    def upsert_customers(self, customers_data: Iterable[Dict[str, Any]]):
+        """Save many customers in a single transaction"""
+        self._execute_many(self._UPSERT_CUSTOMER, map(self._customer_row, customers_data))
+
+    def get_customer(self, customer_id: str) -> Optional[Dict[str, Any]]:
+        """Get customer by customer ID"""
+        return self._fetch_one("SELECT data FROM customers WHERE customer_id = ?",
+                               (customer_id,))
+
+    def get_all_customers(self) -> List[Dict[str, Any]]:
+        """Get all customers"""
+        return self._fetch_all("SELECT data FROM customers ORDER BY rowid")
+
+    def iter_customers(self, filter: Optional[Callable[[Dict[str, Any]], bool]] = None
+                       ) -> Iterator[Dict[str, Any]]:
+        """Stream customers matching an optional predicate"""
+        return self._iter_rows("SELECT data FROM customers ORDER BY rowid", filter=filter)
+
+    def update_customer(self, customer_data: Dict[str, Any]):
+        """Update customer in database"""
+        self.save_customer(customer_data)
+
+    def delete_customer(self, customer_id: str) -> bool:
+        """Delete customer from database"""
+        return self._execute("DELETE FROM customers WHERE customer_id = ?",
+                             (customer_id,)) > 0
+
+    # Transaction operations
+    _UPSERT_TRANSACTION = (
+        "INSERT INTO transactions (transaction_id, account_number, timestamp, data) "
+        "VALUES (?, ?, ?, ?) "
+        "ON CONFLICT(transaction_id) DO UPDATE SET "
+        "account_number = excluded.account_number, timestamp = excluded.timestamp, "
+        "data = excluded.data"
+    )
+
+    def _transaction_row(self, transaction_data: Dict[str, Any]) -> tuple:
+        """Build the upsert parameters for a transaction"""
+        return (transaction_data.get('transaction_id'), transaction_data.get('account_number'),
+                transaction_data.get('timestamp'), self._encode(transaction_data))
+
+    def save_transaction(self, transaction_data: Dict[str, Any]):
+        """Save transaction to database"""
+        self._execute(self._UPSERT_TRANSACTION, self._transaction_row(transaction_data))
+
+    def save_transactions(self, transactions_data: Iterable[Dict[str, Any]]):
+        """Save many transactions in a single transaction"""
+        self._execute_many(self._UPSERT_TRANSACTION, map(self._transaction_row, transactions_data))
+
+    def get_transaction(self, transaction_id: str) -> Optional[Dict[str, Any]]:
+        """Get transaction by transaction ID"""
+        return self._fetch_one("SELECT data FROM transactions WHERE transaction_id = ?",
+                               (transaction_id,))
+
+    def get_all_transactions(self) -> List[Dict[str, Any]]:
+        """Get all transactions"""
+        return self._fetch_all("SELECT data FROM transactions ORDER BY seq")
+
+    def iter_transactions(self, filter: Optional[Callable[[Dict[str, Any]], bool]] = None,
+                          account_number: Optional[str] = None,
+                          start_date: Optional[datetime] = None,
+                          end_date: Optional[datetime] = None) -> Iterator[Dict[str, Any]]:
+        """Stream transactions oldest first, like the file backends' partitions
+
+        Rows with equal timestamps come in insertion order; both orders are
+        served by the timestamp indexes, whose entries end in the rowid.
+        """
+        conditions, params = self._date_filter('timestamp', start_date, end_date)
+        if account_number:
+            conditions.append("account_number = ?")
+            params.append(account_number)
+        where = f"WHERE {' AND '.join(conditions)} " if conditions else ""
+        return self._iter_rows(f"SELECT data FROM transactions {where}ORDER BY timestamp, seq",
+                               tuple(params), filter)
+
+    def get_account_transactions(self, account_number: str,
+                               start_date: Optional[datetime] = None,
+                               end_date: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """Get transactions for a specific account (oldest first)"""
+        conditions, params = self._date_filter('timestamp', start_date, end_date)
+        conditions.insert(0, "account_number = ?")
+        params.insert(0, account_number)
+        return self._fetch_all(
+            f"SELECT data FROM transactions WHERE {' AND '.join(conditions)} "
+            "ORDER BY timestamp, seq",
+            tuple(params)
+        )
+
+    def get_transactions_by_date_range(self, start_date: datetime,
+                                       end_date: datetime) -> List[Dict[str, Any]]:
+        """Get all transactions within a date range (newest first)"""
+        return self._fetch_all(
+            "SELECT data FROM transactions WHERE timestamp >= ? AND timestamp <= ? "
+            "ORDER BY timestamp DESC, seq DESC",
+            (start_date.isoformat(), end_date.isoformat())
+        )
+
+    def get_recent_transactions(self, days: int = 30) -> List[Dict[str, Any]]:
+        """Get transactions from the last N days (newest first)"""
+        end_date = datetime.now()
+        return self.get_transactions_by_date_range(end_date - timedelta(days=days), end_date)
+
+    def update_transaction(self, transaction_data: Dict[str, Any]):
+        """Update transaction in database"""
+        self._execute(
+            "UPDATE transactions SET account_number = ?, timestamp = ?, data = ? "
+            "WHERE transaction_id = ?",
+            (transaction_data.get('account_number'), transaction_data.get('timestamp'),
+             self._encode(transaction_data), transaction_data.get('transaction_id'))
+        )
+
+    def delete_transaction(self, transaction_id: str) -> bool:
+        """Delete transaction from database"""
+        return self._execute("DELETE FROM transactions WHERE transaction_id = ?",
+                             (transaction_id,)) > 0
+
+    # Employee operations
+    _UPSERT_EMPLOYEE = (
+        "INSERT INTO employees (employee_id, data) VALUES (?, ?) "
+        "ON CONFLICT(employee_id) DO UPDATE SET data = excluded.data"
+    )
+
+    def _employee_row(self, employee_data: Dict[str, Any]) -> tuple:
+        """Build the upsert parameters for an employee"""
+        return (employee_data.get('employee_id'), self._encode(employee_data))
+
+    def save_employee(self, employee_data: Dict[str, Any]):
+        """Save employee to database"""
+        self._execute(self._UPSERT_EMPLOYEE, self._employee_row(employee_data))
+
+    def save_employees(self, employees_data: Iterable[Dict[str, Any]]):
+        """Save many employees in a single transaction"""
+        self._execute_many(self._UPSERT_EMPLOYEE, map(self._employee_row, employees_data))
+
+    def get_employee(self, employee_id: str) -> Optional[Dict[str, Any]]:
+        """Get employee by employee ID"""
+        return self._fetch_one("SELECT data FROM employees WHERE employee_id = ?",
+                               (employee_id,))
+
+    def get_all_employees(self) -> List[Dict[str, Any]]:
+        """Get all employees"""
+        return self._fetch_all("SELECT data FROM employees ORDER BY rowid")
+
+    def iter_employees(self, filter: Optional[Callable[[Dict[str, Any]], bool]] = None
+                       ) -> Iterator[Dict[str, Any]]:
+        """Stream employees matching an optional predicate"""
+        return self._iter_rows("SELECT data FROM employees ORDER BY rowid", filter=filter)
+
+    def update_employee(self, employee_data: Dict[str, Any]):
+        """Update employee in database"""
+        self.save_employee(employee_data)
+
+    def delete_employee(self, employee_id: str) -> bool:
+        """Delete employee from database"""
+        return self._execute("DELETE FROM employees WHERE employee_id = ?",
+                             (employee_id,)) > 0
+
+    # Audit log operations
+    _INSERT_AUDIT_LOG = (
+        "INSERT INTO audit_logs (log_id, employee_id, action, timestamp, data) "
+        "VALUES (?, ?, ?, ?, ?)"
+    )
+
+    def _audit_log_row(self, audit_log_data: Dict[str, Any]) -> tuple:
+        """Build the insert parameters for an audit log"""
+        return (audit_log_data.get('log_id'), audit_log_data.get('employee_id'),
+                audit_log_data.get('action'), audit_log_data.get('timestamp'),
+                self._encode(audit_log_data))
+
+    def save_audit_log(self, audit_log_data: Dict[str, Any]):
+        """Save audit log to database"""
+        self._execute(self._INSERT_AUDIT_LOG, self._audit_log_row(audit_log_data))
+
+    def save_audit_logs(self, audit_logs_data: Iterable[Dict[str, Any]]):
+        """Save many audit logs in a single transaction"""
+        self._execute_many(self._INSERT_AUDIT_LOG, map(self._audit_log_row, audit_logs_data))
+
+    def get_audit_log(self, log_id: str) -> Optional[Dict[str, Any]]:
+        """Get audit log by log ID"""
+        return self._fetch_one("SELECT data FROM audit_logs WHERE log_id = ?", (log_id,))
+
+    def get_audit_logs(self, employee_id: str = None, action: str = None,
+                       start_date: datetime = None, end_date: datetime = None) -> List[Dict[str, Any]]:
+        """Get audit logs with optional filtering"""
+        conditions, params = self._date_filter('timestamp', start_date, end_date)
+        if employee_id:
+            conditions.append("employee_id = ?")
+            params.append(employee_id)
+        if action:
+            conditions.append("action = ?")
+            params.append(action)
+        where = f"WHERE {' AND '.join(conditions)} " if conditions else ""
+
+        # Sort by timestamp (newest first)
+        return self._fetch_all(
+            f"SELECT data FROM audit_logs {where}ORDER BY timestamp DESC, seq",
+            tuple(params)
+        )
+
+    def iter_audit_logs(self, employee_id: str = None, action: str = None,
+                        start_date: datetime = None, end_date: datetime = None,
+                        filter: Optional[Callable[[Dict[str, Any]], bool]] = None
+                        ) -> Iterator[Dict[str, Any]]:
+        """Stream audit logs in storage (oldest first) order"""
+        conditions, params = self._date_filter('timestamp', start_date, end_date)
+        if employee_id:
+            conditions.append("employee_id = ?")
+            params.append(employee_id)
+        if action:
+            conditions.append("action = ?")
+            params.append(action)
+        where = f"WHERE {' AND '.join(conditions)} " if conditions else ""
+        return self._iter_rows(f"SELECT data FROM audit_logs {where}ORDER BY seq",
+                               tuple(params), filter)
+
+    def get_employee_audit_logs(self, employee_id: str) -> List[Dict[str, Any]]:
+        """Get all audit logs for a specific employee"""
+        return self.get_audit_logs(employee_id=employee_id)
+
+    def get_collection_version(self, name: str) -> tuple:
+        """Identify the current version of a collection
+
+        Read from the collection's collection_stats row, whose write
+        counter the triggers bump on every write. The time of the last
+        write and the database file's inode tell the counter apart from
+        that of a restored or recreated database.
+        """
+        row = self._get_connection().execute(
+            "SELECT version, last_write FROM collection_stats WHERE name = ?", (name,)).fetchone()
+        return (os.stat(self.database_file).st_ino,) + tuple(row)
+
+    def _database_version(self) -> tuple:
+        """Identify the current on-disk version of the whole database
+
+        Any write changes the database or its WAL file.
+        """
+        signatures = []
+        for file_path in (self.database_file, self.database_file + "-wal"):
+            try:
+                stat = os.stat(file_path)
+                signatures.append((stat.st_mtime_ns, stat.st_size, stat.st_ino))
+            except FileNotFoundError:
+                signatures.append(None)
+        return tuple(signatures)
+
+    def snapshot(self, collections: Optional[Iterable[str]] = None) -> ReadSnapshot:
+        """Point-in-time, read-only view of some or all collections
+
+        Only opens a read transaction; nothing is read up front.
+        """
+        names = list(KEY_FIELDS) if collections is None else list(collections)
+        for name in names:
+            if name not in KEY_FIELDS:
+                raise ValueError(f"Unknown collection '{name}'")
+        return SQLiteReadSnapshot(self.database_file, names)
+
+    def get_collection_metadata(self, name: str) -> Dict[str, Any]:
+        """Record count, byte size, timestamp range and last write of a collection
+
+        Read from the collection_stats row that triggers maintain on every
+        write; ``bytes`` is the size of the stored JSON documents.
+        """
+        row = self._get_connection().execute(
+            "SELECT count, bytes, min_timestamp, max_timestamp, last_write "
+            "FROM collection_stats WHERE name = ?", (name,)).fetchone()
+        return dict(zip(('count', 'bytes', 'min_timestamp', 'max_timestamp', 'last_write'), row))
+
+    # Backup and restore operations
+    def backup_database(self, backup_dir: str = "backup") -> str:
+        """Create a compressed online backup of the SQLite database
+
+        SQLite's backup API copies a consistent snapshot while writes
+        continue; the snapshot is then streamed into the backup set
+        compressed. If nothing was written since the previous backup in
+        ``backup_dir``, the previous copy is hard-linked instead.
+        """
+        writer = BackupWriter(backup_dir)
+        try:
+            relative_path = os.path.basename(self.database_file)
+            version = self._database_version()
+            if not writer.link_unchanged(relative_path, version):
+                snapshot_path = os.path.join(backup_dir, f".{writer.name}.db")
+                target = sqlite3.connect(snapshot_path)
+                try:
+                    self._get_connection().backup(target)
+                finally:
+                    target.close()
+                try:
+                    with open(snapshot_path, 'rb') as source:
+                        writer.add(relative_path, source, os.fstat(source.fileno()).st_size, version)
+                finally:
+                    os.remove(snapshot_path)
+            backup_path = writer.commit()
+        except BaseException:
+            writer.abort()
+            raise
+
+        print(f"Database backup created in {backup_path}")
+        return backup_path
+
+    def get_database_stats(self) -> Dict[str, int]:
+        """Get database statistics"""
+        return {name: self.get_collection_metadata(name)['count']
+                for name in ('accounts', 'customers', 'transactions')}
@@ -0,0 +1,224 @@
+"""
+Storage backend interface for Tobey Finance Bank
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from .read_snapshot import ReadSnapshot
+
+RecordFilter = Optional[Callable[[Dict[str, Any]], bool]]
+
+# Primary key field of each collection
+KEY_FIELDS = {
+    'accounts': 'account_number',
+    'customers': 'customer_id',
+    'transactions': 'transaction_id',
+    'employees': 'employee_id',
+    'audit_logs': 'log_id',
+}
+
+
+class StorageBackend(ABC):
+    """Interface every database manager implements
+
+    Services only talk to storage through these methods, so any registered
+    backend (see ``src.utils.backends``) can be swapped in without changing
+    them. Records are plain dictionaries; backends hand out copies, so
+    mutating a returned record never changes stored data.
+    """
+
+    data_dir: Optional[str]
+
+    @abstractmethod
+    def initialize_database(self):
+        """Create the storage structures if they don't exist"""
+
+    @abstractmethod
+    def close(self):
+        """Flush pending writes and release resources"""
+
+    # Account operations
+    @abstractmethod
+    def save_account(self, account_data: Dict[str, Any]):
+        """Save account to database"""
+
+    @abstractmethod
+    def save_accounts(self, accounts_data: Iterable[Dict[str, Any]]):
+        """Save many accounts in one write"""
+
+    @abstractmethod
+    def get_account(self, account_number: str) -> Optional[Dict[str, Any]]:
+        """Get account by account number"""
+
+    @abstractmethod
+    def get_all_accounts(self) -> List[Dict[str, Any]]:
+        """Get all accounts"""
+
+    @abstractmethod
+    def iter_accounts(self, filter: RecordFilter = None) -> Iterator[Dict[str, Any]]:
+        """Stream accounts matching an optional predicate"""
+
+    @abstractmethod
+    def update_account(self, account_data: Dict[str, Any]):
+        """Update account in database"""
+
+    @abstractmethod
+    def delete_account(self, account_number: str) -> bool:
+        """Delete account from database"""
+
+    # Customer operations
+    @abstractmethod
+    def save_customer(self, customer_data: Dict[str, Any]):
+        """Save customer to database"""
+
+    @abstractmethod
+    def upsert_customers(self, customers_data: Iterable[Dict[str, Any]]):
+        """Save many customers in one write"""
+
+    @abstractmethod
+    def get_customer(self, customer_id: str) -> Optional[Dict[str, Any]]:
+        """Get customer by customer ID"""
+
+    @abstractmethod
+    def get_all_customers(self) -> List[Dict[str, Any]]:
+        """Get all customers"""
+
+    @abstractmethod
+    def iter_customers(self, filter: RecordFilter = None) -> Iterator[Dict[str, Any]]:
+        """Stream customers matching an optional predicate"""
+
+    @abstractmethod
+    def update_customer(self, customer_data: Dict[str, Any]):
+        """Update customer in database"""
+
+    @abstractmethod
+    def delete_customer(self, customer_id: str) -> bool:
+        """Delete customer from database"""
+
+    # Transaction operations
+    @abstractmethod
+    def save_transaction(self, transaction_data: Dict[str, Any]):
+        """Save transaction to database"""
+
+    @abstractmethod
+    def save_transactions(self, transactions_data: Iterable[Dict[str, Any]]):
+        """Save many transactions in one write"""
+
+    @abstractmethod
+    def get_transaction(self, transaction_id: str) -> Optional[Dict[str, Any]]:
+        """Get transaction by transaction ID"""
+
+    @abstractmethod
+    def get_all_transactions(self) -> List[Dict[str, Any]]:
+        """Get all transactions"""
+
+    @abstractmethod
+    def iter_transactions(self, filter: RecordFilter = None,
+                          account_number: Optional[str] = None,
+                          start_date: Optional[datetime] = None,
+                          end_date: Optional[datetime] = None) -> Iterator[Dict[str, Any]]:
+        """Stream transactions in storage order"""
+
+    @abstractmethod
+    def get_account_transactions(self, account_number: str,
+                                 start_date: Optional[datetime] = None,
+                                 end_date: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """Get transactions for a specific account (oldest first)"""
+
+    @abstractmethod
+    def get_transactions_by_date_range(self, start_date: datetime,
+                                       end_date: datetime) -> List[Dict[str, Any]]:
+        """Get all transactions within a date range (newest first)"""
+
+    @abstractmethod
+    def get_recent_transactions(self, days: int = 30) -> List[Dict[str, Any]]:
+        """Get transactions from the last N days (newest first)"""
+
+    @abstractmethod
+    def update_transaction(self, transaction_data: Dict[str, Any]):
+        """Update transaction in database"""
+
+    @abstractmethod
+    def delete_transaction(self, transaction_id: str) -> bool:
+        """Delete transaction from database"""
+
+    # Employee operations
+    @abstractmethod
+    def save_employee(self, employee_data: Dict[str, Any]):
+        """Save employee to database"""
+
+    @abstractmethod
+    def save_employees(self, employees_data: Iterable[Dict[str, Any]]):
+        """Save many employees in one write"""
+
+    @abstractmethod
+    def get_employee(self, employee_id: str) -> Optional[Dict[str, Any]]:
+        """Get employee by employee ID"""
+
+    @abstractmethod
+    def get_all_employees(self) -> List[Dict[str, Any]]:
+        """Get all employees"""
+
+    @abstractmethod
+    def iter_employees(self, filter: RecordFilter = None) -> Iterator[Dict[str, Any]]:
+        """Stream employees matching an optional predicate"""
+
+    @abstractmethod
+    def update_employee(self, employee_data: Dict[str, Any]):
+        """Update employee in database"""
+
+    @abstractmethod
+    def delete_employee(self, employee_id: str) -> bool:
+        """Delete employee from database"""
+
+    # Audit log operations
+    @abstractmethod
+    def save_audit_log(self, audit_log_data: Dict[str, Any]):
+        """Save audit log to database"""
+
+    @abstractmethod
+    def save_audit_logs(self, audit_logs_data: Iterable[Dict[str, Any]]):
+        """Save many audit logs in one write"""
+
+    @abstractmethod
+    def get_audit_log(self, log_id: str) -> Optional[Dict[str, Any]]:
+        """Get audit log by log ID"""
+
+    @abstractmethod
+    def get_audit_logs(self, employee_id: str = None, action: str = None,
+                       start_date: datetime = None, end_date: datetime = None) -> List[Dict[str, Any]]:
+        """Get audit logs with optional filtering (newest first)"""
+
+    @abstractmethod
+    def iter_audit_logs(self, employee_id: str = None, action: str = None,
+                        start_date: datetime = None, end_date: datetime = None,
+                        filter: RecordFilter = None) -> Iterator[Dict[str, Any]]:
+        """Stream audit logs in storage (oldest first) order"""
+
+    @abstractmethod
+    def get_employee_audit_logs(self, employee_id: str) -> List[Dict[str, Any]]:
+        """Get all audit logs for a specific employee"""
+
+    # Collection information
+    @abstractmethod
+    def get_collection_version(self, name: str) -> tuple:
+        """Identify the current version of a collection; changes on every write"""
+
+    @abstractmethod
+    def get_collection_metadata(self, name: str) -> Dict[str, Any]:
+        """Record count, byte size, timestamp range and last write of a collection"""
+
+    @abstractmethod
+    def snapshot(self, collections: Optional[Iterable[str]] = None) -> ReadSnapshot:
+        """Point-in-time, read-only view of the named collections, or of all"""
+
+    @abstractmethod
+    def get_database_stats(self) -> Dict[str, int]:
+        """Get database statistics"""
+
+    # Backup and restore operations
+    @abstractmethod
+    def backup_database(self, backup_dir: str = "backup") -> str:
+        """Create a backup set and return its path"""
@@ -0,0 +1,221 @@
+"""
+Inverted full-text index for Tobey Finance Bank
+"""
+
+import re
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+from functools import lru_cache, partial
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Set, Tuple, Union
+
+_TOKEN = re.compile(r"\w+")
+
+
+@lru_cache(maxsize=65536)
+def tokenize(text: str) -> Tuple[str, ...]:
+    """Distinct lowercase words of a text, in order of appearance"""
+    return tuple(dict.fromkeys(_TOKEN.findall(text.lower())))
+
+
+class InvertedIndex:
+    """Rows of documents by the words they contain, with prefix search
+
+    Each word maps to its postings: the row numbers of the documents
+    containing it, in the order they were added. A word found in a single
+    row (a reference number, say) stores the bare row number; the list
+    becomes an ``array('I')`` once a second row has the word. A sorted
+    vocabulary finds the words starting with a prefix by bisection; words
+    new since the last search are only sorted and merged into it by the
+    next one, so adding a document never shifts the vocabulary.
+    Rows must be added in increasing order.
+    """
+
+    def __init__(self):
+        self.postings: Dict[str, Union[int, array]] = {}
+        self._vocabulary: List[str] = []
+        self._new_words: List[str] = []
+        self.rows = 0
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def __setstate__(self, state):
+        # Snapshots pickled before the vocabulary was merged lazily
+        if 'vocabulary' in state:
+            state['_vocabulary'] = state.pop('vocabulary')
+            state['_new_words'] = []
+        self.__dict__.update(state)
+
+    @property
+    def vocabulary(self) -> List[str]:
+        """Every indexed word, sorted"""
+        new_words = self._new_words
+        if new_words:
+            # Words added meanwhile stay queued for the next merge
+            count = len(new_words)
+            merged = sorted(new_words[:count])
+            del new_words[:count]
+            # Two sorted runs, which the sort merges in linear time
+            vocabulary = self._vocabulary + merged
+            vocabulary.sort()
+            self._vocabulary = vocabulary
+        return self._vocabulary
+
+    def add(self, row: int, *texts: Optional[str]):
+        """Index the words of a document's texts under its row"""
+        postings = self.postings
+        for text in texts:
+            if not text:
+                continue
+            for word in tokenize(text):
+                rows = postings.get(word)
+                if rows is None:
+                    postings[word] = row
+                    self._new_words.append(word)
+                elif type(rows) is int:
+                    if rows != row:
+                        postings[word] = array('I', (rows, row))
+                elif rows[-1] != row:
+                    rows.append(row)
+        self.rows = max(self.rows, row + 1)
+
+    def _prefix_rows(self, prefix: str) -> Sequence[int]:
+        """Sorted rows having a word that starts with prefix"""
+        vocabulary = self.vocabulary
+        start = bisect_left(vocabulary, prefix)
+        end = bisect_left(vocabulary, prefix + "\U0010ffff", start)
+        if start == end:
+            return ()
+        if end - start == 1:
+            rows = self.postings[vocabulary[start]]
+            return (rows,) if type(rows) is int else rows
+        matches = set()
+        for word in vocabulary[start:end]:
+            rows = self.postings[word]
+            if type(rows) is int:
+                matches.add(rows)
+            else:
+                matches.update(rows)
+        return sorted(matches)
+
+    def search(self, query: str) -> Optional[Iterable[int]]:
+        """Sorted rows having, for every word of the query, a word it prefixes
+
+        Returns None when the query has no words, which matches every row.
+        """
+        words = tokenize(query)
+        if not words:
+            return None
+        # Narrowest first, so the intersection stays small
+        candidates = sorted((self._prefix_rows(word) for word in words), key=len)
+        rows = candidates[0]
+        for other in candidates[1:]:
+            if not rows:
+                break
+            if len(rows) * 16 < len(other):
+                # Few candidates left: look each one up in the sorted postings
+                rows = [row for row in rows if _contains(other, row)]
+            else:
+                rows = sorted(set(rows).intersection(other))
+        return rows
+
+
+def _contains(rows: Sequence[int], row: int) -> bool:
+    """Whether a sorted sequence of rows holds row"""
+    position = bisect_left(rows, row)
+    return position < len(rows) and rows[position] == row
+
+
+def _trigrams(text: str) -> Set[str]:
+    """Every run of three characters in a text"""
+    return set(map(''.join, zip(text, text[1:], text[2:])))
+
+
+class TrigramIndex:
+    """Case-insensitive substring search over the text fields of keyed records
+
+    Every record gets a row holding its lowercased fields, joined and
+    bracketed by NUL characters so that a term can be tested against all of
+    them at once, and each trigram (run of three characters) of that text
+    maps to the rows containing it in an ``array('I')``. A search term of
+    three or more characters is only checked against the rows holding its
+    rarest trigrams; shorter terms are checked against every row. Matches
+    are ranked by how well the term matches a field (the whole field, its
+    start, the start of a word within it, then anywhere), then by row,
+    which is the order records were first added in.
+
+    Re-adding a record keeps its row, appending it to the postings of any
+    new trigrams; postings of trigrams it lost are left in place, as every
+    candidate is checked against its current text anyway.
+    """
+
+    def __init__(self):
+        self.postings: Dict[str, array] = defaultdict(partial(array, 'I'))
+        self.rows: Dict[Hashable, int] = {}
+        self.keys: List[Hashable] = []
+        # Joined lowercase fields of each row, None once its record is removed
+        self.texts: List[Optional[str]] = []
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def add(self, key: Hashable, *fields: Optional[str]):
+        """Index a record's text fields, replacing those indexed for the key before"""
+        text = ("\0%s\0" % "\0".join(filter(None, fields))).lower()
+        row = self.rows.get(key)
+        if row is None:
+            row = self.rows[key] = len(self.keys)
+            self.keys.append(key)
+            self.texts.append(text)
+            trigrams = _trigrams(text)
+        else:
+            trigrams = _trigrams(text) - _trigrams(self.texts[row] or "")
+            self.texts[row] = text
+        postings = self.postings
+        for trigram in trigrams:
+            postings[trigram].append(row)
+
+    def remove(self, key: Hashable):
+        """Stop matching a record"""
+        row = self.rows.pop(key, None)
+        if row is not None:
+            self.texts[row] = None
+
+    def _candidates(self, term: str) -> Iterable[int]:
+        """Rows, in order, whose text may contain term"""
+        if len(term) < 3:
+            return range(len(self.texts))
+        postings = sorted((self.postings.get(trigram, ()) for trigram in _trigrams(term)), key=len)
+        if not postings[0]:
+            return ()
+        candidates = set(postings[0])
+        # A second trigram only pays off while it can still narrow the candidates cheaply
+        if len(postings) > 1 and len(postings[1]) < 16 * len(candidates):
+            candidates.intersection_update(postings[1])
+        return sorted(candidates)
+
+    def search(self, term: str) -> List[Hashable]:
+        """Keys of the records with a field containing term, best matches first"""
+        term = term.lower()
+        if "\0" in term:
+            return []
+        texts = self.texts
+        rows = [row for row in self._candidates(term)
+                if texts[row] is not None and term in texts[row]]
+        if term:
+            whole = "\0%s\0" % term
+            field_start = "\0" + term
+            # Not preceded by a letter or digit, as str.isalnum() has them; the
+            # lookbehind comes second so the pattern starts with a literal
+            escaped = re.escape(term)
+            word_start = re.compile("%s(?<![^\\W_]%s)" % (escaped, escaped)).search
+            ranked: Tuple[List[int], ...] = ([], [], [], [])
+            for row in rows:
+                text = texts[row]
+                ranked[0 if whole in text else
+                       1 if field_start in text else
+                       2 if word_start(text) else 3].append(row)
+            rows = [row for tier in ranked for row in tier]
+        keys = self.keys
+        return [keys[row] for row in rows]
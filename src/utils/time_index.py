@@ -0,0 +1,60 @@
+"""
+Timestamp-ordered index for Tobey Finance Bank
+"""
+
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from typing import Any, List, Optional
+
+
+def parse_timestamp(value: Any) -> datetime:
+    """Parse an ISO timestamp, ordering unparsable values first"""
+    if isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return datetime.min
+
+
+class TimeIndex:
+    """Values kept sorted by timestamp for bisect range scans
+
+    Values with equal timestamps keep their insertion order, and appending
+    in time order (the common case) is O(1).
+    """
+
+    def __init__(self):
+        self.keys: List[datetime] = []
+        self.values: List[Any] = []
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def add(self, timestamp: datetime, value: Any):
+        """Insert a value at its place in time order"""
+        if not self.keys or timestamp >= self.keys[-1]:
+            self.keys.append(timestamp)
+            self.values.append(value)
+            return
+        position = bisect_right(self.keys, timestamp)
+        self.keys.insert(position, timestamp)
+        self.values.insert(position, value)
+
+    def range(self, start: Optional[datetime] = None,
+              end: Optional[datetime] = None) -> List[Any]:
+        """Values with start <= timestamp <= end, oldest first"""
+        low = bisect_left(self.keys, start) if start is not None else 0
+        high = bisect_right(self.keys, end) if end is not None else len(self.keys)
+        return self.values[low:high]
+
+    def newest(self, start: Optional[datetime] = None, end: Optional[datetime] = None,
+               limit: Optional[int] = None) -> List[Any]:
+        """Values with start <= timestamp <= end, newest first, at most limit of them"""
+        low = bisect_left(self.keys, start) if start is not None else 0
+        high = bisect_right(self.keys, end) if end is not None else len(self.keys)
+        if limit is not None:
+            low = max(low, high - limit)
+        values = self.values[low:high]
+        values.reverse()
+        return values
@@ -0,0 +1,140 @@
+"""
+Write-behind buffering of record updates for Tobey Finance Bank
+"""
+
+import json
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+
+class WriteBehindBuffer:
+    """Collects record updates in memory and writes them in batches
+
+    Updates are keyed by ``key_field``, so only the latest state of each
+    dirty record is written. A batch is handed to ``write`` when
+    ``max_pending`` records are dirty, every ``interval`` seconds from a
+    background thread, and on ``flush``/``close``.
+
+    With an ``intent_log`` path every update is appended and fsynced to a
+    JSONL log before ``put`` returns. Each flush rotates the log, and the
+    rotated file is deleted once its batch is written. Any log left over
+    from a crash is written through when the buffer is created. Without a
+    path, updates that have not been flushed are lost on a crash.
+    """
+
+    def __init__(self, write: Callable[[List[Dict[str, Any]]], Any], key_field: str,
+                 intent_log: Optional[str] = None, interval: float = 1.0,
+                 max_pending: int = 100):
+        self.write = write
+        self.key_field = key_field
+        self.intent_log = intent_log
+        self.interval = interval
+        self.max_pending = max_pending
+        self._pending: Dict[Any, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._log_file = None
+        self._closed = threading.Event()
+        self._recover()
+        self._thread = threading.Thread(target=self._run, name="write-behind-flusher", daemon=True)
+        self._thread.start()
+
+    @property
+    def _flushing_log(self) -> str:
+        """Rotated intent log of the batch being written"""
+        return self.intent_log + ".flushing"
+
+    def _recover(self):
+        """Write through updates logged before a crash"""
+        if self.intent_log is None:
+            return
+        records: Dict[Any, Dict[str, Any]] = {}
+        for path in (self._flushing_log, self.intent_log):
+            try:
+                with open(path, 'r') as f:
+                    for line in f:
+                        try:
+                            record = json.loads(line)
+                        except ValueError:
+                            continue  # torn final line of an interrupted append
+                        records[record.get(self.key_field)] = record
+            except FileNotFoundError:
+                continue
+        if records:
+            self.write(list(records.values()))
+        for path in (self._flushing_log, self.intent_log):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def _log(self, records: List[Dict[str, Any]]):
+        """Durably record updates in the intent log with one fsync"""
+        if self._log_file is None:
+            self._log_file = open(self.intent_log, 'a')
+        self._log_file.write("".join(json.dumps(record, default=str) + "\n" for record in records))
+        self._log_file.flush()
+        os.fsync(self._log_file.fileno())
+
+    def put(self, record: Dict[str, Any]):
+        """Queue the latest state of a record"""
+        self.put_many([record])
+
+    def put_many(self, records: List[Dict[str, Any]]):
+        """Queue the latest state of several records with one log write"""
+        with self._lock:
+            if self.intent_log is not None:
+                self._log(records)
+            for record in records:
+                self._pending[record.get(self.key_field)] = record
+            full = len(self._pending) >= self.max_pending
+        if full:
+            self.flush()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def flush(self):
+        """Write every pending record in one batch"""
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending:
+                    return
+                batch, self._pending = self._pending, {}
+                if self._log_file is not None:
+                    self._log_file.close()
+                    self._log_file = None
+                    os.replace(self.intent_log, self._flushing_log)
+
+            try:
+                self.write(list(batch.values()))
+            except BaseException:
+                # Requeue the batch behind any newer updates and log it again
+                with self._lock:
+                    requeued = [record for key, record in batch.items() if key not in self._pending]
+                    for record in requeued:
+                        self._pending[record.get(self.key_field)] = record
+                    if self.intent_log is not None and requeued:
+                        self._log(requeued)
+                raise
+            finally:
+                if self.intent_log is not None and os.path.exists(self._flushing_log):
+                    os.remove(self._flushing_log)
+
+    def _run(self):
+        """Flush on the interval until closed"""
+        while not self._closed.wait(self.interval):
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"Error flushing write-behind buffer: {e}")
+
+    def close(self):
+        """Stop the background flusher and write anything still pending"""
+        self._closed.set()
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+        self.flush()
+        with self._lock:
+            if self._log_file is not None:
+                self._log_file.close()
+                self._log_file = None
@@ -0,0 +1,51 @@
+"""
+Shared fixtures for the Tobey Finance Bank unit tests
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+
+from datetime import datetime, timedelta
+
+import pytest
+
+
+def make_transaction(transaction_id: str, timestamp: datetime, account_number: str = "000000000001",
+                     **fields) -> dict:
+    """Minimal transaction record as the database managers store it"""
+    record = {
+        'transaction_id': transaction_id,
+        'account_number': account_number,
+        'transaction_type': 'deposit',
+        'amount': 10.0,
+        'status': 'completed',
+        'description': "",
+        'timestamp': timestamp.isoformat(),
+    }
+    record.update(fields)
+    return record
+
+
+def make_audit_log(log_id: str, timestamp: datetime, employee_id: str = "EMP001", **fields) -> dict:
+    """Minimal audit log record as the database managers store it"""
+    record = {
+        'log_id': log_id,
+        'employee_id': employee_id,
+        'action': 'login',
+        'timestamp': timestamp.isoformat(),
+    }
+    record.update(fields)
+    return record
+
+
+def previous_month(now: datetime) -> datetime:
+    """A moment in the month before ``now``'s"""
+    return now.replace(day=1, hour=12, minute=0, second=0, microsecond=0) - timedelta(days=10)
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """Empty data directory"""
+    return str(tmp_path / "data")
@@ -0,0 +1,68 @@
+"""
+Tests for compressed archives of sealed log partitions
+"""
+
+import json
+import os
+import stat
+from datetime import datetime
+
+import pytest
+
+from conftest import make_transaction, previous_month
+from src.utils.backup import read_manifest, verify_backup
+from src.utils.database import DatabaseManager
+from src.utils.partitions import MonthlyPartitions
+
+NOW = datetime.now()
+LAST_MONTH = previous_month(NOW)
+MONTH = MonthlyPartitions.month_of(LAST_MONTH)
+
+
+def archived(data_dir, archive_format="gzip"):
+    """Database whose last month was sealed and archived by a rollover"""
+    db = DatabaseManager(data_dir, log_format="jsonl", partition_logs=True,
+                         archive_format=archive_format)
+    db.initialize_database()
+    db.save_transactions([make_transaction("old1", LAST_MONTH, account_number="A1"),
+                          make_transaction("old2", LAST_MONTH, account_number="A2")])
+    db.save_transaction(make_transaction("new", NOW, account_number="A1"))
+    return db
+
+
+@pytest.mark.parametrize("archive_format", ["gzip", "lzma"])
+def test_sealed_month_is_replaced_by_a_read_only_archive(data_dir, archive_format):
+    db = archived(data_dir, archive_format)
+    partitions = db._partitions[db.transactions_file]
+    suffix = MonthlyPartitions.ARCHIVE_FORMATS[archive_format][0]
+    archive_path = os.path.join(partitions.directory, MONTH + suffix)
+    assert partitions.paths(end=LAST_MONTH) == [archive_path]
+    assert not os.path.exists(os.path.join(partitions.directory, MONTH + ".jsonl"))
+    assert not os.stat(archive_path).st_mode & stat.S_IWUSR
+
+    with open(partitions.index_file(archive_path)) as f:
+        index = json.load(f)
+    assert (index['count'], index['field'], index['values']) == (2, 'account_number', ["A1", "A2"])
+    assert db.get_transaction("old2")['account_number'] == "A2"
+    assert [t['transaction_id'] for t in db.get_account_transactions("A1")] == ["old1", "new"]
+
+
+def test_segment_index_skips_archives_without_the_account(data_dir, monkeypatch):
+    db = archived(data_dir)
+    db._cache.clear()
+    opened = []
+    original = db._load_collection
+    monkeypatch.setattr(db, '_load_collection', lambda path: opened.append(path) or original(path))
+    assert db.get_account_transactions("A3") == []
+    assert not any(db._partitions[db.transactions_file].is_archived(path) for path in opened)
+
+
+def test_backup_includes_segment_indexes(data_dir, tmp_path):
+    db = archived(data_dir)
+    backup_path = db.backup_database(str(tmp_path / "backup"))
+    files = read_manifest(backup_path)['files']
+    directory = "transactions"
+    assert {os.path.join(directory, MONTH + ".jsonl.gz"),
+            os.path.join(directory, f".{MONTH}.index.json"),
+            os.path.join(directory, "manifest.json")} <= set(files)
+    assert verify_backup(backup_path) == []
@@ -0,0 +1,99 @@
+"""
+Tests for the storage backend registry and the interface every backend implements
+"""
+
+from datetime import datetime
+
+import pytest
+
+from conftest import make_audit_log, make_transaction
+from src.utils import backends
+from src.utils.backends import available_backends, create_database_manager, register_backend
+from src.utils.database import DatabaseManager
+from src.utils.memory_database import InMemoryDatabaseManager
+from src.utils.sqlite_database import SQLiteDatabaseManager
+from src.utils.storage import StorageBackend
+
+
+@pytest.fixture(params=available_backends())
+def db(request, data_dir):
+    db = create_database_manager(request.param, data_dir)
+    db.initialize_database()
+    yield db
+    db.close()
+
+
+def test_builtin_backends_are_registered():
+    assert available_backends() == ['json', 'jsonl', 'memory', 'sqlite']
+
+
+def test_environment_selects_the_backend_and_data_dir(data_dir, monkeypatch):
+    monkeypatch.setenv(backends.BACKEND_ENV_VAR, "sqlite")
+    monkeypatch.setenv(backends.DATA_DIR_ENV_VAR, data_dir)
+    db = create_database_manager()
+    try:
+        assert isinstance(db, SQLiteDatabaseManager)
+        assert db.data_dir == data_dir
+    finally:
+        db.close()
+    # Explicit arguments win over the environment
+    assert isinstance(create_database_manager("memory"), InMemoryDatabaseManager)
+
+
+def test_default_backend_is_json(data_dir, monkeypatch):
+    monkeypatch.delenv(backends.BACKEND_ENV_VAR, raising=False)
+    db = create_database_manager(data_dir=data_dir)
+    assert type(db) is DatabaseManager
+    assert db.log_format == "json"
+
+
+def test_unknown_backend_lists_the_available_ones():
+    with pytest.raises(ValueError, match="Available backends: json, jsonl, memory, sqlite"):
+        create_database_manager("postgres")
+
+
+def test_registered_factories_receive_the_options(data_dir, monkeypatch):
+    monkeypatch.setattr(backends, '_BACKENDS', dict(backends._BACKENDS))
+    calls = []
+
+    def factory(data_dir, **options):
+        calls.append((data_dir, options))
+        return InMemoryDatabaseManager()
+    register_backend("custom", factory)
+    assert "custom" in available_backends()
+    create_database_manager("custom", data_dir, group_commit=True)
+    assert calls == [(data_dir, {'group_commit': True})]
+
+
+def test_backend_round_trips_every_collection(db):
+    assert isinstance(db, StorageBackend)
+    db.save_account({'account_number': "A1", 'balance': 1.0})
+    db.update_account({'account_number': "A1", 'balance': 2.0})
+    assert db.get_account("A1")['balance'] == 2.0
+    db.save_customer({'customer_id': "C1", 'first_name': "Jane"})
+    assert [c['customer_id'] for c in db.iter_customers()] == ["C1"]
+    assert db.delete_customer("C1") and db.get_customer("C1") is None
+    db.save_employee({'employee_id': "E1", 'username': "jdoe"})
+    assert db.get_employee("E1")['username'] == "jdoe"
+
+    db.save_transactions([make_transaction("t2", datetime(2024, 1, 2)),
+                          make_transaction("t1", datetime(2024, 1, 1))])
+    assert [t['transaction_id'] for t in db.get_account_transactions("000000000001")] == ["t1", "t2"]
+    assert db.get_transaction("t2")['timestamp'] == "2024-01-02T00:00:00"
+    db.save_audit_log(make_audit_log("l1", datetime(2024, 1, 1)))
+    assert [log['log_id'] for log in db.get_employee_audit_logs("EMP001")] == ["l1"]
+    assert db.get_database_stats() == {'accounts': 1, 'customers': 0, 'transactions': 2}
+
+
+def test_returned_records_are_copies(db):
+    db.save_account({'account_number': "A1", 'balance': 1.0})
+    db.get_account("A1")['balance'] = 99.0
+    db.get_all_accounts()[0]['balance'] = 99.0
+    assert db.get_account("A1")['balance'] == 1.0
+
+
+def test_collection_version_changes_on_write(db):
+    version = db.get_collection_version('customers')
+    assert db.get_collection_version('customers') == version
+    db.save_customer({'customer_id': "C1"})
+    assert db.get_collection_version('customers') != version
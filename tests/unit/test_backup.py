@@ -0,0 +1,92 @@
+"""
+Tests for the incremental, checksummed backup sets
+"""
+
+import gzip
+import os
+
+import pytest
+
+from src.utils.backup import BackupWriter, latest_backup, read_manifest, verify_backup
+from src.utils.database import DatabaseManager
+from src.utils.sqlite_database import SQLiteDatabaseManager
+
+
+@pytest.fixture
+def db(data_dir):
+    db = DatabaseManager(data_dir)
+    db.initialize_database()
+    db.save_account({'account_number': "A1", 'balance': 10.0})
+    db.save_customer({'customer_id': "C1"})
+    return db
+
+
+@pytest.fixture
+def backup_dir(tmp_path):
+    return str(tmp_path / "backup")
+
+
+def backed_up_bytes(backup_path: str, relative_path: str) -> bytes:
+    entry = read_manifest(backup_path)['files'][relative_path]
+    with gzip.open(os.path.join(backup_path, entry['file']), 'rb') as f:
+        return f.read()
+
+
+def test_backup_set_copies_every_data_file(db, backup_dir):
+    backup_path = db.backup_database(backup_dir)
+    assert latest_backup(backup_dir) == backup_path
+    assert verify_backup(backup_path) == []
+    files = read_manifest(backup_path)['files']
+    assert {'accounts.json', 'customers.json', 'employees.json'} <= set(files)
+    with open(db.accounts_file, 'rb') as f:
+        assert backed_up_bytes(backup_path, 'accounts.json') == f.read()
+
+
+def test_unchanged_files_are_hard_linked_from_the_previous_set(db, backup_dir):
+    first = db.backup_database(backup_dir)
+    db.save_customer({'customer_id': "C2"})
+    second = db.backup_database(backup_dir)
+
+    manifest = read_manifest(second)
+    assert manifest['base'] == os.path.basename(first)
+    unchanged = os.stat(os.path.join(first, "accounts.json.gz"))
+    assert os.stat(os.path.join(second, "accounts.json.gz")).st_ino == unchanged.st_ino
+    changed = os.stat(os.path.join(first, "customers.json.gz"))
+    assert os.stat(os.path.join(second, "customers.json.gz")).st_ino != changed.st_ino
+    assert b'"C2"' in backed_up_bytes(second, 'customers.json')
+    assert verify_backup(second) == []
+
+
+def test_verify_reports_corrupt_and_missing_files(db, backup_dir):
+    backup_path = db.backup_database(backup_dir)
+    with gzip.open(os.path.join(backup_path, "accounts.json.gz"), 'wb') as f:
+        f.write(b"[]")
+    os.remove(os.path.join(backup_path, "customers.json.gz"))
+    assert sorted(verify_backup(backup_path)) == ['accounts.json', 'customers.json']
+
+
+def test_interrupted_backup_is_never_the_latest(db, backup_dir, monkeypatch):
+    first = db.backup_database(backup_dir)
+    db.save_customer({'customer_id': "C2"})
+
+    def fail(*args):
+        raise OSError("disk full")
+    monkeypatch.setattr(BackupWriter, 'add', fail)
+    with pytest.raises(OSError):
+        db.backup_database(backup_dir)
+    assert latest_backup(backup_dir) == first
+    assert os.listdir(backup_dir) == [os.path.basename(first)]
+
+
+def test_sqlite_backup_links_an_unchanged_database(data_dir, backup_dir):
+    db = SQLiteDatabaseManager(data_dir)
+    db.initialize_database()
+    try:
+        db.save_customer({'customer_id': "C1"})
+        first = db.backup_database(backup_dir)
+        second = db.backup_database(backup_dir)
+        assert verify_backup(second) == []
+        assert (os.stat(os.path.join(first, "bank.db.gz")).st_ino
+                == os.stat(os.path.join(second, "bank.db.gz")).st_ino)
+    finally:
+        db.close()
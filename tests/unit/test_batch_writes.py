@@ -0,0 +1,95 @@
+"""
+Tests for the batch write APIs of the database managers and services
+"""
+
+from datetime import datetime
+
+import pytest
+
+from conftest import make_transaction
+from src.models.account import AccountType
+from src.models.transaction import TransactionType
+from src.services.account_service import AccountService
+from src.services.transaction_service import TransactionService
+from src.utils.database import DatabaseManager
+from src.utils.sqlite_database import SQLiteDatabaseManager
+
+
+@pytest.fixture
+def db(data_dir):
+    db = DatabaseManager(data_dir, log_format="jsonl")
+    db.initialize_database()
+    return db
+
+
+def count_writes(monkeypatch, db):
+    """Record the file every rewrite or append goes to"""
+    writes = []
+    for name in ('_write_json_file', '_append_jsonl_records'):
+        original = getattr(db, name)
+        monkeypatch.setattr(db, name, lambda path, data, original=original: (
+            writes.append(path), original(path, data))[1])
+    return writes
+
+
+def test_batch_saves_write_each_file_once(db, monkeypatch):
+    writes = count_writes(monkeypatch, db)
+    db.save_accounts([{'account_number': f"A{i}"} for i in range(50)])
+    db.upsert_customers([{'customer_id': f"C{i}"} for i in range(50)])
+    db.save_transactions([make_transaction(f"t{i}", datetime(2024, 1, 1)) for i in range(50)])
+    assert writes == [db.accounts_file, db.customers_file, db.transactions_file]
+    assert len(db.get_all_accounts()) == len(db.get_all_transactions()) == 50
+
+
+def test_partitioned_batch_writes_each_month_once(data_dir, monkeypatch):
+    db = DatabaseManager(data_dir, partition_logs=True)
+    db.initialize_database()
+    writes = count_writes(monkeypatch, db)
+    db.save_transactions([make_transaction(f"t{i}", datetime(2024, 1 + i % 3, 1)) for i in range(30)])
+    assert len(writes) == len(set(writes)) == 3
+
+
+def test_sqlite_batch_saves(data_dir):
+    db = SQLiteDatabaseManager(data_dir)
+    db.initialize_database()
+    db.save_accounts([{'account_number': f"A{i}"} for i in range(10)])
+    db.save_transactions([make_transaction(f"t{i}", datetime(2024, 1, 1)) for i in range(10)])
+    assert db.get_database_stats() == {'accounts': 10, 'customers': 0, 'transactions': 10}
+    db.close()
+
+
+def test_create_accounts_and_deposit_many(db, monkeypatch):
+    service = AccountService(db)
+    accounts = service.create_accounts([
+        {'customer_id': "C1", 'account_type': AccountType.SAVINGS, 'initial_balance': 10.0},
+        {'customer_id': "C2", 'account_type': AccountType.CHECKING, 'initial_balance': -5.0},
+        {'customer_id': "C3", 'account_type': AccountType.CHECKING},
+    ])
+    assert accounts[1] is None
+    first, third = accounts[0].account_number, accounts[2].account_number
+
+    writes = count_writes(monkeypatch, db)
+    results = service.deposit_many([(first, 5.0), ("missing", 1.0), (third, 2.5), (first, 1.0)])
+    assert results == [True, False, True, True]
+    assert writes == [db.transactions_file, db.accounts_file]
+
+    reloaded = {a['account_number']: a for a in db.get_all_accounts()}
+    assert reloaded[first]['balance'] == 16.0
+    assert reloaded[third]['balance'] == 2.5
+    assert len(db.get_account_transactions(first)) == 2
+
+
+def test_create_transactions(db, monkeypatch):
+    service = TransactionService(db)
+    writes = count_writes(monkeypatch, db)
+    created = service.create_transactions([
+        {'account_number': "A1", 'transaction_type': TransactionType.DEPOSIT, 'amount': 5.0},
+        {'account_number': "A1", 'transaction_type': TransactionType.DEPOSIT, 'amount': -1.0},
+        {'account_number': "A2", 'transaction_type': TransactionType.WITHDRAWAL, 'amount': 3.0,
+         'description': "ATM"},
+    ])
+    assert created[1] is None
+    assert writes == [db.transactions_file]
+    assert {t['transaction_id'] for t in db.get_all_transactions()} == \
+        {created[0].transaction_id, created[2].transaction_id}
+    assert service.get_transaction(created[2].transaction_id).description == "ATM"
@@ -0,0 +1,90 @@
+"""
+Tests for the collection metadata sidecars behind get_database_stats
+"""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from conftest import make_transaction
+from src.utils import database
+from src.utils.collection_metadata import summarize_records
+from src.utils.database import DatabaseManager
+from src.utils.memory_database import InMemoryDatabaseManager
+
+
+@pytest.fixture
+def db(data_dir):
+    db = DatabaseManager(data_dir)
+    db.initialize_database()
+    return db
+
+
+def account(number: int, day: int) -> dict:
+    return {'account_number': f"A{number}", 'created_date': f"2024-01-{day:02d}T09:00:00",
+            'balance': 0.0}
+
+
+def recount(db, name: str) -> dict:
+    records = list(getattr(db, f"get_all_{name}")())
+    return summarize_records(records, 'created_date')
+
+
+def test_metadata_follows_saves_updates_and_deletes(db):
+    for number, day in enumerate((10, 5, 20, 15), start=1):
+        db.save_account(account(number, day))
+    db.update_account(dict(account(3, 20), balance=5.0))
+    db.delete_account("A1")
+    db.delete_account("A2")  # held the earliest timestamp
+    db.update_account(account(3, 1))  # moves the latest record to the front
+
+    metadata = db.get_collection_metadata('accounts')
+    expected = recount(db, 'accounts')
+    assert (metadata['count'], metadata['min_timestamp'], metadata['max_timestamp']) == (
+        2, "2024-01-01T09:00:00", "2024-01-15T09:00:00")
+    assert (metadata['count'], metadata['min_timestamp'], metadata['max_timestamp']) == (
+        expected['count'], expected['min_timestamp'], expected['max_timestamp'])
+    assert db.get_database_stats()['accounts'] == 2
+
+
+def test_rewrites_only_summarize_the_changed_records(db, monkeypatch):
+    db.save_accounts([account(number, 1 + number % 28) for number in range(100)])
+    db.get_collection_metadata('accounts')
+
+    summarized = []
+    original = database.summarize_records
+    monkeypatch.setattr(database, 'summarize_records',
+                        lambda records, field: summarized.append(len(list(records))) or
+                        original(records, field))
+    db.update_account(dict(account(50, 23), balance=1.0))
+    db.save_account(account(100, 12))
+    db.delete_account("A7")
+    assert max(summarized) <= 1
+    assert db.get_collection_metadata('accounts')['count'] == 100
+
+
+def test_externally_edited_file_is_summarized_on_read(db):
+    db.save_account(account(1, 1))
+    db.get_collection_metadata('accounts')
+    with open(db.accounts_file, 'w') as f:
+        json.dump([account(1, 1), account(2, 2), account(3, 3)], f)
+    metadata = db.get_collection_metadata('accounts')
+    assert (metadata['count'], metadata['max_timestamp']) == (3, "2024-01-03T09:00:00")
+
+
+@pytest.mark.parametrize('make_db', [
+    lambda data_dir: DatabaseManager(data_dir),
+    lambda data_dir: DatabaseManager(data_dir, log_format="jsonl"),
+    lambda data_dir: InMemoryDatabaseManager(),
+], ids=['json', 'jsonl', 'memory'])
+def test_changes_are_not_kept_after_writes(data_dir, make_db):
+    db = make_db(data_dir)
+    db.initialize_database()
+    db.get_all_transactions()  # cached, so appends extend the cached copy
+    for balance in range(100):
+        db.save_account(dict(account(1, 1), balance=float(balance)))
+        db.save_transaction(make_transaction(f"t{balance}", datetime(2024, 1, 1)))
+    db.delete_account("A1")
+    collections = db._collections.values() if isinstance(db, InMemoryDatabaseManager) else db._cache.values()
+    assert all(collection.take_changes() == ([], []) for collection in collections)
@@ -0,0 +1,139 @@
+"""
+Tests for cross-process locking and collection versions shared between workers
+"""
+
+import os
+import threading
+
+import pytest
+
+from src.models.employee import Department
+from src.services.employee_service import EmployeeService
+from src.utils.database import DatabaseManager
+from src.utils.file_lock import FileLock, fcntl
+from src.utils.memory_database import InMemoryDatabaseManager
+from src.utils.sqlite_database import STATS_TRIGGERS, TIMESTAMP_EXPRESSIONS, SQLiteDatabaseManager
+
+
+@pytest.fixture(params=['json', 'sqlite', 'memory'])
+def db(request, data_dir):
+    if request.param == 'json':
+        db = DatabaseManager(data_dir)
+    elif request.param == 'sqlite':
+        db = SQLiteDatabaseManager(data_dir)
+    else:
+        db = InMemoryDatabaseManager()
+    db.initialize_database()
+    yield db
+    if request.param == 'sqlite':
+        db.close()
+
+
+def count_full_loads(monkeypatch, db):
+    """Count the times a service reads the whole employees collection"""
+    loads = []
+    original = db.get_all_employees
+    monkeypatch.setattr(db, 'get_all_employees', lambda: loads.append(1) or original())
+    return loads
+
+
+@pytest.mark.skipif(fcntl is None, reason="needs fcntl")
+def test_lock_excludes_other_open_files(tmp_path):
+    path = str(tmp_path / ".lock")
+    lock = FileLock(path)
+    with lock:
+        with lock:  # reentrant within the process
+            other = os.open(path, os.O_RDWR)
+            try:
+                with pytest.raises(BlockingIOError):
+                    fcntl.flock(other, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            finally:
+                os.close(other)
+    other = os.open(path, os.O_RDWR)
+    try:
+        fcntl.flock(other, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    finally:
+        os.close(other)
+
+
+def test_managers_sharing_a_directory_do_not_lose_writes(data_dir):
+    # Each manager stands in for a worker process with its own caches and lock
+    workers = [DatabaseManager(data_dir) for _ in range(2)]
+    workers[0].initialize_database()
+
+    def save(worker, prefix):
+        for i in range(25):
+            worker.save_customer({'customer_id': f"{prefix}{i}"})
+
+    threads = [threading.Thread(target=save, args=(worker, f"W{n}-"))
+               for n, worker in enumerate(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(DatabaseManager(data_dir).get_all_customers()) == 50
+
+
+def test_own_writes_do_not_reload_employees(db, monkeypatch):
+    service = EmployeeService(db)
+    loads = count_full_loads(monkeypatch, db)
+    emp = service.create_employee("jdoe", "secret1", "Jane", "Doe", "jane@bank.com", Department.IT)
+    service.update_employee(emp.employee_id, last_name="Smith")
+    assert service.change_password(emp.employee_id, "secret1", "secret2")
+    assert service.authenticate("jdoe", "secret2") is emp
+    assert service.delete_employee(emp.employee_id)
+    service.get_all_employees()
+    assert loads == []
+
+
+def test_other_workers_writes_reload_employees(db, monkeypatch):
+    service = EmployeeService(db)
+    other = EmployeeService(db)
+    loads = count_full_loads(monkeypatch, db)
+    emp = other.create_employee("jdoe", "secret1", "Jane", "Doe", "jane@bank.com", Department.IT)
+    assert service.get_employee(emp.employee_id) is not None
+    assert [e.username for e in service.search_employees("jane")] == ["jdoe"]
+    assert loads == [1]
+
+
+def test_sqlite_versions_are_per_collection(data_dir):
+    db = SQLiteDatabaseManager(data_dir)
+    db.initialize_database()
+    try:
+        employees = db.get_collection_version('employees')
+        customers = db.get_collection_version('customers')
+        db.save_customer({'customer_id': "C1"})
+        assert db.get_collection_version('employees') == employees
+        assert db.get_collection_version('customers') != customers
+        snapshot = db.snapshot()
+        try:
+            assert snapshot.versions['customers'] == db.get_collection_version('customers')
+        finally:
+            snapshot.close()
+    finally:
+        db.close()
+
+
+def test_sqlite_stats_table_is_upgraded_with_versions(data_dir):
+    # Recreate the statistics table and triggers as they were before versions
+    old_triggers = STATS_TRIGGERS.replace(",\n        version = version + 1", "").replace("NULL, 0", "NULL")
+    db = SQLiteDatabaseManager(data_dir)
+    connection = db._get_connection()
+    with connection:
+        for table, expression in TIMESTAMP_EXPRESSIONS.items():
+            for event in ('insert', 'update', 'delete'):
+                connection.execute(f"DROP TRIGGER {table}_stats_{event}")
+        connection.execute("ALTER TABLE collection_stats DROP COLUMN version")
+    for table, expression in TIMESTAMP_EXPRESSIONS.items():
+        connection.executescript(old_triggers.format(
+            table=table, ts=expression.format(row=table),
+            new_ts=expression.format(row='NEW'), old_ts=expression.format(row='OLD')))
+    db.close()
+
+    db = SQLiteDatabaseManager(data_dir)
+    try:
+        version = db.get_collection_version('customers')
+        db.save_customer({'customer_id': "C1"})
+        assert db.get_collection_version('customers')[1] == version[1] + 1
+    finally:
+        db.close()
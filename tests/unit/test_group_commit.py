@@ -0,0 +1,99 @@
+"""
+Tests for the group-commit writer and DatabaseManager's atomic file writes
+"""
+
+import os
+import threading
+
+import pytest
+
+from src.utils.database import DatabaseManager
+from src.utils.group_commit import GroupCommitWriter
+
+
+def test_concurrent_submits_are_committed_together():
+    batches = []
+    started = threading.Barrier(8)
+
+    def commit(key, operations):
+        batches.append((key, list(operations)))
+        return [operation * 2 for operation in operations]
+
+    writer = GroupCommitWriter(commit, window=0.2)
+    results = {}
+
+    def submit(i):
+        started.wait()
+        results[i] = writer.submit("file", i)
+
+    threads = [threading.Thread(target=submit, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    writer.close()
+
+    assert results == {i: i * 2 for i in range(8)}
+    assert len(batches) < 8
+    assert sorted(op for _, operations in batches for op in operations) == list(range(8))
+
+
+def test_a_failed_commit_fails_every_caller_in_the_batch():
+    def commit(key, operations):
+        raise OSError("disk full")
+
+    writer = GroupCommitWriter(commit, window=0)
+    with pytest.raises(OSError, match="disk full"):
+        writer.submit("file", 1)
+    writer.close()
+
+
+def test_submit_after_close_is_rejected():
+    writer = GroupCommitWriter(lambda key, operations: [None] * len(operations))
+    writer.close()
+    with pytest.raises(RuntimeError):
+        writer.submit("file", 1)
+
+
+def test_group_commit_coalesces_database_writes(data_dir, monkeypatch):
+    db = DatabaseManager(data_dir, group_commit=True, commit_window=0.2)
+    db.initialize_database()
+    writes = []
+    write_json_file = db._write_json_file
+    monkeypatch.setattr(db, '_write_json_file',
+                        lambda path, data: (writes.append(path), write_json_file(path, data)))
+
+    started = threading.Barrier(10)
+
+    def save(i):
+        started.wait()
+        db.save_account({'account_number': f"A{i}", 'balance': float(i)})
+
+    threads = [threading.Thread(target=save, args=(i,)) for i in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    db.close()
+
+    assert len(writes) < 10
+    reopened = DatabaseManager(data_dir)
+    assert sorted(a['account_number'] for a in reopened.get_all_accounts()) == \
+        sorted(f"A{i}" for i in range(10))
+
+
+def test_failed_rewrite_leaves_the_old_file_and_no_temp_files(data_dir, monkeypatch):
+    db = DatabaseManager(data_dir)
+    db.initialize_database()
+    db.save_account({'account_number': "A1", 'balance': 1.0})
+
+    def fail(fd):
+        raise OSError("fsync failed")
+    monkeypatch.setattr(os, 'fsync', fail)
+    with pytest.raises(OSError):
+        db.save_account({'account_number': "A2", 'balance': 2.0})
+    monkeypatch.undo()
+
+    assert [name for name in os.listdir(data_dir) if name.endswith(".tmp")] == []
+    assert [a['account_number'] for a in DatabaseManager(data_dir).get_all_accounts()] == ["A1"]
+    assert db.get_account("A2") is None
@@ -0,0 +1,66 @@
+"""
+Tests for the time-ordered ULID generator
+"""
+
+import threading
+from datetime import datetime, timezone
+
+from src.models import ids
+from src.models.audit_log import AuditLog
+from src.models.ids import new_ulid, ulid_time
+from src.models.transaction import Transaction
+
+
+def freeze_clock(monkeypatch, milliseconds):
+    monkeypatch.setattr(ids.time, 'time_ns', lambda: milliseconds[0] * 1000000)
+
+
+def test_ids_are_crockford_base32_and_carry_their_time():
+    before = datetime.now(timezone.utc).replace(microsecond=0)
+    ulid = new_ulid()
+    assert len(ulid) == 26 and set(ulid) <= set(ids._DIGITS)
+    assert before <= ulid_time(ulid) <= datetime.now(timezone.utc)
+    assert ulid_time(ulid.lower()) == ulid_time(ulid)
+
+
+def test_ids_increase_within_a_millisecond_and_when_the_clock_steps_back(monkeypatch):
+    ids._reset_state()
+    clock = [1700000000000]
+    freeze_clock(monkeypatch, clock)
+    generated = [new_ulid() for _ in range(1000)]
+    clock[0] -= 5000
+    generated.append(new_ulid())
+    assert generated == sorted(generated) and len(set(generated)) == len(generated)
+    assert ulid_time(generated[-1]) == ulid_time(generated[0])
+
+
+def test_random_part_overflow_carries_into_the_time(monkeypatch):
+    ids._reset_state()
+    clock = [1700000000000]
+    freeze_clock(monkeypatch, clock)
+    first = new_ulid()
+    ids._state.random_part = ids._RANDOM_LIMIT - 1
+    second = new_ulid()
+    assert second > first
+    assert (ulid_time(second) - ulid_time(first)).total_seconds() == 0.001
+
+
+def test_threads_generate_distinct_increasing_sequences():
+    sequences = []
+
+    def generate():
+        sequences.append([new_ulid() for _ in range(2000)])
+    threads = [threading.Thread(target=generate) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert all(sequence == sorted(sequence) for sequence in sequences)
+    assert len({ulid for sequence in sequences for ulid in sequence}) == 8000
+
+
+def test_models_default_to_time_ordered_ids():
+    transactions = [Transaction(account_number="A1", amount=1) for _ in range(100)]
+    assert [t.transaction_id for t in transactions] == sorted(t.transaction_id for t in transactions)
+    logs = [AuditLog() for _ in range(100)]
+    assert [log.log_id for log in logs] == sorted(log.log_id for log in logs)
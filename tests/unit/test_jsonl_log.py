@@ -0,0 +1,79 @@
+"""
+Tests for the append-only JSONL log format of DatabaseManager
+"""
+
+import json
+import os
+from datetime import datetime
+
+from conftest import make_audit_log, make_transaction
+from src.utils.database import DatabaseManager
+
+
+def open_jsonl(data_dir):
+    db = DatabaseManager(data_dir, log_format="jsonl")
+    db.initialize_database()
+    return db
+
+
+def read_lines(path):
+    with open(path, 'rb') as f:
+        return f.read().split(b"\n")
+
+
+def test_records_are_appended_one_per_line(data_dir):
+    db = open_jsonl(data_dir)
+    db.save_transaction(make_transaction("t1", datetime(2024, 1, 1)))
+    db.save_transactions([make_transaction("t2", datetime(2024, 1, 2)),
+                          make_transaction("t3", datetime(2024, 1, 3))])
+    db.save_audit_log(make_audit_log("l1", datetime(2024, 1, 1)))
+
+    lines = read_lines(os.path.join(data_dir, "transactions.jsonl"))
+    assert [json.loads(line)['transaction_id'] for line in lines if line] == ["t1", "t2", "t3"]
+    assert lines[-1] == b""
+    reopened = open_jsonl(data_dir)
+    assert [t['transaction_id'] for t in reopened.get_all_transactions()] == ["t1", "t2", "t3"]
+    assert reopened.get_audit_log("l1")['employee_id'] == "EMP001"
+
+
+def test_legacy_json_log_is_converted(data_dir):
+    os.makedirs(data_dir)
+    with open(os.path.join(data_dir, "transactions.json"), 'w') as f:
+        json.dump([make_transaction("old", datetime(2024, 1, 1))], f)
+    db = open_jsonl(data_dir)
+    db.save_transaction(make_transaction("new", datetime(2024, 1, 2)))
+    assert [t['transaction_id'] for t in db.get_all_transactions()] == ["old", "new"]
+
+
+def test_torn_line_is_skipped_and_cut_off_before_the_next_append(data_dir):
+    db = open_jsonl(data_dir)
+    db.save_transaction(make_transaction("t1", datetime(2024, 1, 1)))
+    path = os.path.join(data_dir, "transactions.jsonl")
+    with open(path, 'a') as f:
+        f.write('{"transaction_id":"torn","acc')
+
+    assert [t['transaction_id'] for t in open_jsonl(data_dir).get_all_transactions()] == ["t1"]
+
+    db.save_transaction(make_transaction("t2", datetime(2024, 1, 2)))
+    assert [t['transaction_id'] for t in open_jsonl(data_dir).get_all_transactions()] == ["t1", "t2"]
+    assert b"torn" not in open(path, 'rb').read()
+
+
+def test_complete_last_line_without_newline_is_kept(data_dir):
+    db = open_jsonl(data_dir)
+    path = os.path.join(data_dir, "transactions.jsonl")
+    with open(path, 'w') as f:
+        f.write(json.dumps(make_transaction("t1", datetime(2024, 1, 1))))
+
+    db.save_transaction(make_transaction("t2", datetime(2024, 1, 2)))
+    assert [t['transaction_id'] for t in open_jsonl(data_dir).get_all_transactions()] == ["t1", "t2"]
+
+
+def test_long_torn_line_is_cut_off(data_dir):
+    db = open_jsonl(data_dir)
+    db.save_transaction(make_transaction("t1", datetime(2024, 1, 1)))
+    with open(os.path.join(data_dir, "transactions.jsonl"), 'a') as f:
+        f.write('{"description":"' + "x" * 20000)
+
+    db.save_transaction(make_transaction("t2", datetime(2024, 1, 2)))
+    assert [t['transaction_id'] for t in open_jsonl(data_dir).get_all_transactions()] == ["t1", "t2"]
@@ -0,0 +1,117 @@
+"""
+Tests for the streaming, resumable schema-migration runner
+"""
+
+import os
+from datetime import datetime
+
+import pytest
+
+from conftest import make_audit_log, make_transaction, previous_month
+from src.utils import schema
+from src.utils.database import DatabaseManager
+from src.utils.migrations import MigrationRunner
+from src.utils.partitions import MonthlyPartitions
+from src.utils.schema import SCHEMA_VERSION, SchemaVersionError, read_schema_version
+from src.utils.sqlite_database import SQLiteDatabaseManager
+
+NOW = datetime.now()
+LAST_MONTH = previous_month(NOW)
+
+
+@pytest.fixture
+def source_dir(data_dir):
+    db = DatabaseManager(data_dir)
+    db.initialize_database()
+    db.save_accounts([{'account_number': f"A{i}"} for i in range(5)])
+    db.upsert_customers([{'customer_id': f"C{i}"} for i in range(3)])
+    # Source order interleaves a closed month with the current one
+    db.save_transactions([make_transaction("t1", LAST_MONTH), make_transaction("t2", NOW),
+                          make_transaction("t3", LAST_MONTH.replace(hour=18)),
+                          make_transaction("t4", NOW)])
+    db.save_audit_logs([make_audit_log("l1", NOW), make_audit_log("l2", LAST_MONTH)])
+    return data_dir
+
+
+@pytest.fixture
+def target_dir(tmp_path):
+    return str(tmp_path / "migrated")
+
+
+def test_interleaved_months_are_sealed_once_at_the_end(source_dir, target_dir, monkeypatch):
+    def no_reopen(*args):
+        raise AssertionError("a partition was reopened during the migration")
+    monkeypatch.setattr(DatabaseManager, '_reopen_partition', no_reopen)
+
+    options = {'partition_logs': True, 'archive_format': "gzip"}
+    MigrationRunner(source_dir, target_dir, target_backend="jsonl", target_options=options,
+                    batch_size=1).run()
+
+    target = DatabaseManager(target_dir, log_format="jsonl", **options)
+    target.initialize_database()
+    assert sorted(t['transaction_id'] for t in target.get_all_transactions()) == ["t1", "t2", "t3", "t4"]
+    partitions = target._partitions[target.transactions_file]
+    assert partitions.sealed() == {MonthlyPartitions.month_of(LAST_MONTH)}
+    assert all(path.endswith(".jsonl.gz") for path in partitions.paths(end=LAST_MONTH))
+    assert read_schema_version(target_dir) == SCHEMA_VERSION
+
+
+def test_converts_between_backends(source_dir, target_dir):
+    MigrationRunner(source_dir, target_dir, target_backend="sqlite").run()
+    target = SQLiteDatabaseManager(target_dir)
+    target.initialize_database()
+    try:
+        assert target.get_database_stats() == {'accounts': 5, 'customers': 3, 'transactions': 4}
+        assert len(target.get_audit_logs()) == 2
+    finally:
+        target.close()
+    assert not os.path.exists(target_dir + ".partial")
+
+
+def test_interrupted_run_resumes_without_duplicates(source_dir, target_dir, monkeypatch):
+    runner = MigrationRunner(source_dir, target_dir, batch_size=2, workers=1)
+    original = runner._write_checkpoint
+
+    def crash_after_first_batch(name, checkpoint):
+        if name == 'accounts' and checkpoint['done'] > 2:
+            raise KeyboardInterrupt  # the batch was written, its checkpoint was not
+        original(name, checkpoint)
+    monkeypatch.setattr(runner, '_write_checkpoint', crash_after_first_batch)
+    with pytest.raises(KeyboardInterrupt):
+        runner.run()
+    assert not os.path.exists(target_dir)
+
+    MigrationRunner(source_dir, target_dir, batch_size=2).run()
+    accounts = DatabaseManager(target_dir).get_all_accounts()
+    assert sorted(a['account_number'] for a in accounts) == [f"A{i}" for i in range(5)]
+
+
+def test_resume_refuses_a_changed_source(source_dir, target_dir, monkeypatch):
+    runner = MigrationRunner(source_dir, target_dir)
+    monkeypatch.setattr(runner, '_migrate_collection', lambda *args: 1 / 0)
+    with pytest.raises(ZeroDivisionError):
+        runner.run()
+    DatabaseManager(source_dir).save_account({'account_number': "A9"})
+    with pytest.raises(RuntimeError, match="changed since the migration started"):
+        MigrationRunner(source_dir, target_dir).run()
+
+
+def test_existing_target_is_not_overwritten(source_dir, target_dir):
+    os.makedirs(target_dir)
+    with pytest.raises(ValueError):
+        MigrationRunner(source_dir, target_dir).run()
+
+
+def test_newer_source_schema_is_rejected(source_dir, target_dir):
+    schema.write_schema_version(source_dir, SCHEMA_VERSION + 1)
+    with pytest.raises(SchemaVersionError, match="newer"):
+        MigrationRunner(source_dir, target_dir).run()
+
+
+@pytest.mark.parametrize('content', ['{"version": "two"}', '{}', '[1]', '{"vers'])
+def test_unreadable_schema_version_names_the_file(data_dir, content):
+    os.makedirs(data_dir)
+    with open(os.path.join(data_dir, schema.SCHEMA_VERSION_FILE), 'w') as f:
+        f.write(content)
+    with pytest.raises(SchemaVersionError, match=schema.SCHEMA_VERSION_FILE):
+        read_schema_version(data_dir)
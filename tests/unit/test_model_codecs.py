@@ -0,0 +1,71 @@
+"""
+Tests for the generated to_dict/from_dict codecs of the models
+"""
+
+from datetime import datetime
+from enum import Enum
+
+import pytest
+
+from src.models.account import Account, AccountType
+from src.models.audit_log import AuditAction, AuditLog
+from src.models.codec import EnumTable
+from src.models.customer import Customer, CustomerStatus
+from src.models.employee import Employee, Role
+from src.models.transaction import Transaction, TransactionStatus, TransactionType
+
+
+class Colour(Enum):
+    RED = "red"
+
+
+def test_enum_table_fails_like_the_enum():
+    table = EnumTable(Colour)
+    assert table["red"] is Colour.RED
+    assert table[Colour.RED] is Colour.RED
+    with pytest.raises(ValueError) as error:
+        Colour("blue")
+    with pytest.raises(ValueError, match=str(error.value)):
+        table["blue"]
+
+
+@pytest.mark.parametrize('model', [
+    Account(customer_id="C1", account_type=AccountType.CHECKING, balance=12.5),
+    Customer(first_name="Jane", last_name="Doe", date_of_birth=datetime(1990, 5, 1),
+             status=CustomerStatus.SUSPENDED, accounts=["A1"]),
+    Transaction(account_number="A1", amount=10, transaction_type=TransactionType.TRANSFER,
+                target_account="A2", status=TransactionStatus.COMPLETED, balance_after=90),
+    AuditLog(employee_id="EMP001", action=AuditAction.CREATE_ACCOUNT, additional_data={'n': 1}),
+    Employee(username="jdoe", role=Role.ADMIN, last_login=datetime(2024, 1, 1)),
+], ids=lambda model: type(model).__name__)
+def test_round_trip(model):
+    data = model.to_dict()
+    assert type(model).from_dict(data) == model
+    assert all(not isinstance(value, (Enum, datetime)) for value in data.values())
+
+
+def test_from_dict_leaves_the_record_unchanged():
+    record = {'transaction_id': "t1", 'account_number': "A1", 'transaction_type': "deposit",
+              'amount': 10.0, 'status': "completed", 'timestamp': "2024-01-01T00:00:00",
+              'unknown': True}
+    original = dict(record)
+    transaction = Transaction.from_dict(record)
+    assert record == original
+    assert transaction.transaction_type is TransactionType.DEPOSIT
+    assert transaction.timestamp == datetime(2024, 1, 1)
+    assert transaction.currency == "USD" and transaction.fee == 0 and transaction.balance_after is None
+
+
+def test_missing_and_empty_fields_take_their_defaults():
+    customer = Customer.from_dict({'customer_id': "C1", 'first_name': "Jane", 'last_name': "Doe",
+                                   'date_of_birth': ""})
+    assert customer.date_of_birth is None and customer.accounts == []
+    assert Customer.from_dict({'first_name': "J", 'last_name': "D"}).customer_id
+    assert Employee.from_dict({'username': "jdoe", 'last_login': None}).last_login is None
+
+
+def test_invalid_values_still_fail_validation():
+    with pytest.raises(ValueError):
+        Transaction.from_dict({'account_number': "A1", 'amount': 10.0, 'transaction_type': "gift"})
+    with pytest.raises(ValueError, match="positive"):
+        Transaction.from_dict({'account_number': "A1", 'amount': 0})
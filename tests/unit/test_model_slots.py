@@ -0,0 +1,76 @@
+"""
+Tests for the slotted, compact model classes
+"""
+
+import copy
+import pickle
+from dataclasses import asdict, dataclass, field, fields
+from typing import List
+
+import pytest
+
+from src.models.account import Account
+from src.models.audit_log import AuditLog
+from src.models.customer import Customer
+from src.models.slots import add_slots
+from src.models.transaction import Transaction, TransactionType
+
+
+def models():
+    return [Account(customer_id="C1", balance=5),
+            Customer(first_name="Jane", last_name="Doe", accounts=["A1"]),
+            Transaction(account_number="A1", amount=10),
+            AuditLog(employee_id="EMP001", additional_data={'n': 1})]
+
+
+@pytest.mark.parametrize('model', models(), ids=lambda model: type(model).__name__)
+def test_models_have_no_instance_dict(model):
+    assert not hasattr(model, '__dict__')
+    assert type(model).__slots__ == tuple(f.name for f in fields(model))
+    with pytest.raises(AttributeError):
+        model.undeclared = 1
+
+
+@pytest.mark.parametrize('model', models(), ids=lambda model: type(model).__name__)
+def test_models_keep_their_dataclass_behaviour(model):
+    assert pickle.loads(pickle.dumps(model)) == model
+    duplicate = copy.deepcopy(model)
+    assert duplicate == model and duplicate is not model
+    assert asdict(duplicate) == asdict(model)
+    assert repr(model).startswith(type(model).__name__ + "(")
+
+
+def test_mutable_defaults_are_not_shared():
+    first = Customer(first_name="Jane", last_name="Doe")
+    first.accounts.append("A1")
+    assert Customer(first_name="John", last_name="Doe").accounts == []
+
+
+def test_state_pickled_before_slotting_still_loads():
+    @dataclass
+    class Record:
+        name: str = ""
+        tags: List[str] = field(default_factory=list)
+    old = Record("a", ["x"])
+    state = old.__reduce_ex__(2)[2]
+    assert state == {'name': "a", 'tags': ["x"]}
+
+    slotted = add_slots(Record)
+    restored = slotted.__new__(slotted)
+    restored.__setstate__(state)
+    assert (restored.name, restored.tags) == ("a", ["x"])
+    assert restored.__getstate__() == ["a", ["x"]]
+
+
+def test_repeated_strings_are_shared():
+    account_number = "".join(["0000", "0001"])
+    first = Transaction(account_number="00000001", amount=1)
+    second = Transaction(account_number=account_number, amount=1,
+                         transaction_type=TransactionType.TRANSFER,
+                         target_account="".join(["0000", "0002"]))
+    assert second.account_number is first.account_number
+    assert second.target_account is Transaction(account_number="00000002", amount=1).account_number
+    logs = [AuditLog(employee_id="".join(["EMP", "001"]), user_agent="".join(["curl", "/8"]))
+            for _ in range(2)]
+    assert logs[0].employee_id is logs[1].employee_id
+    assert logs[0].user_agent is logs[1].user_agent
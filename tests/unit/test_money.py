@@ -0,0 +1,82 @@
+"""
+Tests for integer-cents money and packed amount columns
+"""
+
+import json
+from decimal import Decimal
+
+import pytest
+
+from src.models.account import Account, AccountType
+from src.models.money import Money, MoneyColumn, to_cents
+from src.models.transaction import TransactionType
+from src.services.account_service import AccountService
+from src.services.transaction_service import TransactionService
+from src.utils.memory_database import InMemoryDatabaseManager
+
+
+@pytest.mark.parametrize('amount, cents', [
+    (0.285, 29), (1.005, 101), (-0.015, -2), (12, 1200), ("0.105", 11), (Decimal("2.5"), 250),
+])
+def test_amounts_round_half_up_to_the_cent(amount, cents):
+    assert to_cents(amount) == cents
+
+
+@pytest.mark.parametrize('amount', ["ten", None, [1]])
+def test_invalid_amounts_are_rejected(amount):
+    with pytest.raises(ValueError):
+        to_cents(amount)
+
+
+def test_arithmetic_is_exact():
+    assert Money(0.1) + 0.2 == 0.3
+    assert 1.0 - Money(0.9) == Money(0.1)
+    assert sum([Money(0.1)] * 10) == 1
+    assert type(Money(0.1) + Money(0.2)) is Money
+    assert Money(10) * 3 == 30 and Money(100.0) * 0.02 == 2
+    assert Money(0.07) * 0.5 == 0.04  # 3.5 cents, rounded half up
+    assert abs(Money(-1.25)) == 1.25 and (-Money(1.25)).cents == -125
+
+
+def test_money_behaves_as_a_float():
+    amount = Money(1234.5)
+    assert isinstance(amount, float) and amount == 1234.5
+    assert f"{amount:,.2f}" == "1,234.50"
+    assert json.dumps({'amount': amount}) == '{"amount": 1234.5}'
+    assert Money(amount) is amount
+
+
+def test_column_totals_are_exact():
+    column = MoneyColumn([0.1] * 1000)
+    assert sum([0.1] * 1000) != 100
+    assert column.total() == 100 and column.total(range(10)) == 1
+    column[0] = 5
+    column.append("0.01")
+    assert (len(column), column[0], column[1000]) == (1001, 5, 0.01)
+    assert column.cents.itemsize == 8
+
+
+def test_models_hold_money():
+    account = Account(customer_id="C1", balance=0.1)
+    account.deposit(0.2)
+    assert account.balance == 0.3 and type(account.balance) is Money
+
+
+@pytest.mark.parametrize('amount', [0.001, 0.0049, -0.001, 0])
+def test_amounts_below_half_a_cent_are_rejected(amount):
+    accounts = AccountService(InMemoryDatabaseManager())
+    account = accounts.create_account("C1", AccountType.CHECKING, 10.0)
+    assert not accounts.deposit(account.account_number, amount)
+    assert not accounts.withdraw(account.account_number, amount)
+    assert accounts.get_account_balance(account.account_number) == 10
+    assert accounts.deposit(account.account_number, 0.005)
+    assert accounts.get_account_balance(account.account_number) == 10.01
+
+
+def test_transaction_summary_totals_are_exact():
+    service = TransactionService(InMemoryDatabaseManager())
+    service.create_transactions([{'account_number': "A1", 'transaction_type': TransactionType.DEPOSIT,
+                                  'amount': 0.1}] * 30)
+    summary = service.get_transaction_summary("A1")
+    assert summary['total_deposits'] == 3 and type(summary['total_deposits']) is Money
+    assert service.get_transaction_statistics()['by_type']['deposit']['total_amount'] == 3
@@ -0,0 +1,95 @@
+"""
+Tests for monthly partitioning of transactions and audit logs
+"""
+
+import os
+from datetime import datetime
+
+import pytest
+
+from conftest import make_audit_log, make_transaction, previous_month
+from src.utils.database import DatabaseManager, _AppendOperation
+from src.utils.partitions import MonthlyPartitions
+
+NOW = datetime.now()
+LAST_MONTH = previous_month(NOW)
+
+
+def open_partitioned(data_dir, log_format="json", archive_format=None):
+    db = DatabaseManager(data_dir, log_format=log_format, partition_logs=True,
+                         archive_format=archive_format)
+    db.initialize_database()
+    return db
+
+
+def rolled_over(data_dir, log_format="json", archive_format=None):
+    """Database whose last month was sealed when the current month's first record arrived"""
+    db = open_partitioned(data_dir, log_format, archive_format)
+    db.save_transaction(make_transaction("old", LAST_MONTH))
+    db.save_audit_log(make_audit_log("old-log", LAST_MONTH))
+    db.save_transaction(make_transaction("new", NOW))
+    db.save_audit_log(make_audit_log("new-log", NOW))
+    partitions = db._partitions[db.transactions_file]
+    assert partitions.sealed() == {MonthlyPartitions.month_of(LAST_MONTH)}
+    return db
+
+
+def transaction_ids(db):
+    return sorted(t['transaction_id'] for t in db.get_all_transactions())
+
+
+def test_records_are_split_by_month_and_ranges_prune_partitions(data_dir):
+    db = open_partitioned(data_dir)
+    db.save_transactions([make_transaction("jan", datetime(2024, 1, 5)),
+                          make_transaction("feb", datetime(2024, 2, 5))])
+    directory = os.path.join(data_dir, "transactions")
+    assert {"2024-01.json", "2024-02.json"} <= set(os.listdir(directory))
+    assert db._log_files(db.transactions_file, datetime(2024, 2, 1), datetime(2024, 2, 28)) == \
+        [os.path.join(directory, "2024-02.json")]
+    assert [t['transaction_id'] for t in db.get_transactions_by_date_range(
+        datetime(2024, 2, 1), datetime(2024, 2, 28))] == ["feb"]
+
+
+@pytest.mark.parametrize("log_format", ["json", "jsonl"])
+@pytest.mark.parametrize("archive_format", [None, "gzip"])
+def test_backdated_writes_reopen_a_sealed_month(data_dir, log_format, archive_format):
+    db = rolled_over(data_dir, log_format, archive_format)
+    db.save_transaction(make_transaction("late", LAST_MONTH, account_number="LATE"))
+    db.save_audit_log(make_audit_log("late-log", LAST_MONTH, employee_id="EMP-LATE"))
+
+    reopened = open_partitioned(data_dir, log_format, archive_format)
+    assert transaction_ids(reopened) == ["late", "new", "old"]
+    assert [t['transaction_id'] for t in reopened.get_account_transactions("LATE")] == ["late"]
+    assert [log['log_id'] for log in reopened.get_audit_logs(employee_id="EMP-LATE")] == ["late-log"]
+    # Startup sealed (and archived) the month again, indexing the late records too
+    partitions = reopened._partitions[reopened.transactions_file]
+    assert MonthlyPartitions.month_of(LAST_MONTH) in partitions.sealed()
+    if archive_format:
+        assert all(path.endswith(".jsonl.gz") for path in partitions.paths(end=LAST_MONTH))
+
+
+@pytest.mark.parametrize("archive_format", [None, "gzip"])
+def test_updating_an_old_transaction_reopens_its_month(data_dir, archive_format):
+    db = rolled_over(data_dir, archive_format=archive_format)
+    db.update_transaction(make_transaction("old", LAST_MONTH, status='cancelled'))
+    assert db.get_transaction("old")['status'] == 'cancelled'
+    assert open_partitioned(data_dir, archive_format=archive_format).get_transaction("old")['status'] == \
+        'cancelled'
+
+
+@pytest.mark.parametrize("archive_format", [None, "gzip"])
+def test_deleting_an_old_transaction_reopens_its_month(data_dir, archive_format):
+    db = rolled_over(data_dir, archive_format=archive_format)
+    assert db.delete_transaction("old")
+    assert db.get_transaction("old") is None
+    assert transaction_ids(open_partitioned(data_dir, archive_format=archive_format)) == ["new"]
+
+
+def test_write_racing_a_reseal_in_another_process_reopens_the_month(data_dir):
+    db = rolled_over(data_dir)
+    late = make_transaction("late", LAST_MONTH)
+    path = db._prepare_log_file(db.transactions_file, db._log_file_for(db.transactions_file, late))
+    # Another process starts up, sealing the month again before the write commits
+    open_partitioned(data_dir)
+    db._submit(path, _AppendOperation([late]))
+    assert transaction_ids(open_partitioned(data_dir)) == ["late", "new", "old"]
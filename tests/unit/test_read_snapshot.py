@@ -0,0 +1,101 @@
+"""
+Tests for point-in-time read snapshots
+"""
+
+from datetime import datetime
+
+import pytest
+
+from conftest import make_audit_log, make_transaction, previous_month
+from src.utils.backends import create_database_manager
+from src.utils.database import DatabaseManager
+
+
+@pytest.fixture(params=['json', 'jsonl', 'sqlite', 'memory'])
+def db(request, data_dir):
+    db = create_database_manager(request.param, data_dir)
+    db.initialize_database()
+    yield db
+    db.close()
+
+
+def test_snapshot_ignores_later_writes(db):
+    db.save_customer({'customer_id': "C1", 'first_name': "Jane"})
+    db.save_transaction(make_transaction("t1", datetime(2024, 1, 1)))
+    with db.snapshot() as snapshot:
+        db.update_customer({'customer_id': "C1", 'first_name': "Janet"})
+        db.save_customer({'customer_id': "C2"})
+        db.update_transaction(make_transaction("t1", datetime(2024, 1, 1), amount=99.0))
+        db.save_transaction(make_transaction("t2", datetime(2024, 1, 2)))
+        assert [c['first_name'] for c in snapshot.iter_customers()] == ["Jane"]
+        assert snapshot.get_customer("C2") is None
+        assert [t['amount'] for t in snapshot.iter_transactions()] == [10.0]
+        assert snapshot.get_transaction("t1")['amount'] == 10.0
+    assert db.get_transaction("t1")['amount'] == 99.0
+
+
+def test_snapshot_covers_only_the_named_collections(db):
+    db.save_audit_log(make_audit_log("l1", datetime(2024, 1, 1)))
+    with db.snapshot(collections=['audit_logs']) as snapshot:
+        assert set(snapshot.versions) == {'audit_logs'}
+        assert [log['log_id'] for log in snapshot.iter_audit_logs()] == ["l1"]
+        with pytest.raises(ValueError):
+            list(snapshot.iter_customers())
+    with pytest.raises(ValueError):
+        db.snapshot(collections=['loans'])
+
+
+def test_audit_logs_newest_first(db):
+    db.save_audit_logs([make_audit_log("l2", datetime(2024, 1, 2)),
+                        make_audit_log("l3", datetime(2024, 1, 3), employee_id="EMP002"),
+                        make_audit_log("l1", datetime(2024, 1, 1))])
+    with db.snapshot(collections=['audit_logs']) as snapshot:
+        assert [log['log_id'] for log in snapshot.iter_audit_logs(newest_first=True)] == [
+            "l3", "l2", "l1"]
+        assert [log['log_id'] for log in snapshot.iter_audit_logs(
+            employee_id="EMP001", newest_first=True)] == ["l2", "l1"]
+
+
+def test_newest_first_spans_partitions_with_late_writes(data_dir):
+    db = DatabaseManager(data_dir, log_format="jsonl", partition_logs=True)
+    db.initialize_database()
+    now = datetime.now()
+    earlier = previous_month(now)
+    db.save_audit_log(make_audit_log("old", earlier))
+    db.save_audit_log(make_audit_log("new", now))
+    db.save_audit_log(make_audit_log("late", earlier.replace(hour=18)))
+    with db.snapshot(collections=['audit_logs']) as snapshot:
+        assert [log['log_id'] for log in snapshot.iter_audit_logs(newest_first=True)] == [
+            "new", "late", "old"]
+    assert [log['log_id'] for log in db.get_audit_logs()] == ["new", "late", "old"]
+
+
+@pytest.mark.parametrize('log_format', ['json', 'jsonl'])
+def test_cold_snapshot_parses_nothing_up_front(data_dir, log_format, monkeypatch):
+    writer = DatabaseManager(data_dir, log_format=log_format)
+    writer.initialize_database()
+    writer.save_audit_logs([make_audit_log(f"l{i}", datetime(2024, 1, 1 + i)) for i in range(3)])
+
+    db = DatabaseManager(data_dir, log_format=log_format)
+    parsed = []
+    original = db._load_collection
+    monkeypatch.setattr(db, '_load_collection', lambda path: parsed.append(path) or original(path))
+    snapshot = db.snapshot(collections=['audit_logs'])
+    writer.save_audit_log(make_audit_log("l3", datetime(2024, 1, 4)))
+    assert parsed == []
+    assert [log['log_id'] for log in snapshot.iter_audit_logs()] == ["l0", "l1", "l2"]
+    assert snapshot.get_audit_log("l1")['log_id'] == "l1"
+    snapshot.close()
+    assert list(snapshot.iter_audit_logs()) == []
+
+
+def test_close_is_idempotent(db):
+    db.save_audit_log(make_audit_log("l1", datetime(2024, 1, 1)))
+    snapshot = db.snapshot(collections=['audit_logs'])
+    logs = snapshot.iter_audit_logs()
+    snapshot.close()
+    snapshot.close()
+    with db.snapshot(collections=['audit_logs']) as snapshot:
+        assert [log['log_id'] for log in snapshot.iter_audit_logs()] == ["l1"]
+    snapshot.close()
+    assert list(logs) == []
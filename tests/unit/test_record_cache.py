@@ -0,0 +1,59 @@
+"""
+Tests for DatabaseManager's cached, primary-key indexed collections
+"""
+
+import json
+import os
+
+from src.utils.database import DatabaseManager
+
+
+def open_db(data_dir):
+    db = DatabaseManager(data_dir)
+    db.initialize_database()
+    return db
+
+
+def test_lookups_are_served_from_the_cache(data_dir, monkeypatch):
+    db = open_db(data_dir)
+    db.save_accounts([{'account_number': f"A{i}", 'balance': float(i)} for i in range(100)])
+    assert db.get_account("A42")['balance'] == 42.0
+
+    def fail(*args, **kwargs):
+        raise AssertionError("collection was re-read")
+    monkeypatch.setattr(db, '_read_json_file', fail)
+    assert db.get_account("A7")['balance'] == 7.0
+    assert db.get_account("missing") is None
+
+
+def test_cache_reloads_when_another_writer_changes_the_file(data_dir):
+    db = open_db(data_dir)
+    other = open_db(data_dir)
+    db.save_account({'account_number': "A1", 'balance': 1.0})
+    assert other.get_account("A1")['balance'] == 1.0
+
+    db.save_account({'account_number': "A1", 'balance': 2.0})
+    assert other.get_account("A1")['balance'] == 2.0
+
+    with open(os.path.join(data_dir, "accounts.json"), 'w') as f:
+        json.dump([{'account_number': "A9", 'balance': 9.0}], f)
+    assert db.get_account("A1") is None
+    assert db.get_account("A9")['balance'] == 9.0
+
+
+def test_returned_records_are_copies(data_dir):
+    db = open_db(data_dir)
+    db.save_customer({'customer_id': "C1", 'accounts': ["A1"]})
+    customer = db.get_customer("C1")
+    customer['accounts'].append("A2")
+    db.get_all_customers()[0]['customer_id'] = "changed"
+    assert db.get_customer("C1")['accounts'] == ["A1"]
+
+
+def test_delete_keeps_the_key_index_consistent(data_dir):
+    db = open_db(data_dir)
+    db.save_accounts([{'account_number': f"A{i}"} for i in range(5)])
+    assert db.delete_account("A1")
+    assert not db.delete_account("A1")
+    assert [db.get_account(f"A{i}") is not None for i in range(5)] == [True, False, True, True, True]
+    assert open_db(data_dir).get_account("A4") == {'account_number': "A4"}
@@ -0,0 +1,131 @@
+"""
+Tests for the checksummed service snapshots and their shutdown saves
+"""
+
+import os
+
+import pytest
+
+from src.models.account import AccountType
+from src.models.transaction import TransactionType
+from src.services.account_service import AccountService
+from src.services.customer_service import CustomerService
+from src.services.transaction_service import TransactionService
+from src.utils.database import DatabaseManager
+from src.utils.snapshot import SnapshotStore
+from src.utils.text_index import InvertedIndex, TrigramIndex
+
+
+@pytest.fixture
+def db(data_dir):
+    db = DatabaseManager(data_dir, log_format="jsonl")
+    db.initialize_database()
+    return db
+
+
+def forbid_full_load(monkeypatch, db, getter):
+    """Fail the test if a service falls back to loading from the database"""
+    def fail():
+        raise AssertionError(f"{getter} called instead of restoring the snapshot")
+    monkeypatch.setattr(db, getter, fail)
+
+
+def test_store_round_trips_for_the_same_version(tmp_path):
+    store = SnapshotStore(str(tmp_path))
+    store.save('accounts', ('v1',), {'A1': 10})
+    assert store.load('accounts', ('v1',)) == {'A1': 10}
+    assert store.load('accounts', ('v2',)) is None
+    assert store.load('customers', ('v1',)) is None
+
+
+@pytest.mark.parametrize('corrupt', [
+    lambda data: b"NOTSNAP!" + data[8:],
+    lambda data: data[:-1] + bytes([data[-1] ^ 0xFF]),
+    lambda data: data[:10],
+])
+def test_store_rejects_damaged_snapshots(tmp_path, corrupt):
+    store = SnapshotStore(str(tmp_path))
+    store.save('accounts', ('v1',), {'A1': 10})
+    path = os.path.join(str(tmp_path), "accounts.snapshot")
+    with open(path, 'rb') as f:
+        data = f.read()
+    with open(path, 'wb') as f:
+        f.write(corrupt(data))
+    assert store.load('accounts', ('v1',)) is None
+
+
+def test_restart_restores_state_saved_on_shutdown(db, monkeypatch):
+    customers = CustomerService(db)
+    customer = customers.create_customer("Jane", "Doe", "jane@example.com")
+    customers.update_customer(customer.customer_id, phone="555-0100")
+    customers.save_snapshot()
+
+    forbid_full_load(monkeypatch, db, 'get_all_customers')
+    restarted = CustomerService(db)
+    assert restarted.get_customer(customer.customer_id).phone == "555-0100"
+    assert [c.customer_id for c in restarted.search_customers("jane")] == [customer.customer_id]
+
+
+def test_snapshot_is_not_saved_after_another_writer(db):
+    stale = CustomerService(db)
+    writer = CustomerService(db)
+    customer = writer.create_customer("Jane", "Doe")
+    stale.create_customer("John", "Smith")
+    stale.save_snapshot()
+
+    # The stale service missed Jane, so the next start must reload from the database
+    restarted = CustomerService(db)
+    assert restarted.get_customer(customer.customer_id) is not None
+
+
+def test_write_behind_updates_are_flushed_before_the_snapshot(db, monkeypatch):
+    accounts = AccountService(db, write_behind=True, flush_interval=60)
+    account = accounts.create_account("C1", AccountType.SAVINGS, 100.0)
+    accounts.deposit(account.account_number, 25.0)
+    accounts.save_snapshot()
+    accounts.close()
+
+    forbid_full_load(monkeypatch, db, 'get_all_accounts')
+    restarted = AccountService(db)
+    assert restarted.get_account_balance(account.account_number) == 125
+    assert db.get_account(account.account_number)['balance'] == 125
+
+
+def test_memory_only_status_changes_are_not_snapshotted(db, monkeypatch):
+    transactions = TransactionService(db)
+    transaction = transactions.create_transaction("A1", TransactionType.DEPOSIT, 10.0)
+    transactions.save_snapshot()
+    transactions.process_transaction(transaction.transaction_id)
+    transactions.create_transaction("A1", TransactionType.DEPOSIT, 5.0)
+    transactions.save_snapshot()
+
+    calls = []
+    original = db.get_all_transactions
+    monkeypatch.setattr(db, 'get_all_transactions', lambda: calls.append(1) or original())
+    restarted = TransactionService(db)
+    assert calls == [1]
+    assert len(restarted.transactions) == 2
+
+
+def test_restart_restores_the_transaction_search_index(db, monkeypatch):
+    transactions = TransactionService(db)
+    rent = transactions.create_transaction("A1", TransactionType.PAYMENT, 900.0, "Rent March")
+    transactions.create_transaction("A1", TransactionType.DEPOSIT, 10.0, "Refund")
+    transactions.save_snapshot()
+
+    forbid_full_load(monkeypatch, db, 'get_all_transactions')
+    monkeypatch.setattr(InvertedIndex, 'add', None)
+    restarted = TransactionService(db)
+    assert [t.transaction_id for t in restarted.search_transactions("rent mar")] == [rent.transaction_id]
+
+
+def test_restart_restores_the_customer_search_index(db, monkeypatch):
+    customers = CustomerService(db)
+    jane = customers.create_customer("Jane", "Doe", "jane@example.com")
+    customers.create_customer("Janet", "Smith")
+    customers.save_snapshot()
+
+    forbid_full_load(monkeypatch, db, 'get_all_customers')
+    monkeypatch.setattr(TrigramIndex, 'add', None)
+    restarted = CustomerService(db)
+    assert [c.customer_id for c in restarted.search_customers("jane d")] == [jane.customer_id]
@@ -0,0 +1,92 @@
+"""
+Tests for the SQLite storage engine
+"""
+
+from datetime import datetime
+
+import pytest
+
+from conftest import make_audit_log, make_transaction
+from src.utils.sqlite_database import SQLiteDatabaseManager
+
+
+@pytest.fixture
+def db(data_dir):
+    db = SQLiteDatabaseManager(data_dir)
+    db.initialize_database()
+    yield db
+    db.close()
+
+
+def ids(records, field='transaction_id'):
+    return [record[field] for record in records]
+
+
+def test_account_crud(db):
+    db.save_account({'account_number': "A1", 'customer_id': "C1", 'balance': 5.0})
+    db.save_accounts([{'account_number': "A2", 'customer_id': "C1", 'balance': 1.0},
+                      {'account_number': "A1", 'customer_id': "C1", 'balance': 7.0}])
+    assert db.get_account("A1")['balance'] == 7.0
+    assert ids(db.get_all_accounts(), 'account_number') == ["A1", "A2"]
+    assert ids(db.iter_accounts(lambda a: a['balance'] < 5), 'account_number') == ["A2"]
+    assert db.delete_account("A2") and not db.delete_account("A2")
+    assert db.get_account("A2") is None
+
+
+def test_backfilled_transactions_come_back_in_time_order(db):
+    db.save_transaction(make_transaction("late", datetime(2024, 3, 1)))
+    db.save_transactions([make_transaction("early", datetime(2024, 1, 1)),
+                          make_transaction("middle", datetime(2024, 2, 1)),
+                          make_transaction("other", datetime(2024, 1, 15), account_number="X")])
+
+    assert ids(db.get_account_transactions("000000000001")) == ["early", "middle", "late"]
+    assert ids(db.get_account_transactions("000000000001", start_date=datetime(2024, 1, 10))) == \
+        ["middle", "late"]
+    assert ids(db.iter_transactions()) == ["early", "other", "middle", "late"]
+    assert ids(db.get_transactions_by_date_range(datetime(2024, 1, 1), datetime(2024, 2, 1))) == \
+        ["middle", "other", "early"]
+
+
+def test_equal_timestamps_keep_insertion_order(db):
+    moment = datetime(2024, 1, 1)
+    db.save_transactions([make_transaction(f"t{i}", moment) for i in range(5)])
+    assert ids(db.get_account_transactions("000000000001")) == [f"t{i}" for i in range(5)]
+
+
+@pytest.mark.parametrize("query", [
+    "SELECT data FROM transactions WHERE account_number = ? AND timestamp >= ? ORDER BY timestamp, seq",
+    "SELECT data FROM transactions WHERE timestamp >= ? AND timestamp <= ? ORDER BY timestamp, seq",
+])
+def test_time_ordered_queries_need_no_sort(db, query):
+    plan = db._get_connection().execute("EXPLAIN QUERY PLAN " + query, ("a", "b")).fetchall()
+    assert not any("TEMP B-TREE" in row[-1] for row in plan)
+
+
+def test_update_and_delete_transaction(db):
+    db.save_transaction(make_transaction("t1", datetime(2024, 1, 1)))
+    db.update_transaction(make_transaction("t1", datetime(2024, 1, 1), status='cancelled'))
+    assert db.get_transaction("t1")['status'] == 'cancelled'
+    assert db.delete_transaction("t1")
+    assert db.get_transaction("t1") is None
+
+
+def test_audit_logs_filtering_and_order(db):
+    db.save_audit_logs([make_audit_log("l1", datetime(2024, 1, 1)),
+                        make_audit_log("l2", datetime(2024, 1, 3), action='logout'),
+                        make_audit_log("l3", datetime(2024, 1, 2), employee_id="EMP002")])
+    assert ids(db.get_audit_logs(), 'log_id') == ["l2", "l3", "l1"]
+    assert ids(db.get_audit_logs(employee_id="EMP001"), 'log_id') == ["l2", "l1"]
+    assert ids(db.get_audit_logs(action='logout'), 'log_id') == ["l2"]
+    assert ids(db.iter_audit_logs(), 'log_id') == ["l1", "l2", "l3"]
+
+
+def test_collection_metadata_follows_writes(db):
+    db.save_transactions([make_transaction("t1", datetime(2024, 1, 1)),
+                          make_transaction("t2", datetime(2024, 2, 1))])
+    metadata = db.get_collection_metadata('transactions')
+    assert metadata['count'] == 2
+    assert metadata['min_timestamp'] == "2024-01-01T00:00:00"
+    assert metadata['max_timestamp'] == "2024-02-01T00:00:00"
+    db.delete_transaction("t2")
+    assert db.get_collection_metadata('transactions')['max_timestamp'] == "2024-01-01T00:00:00"
+    assert db.get_database_stats()['transactions'] == 1
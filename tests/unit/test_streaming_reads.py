@@ -0,0 +1,76 @@
+"""
+Tests for the streaming full-collection iterators
+"""
+
+import json
+import os
+import tracemalloc
+from datetime import datetime
+
+import pytest
+
+from conftest import make_audit_log, make_transaction
+from src.utils.database import DatabaseManager
+from src.utils.sqlite_database import SQLiteDatabaseManager
+
+
+@pytest.fixture(params=["json", "jsonl", "partitioned", "sqlite"])
+def db(request, data_dir):
+    if request.param == "sqlite":
+        db = SQLiteDatabaseManager(data_dir)
+    else:
+        db = DatabaseManager(data_dir, log_format="jsonl" if request.param == "jsonl" else "json",
+                             partition_logs=request.param == "partitioned")
+    db.initialize_database()
+    yield db
+    db.close()
+
+
+def test_iterators_filter_like_the_list_apis(db):
+    db.save_transactions([make_transaction(f"t{i}", datetime(2024, 1 + i % 3, 1 + i),
+                                           account_number="A" if i % 2 else "B") for i in range(12)])
+    db.save_audit_logs([make_audit_log(f"l{i}", datetime(2024, 1, 1 + i),
+                                       action='login' if i % 3 else 'logout') for i in range(6)])
+    db.save_accounts([{'account_number': f"A{i}", 'balance': float(i)} for i in range(5)])
+
+    assert sorted(t['transaction_id'] for t in db.iter_transactions()) == \
+        sorted(t['transaction_id'] for t in db.get_all_transactions())
+    assert {t['account_number'] for t in db.iter_transactions(account_number="A")} == {"A"}
+    in_february = list(db.iter_transactions(start_date=datetime(2024, 2, 1),
+                                            end_date=datetime(2024, 2, 29)))
+    assert in_february and all(t['timestamp'].startswith("2024-02") for t in in_february)
+    assert [log['log_id'] for log in db.iter_audit_logs(action='logout')] == ["l0", "l3"]
+    assert [a['account_number'] for a in db.iter_accounts(lambda a: a['balance'] > 2)] == ["A3", "A4"]
+
+
+def test_json_array_decoder_handles_records_across_chunks(data_dir):
+    db = DatabaseManager(data_dir)
+    records = [{'customer_id': f"C{i}", 'note': "[,]{\"x\": 1}" * i, 'n': i} for i in range(40)]
+    os.makedirs(data_dir, exist_ok=True)
+    with open(db.customers_file, 'w') as f:
+        json.dump(records, f, indent=2)
+    assert list(db._iter_json_array_file(db.customers_file, chunk_size=7)) == records
+    assert list(db.iter_customers(lambda c: c['n'] == 39)) == [records[39]]
+
+
+@pytest.mark.parametrize("content", ["", "[]", "  [ ] ", "{}"])
+def test_json_array_decoder_handles_empty_files(data_dir, content):
+    db = DatabaseManager(data_dir)
+    with open(db.customers_file, 'w') as f:
+        f.write(content)
+    assert list(db.iter_customers()) == []
+
+
+def test_streaming_memory_does_not_grow_with_the_file(data_dir):
+    db = DatabaseManager(data_dir)
+    db.initialize_database()
+    with open(db.transactions_file, 'w') as f:
+        json.dump([make_transaction(f"t{i}", datetime(2024, 1, 1), description="x" * 200)
+                   for i in range(20000)], f)
+
+    tracemalloc.start()
+    count = sum(1 for _ in db.iter_transactions())
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    assert count == 20000
+    assert peak < os.path.getsize(db.transactions_file) / 10
@@ -0,0 +1,123 @@
+"""
+Tests for the word and trigram search indexes
+"""
+
+import pickle
+import random
+from array import array
+
+from src.models.employee import Department
+from src.services.customer_service import CustomerService
+from src.services.employee_service import EmployeeService
+from src.utils.memory_database import InMemoryDatabaseManager
+from src.utils.text_index import InvertedIndex, TrigramIndex, tokenize
+
+
+def test_tokenize_keeps_distinct_lowercase_words():
+    assert tokenize("Rent - rent, March #REF-42") == ("rent", "march", "ref", "42")
+
+
+def inverted(*documents):
+    index = InvertedIndex()
+    for row, texts in enumerate(documents):
+        index.add(row, *texts)
+    return index
+
+
+def test_every_query_word_must_prefix_a_document_word():
+    index = inverted(("Salary March", "REF-001"), ("Rent march", None), ("Groceries", "REF-002"),
+                     ("", None))
+    assert list(index.search("march")) == [0, 1]
+    assert list(index.search("MAR sal")) == [0]
+    assert list(index.search("ref-00")) == [0, 2]
+    assert list(index.search("002")) == [2]
+    assert list(index.search("rent salary")) == []
+    assert list(index.search("arch")) == []
+    assert index.search("  -- ") is None
+    assert len(index) == 4
+
+
+def test_postings_start_as_a_bare_row_and_grow_into_an_array():
+    index = inverted(("unique shared",), ("shared shared",), ("shared",))
+    assert index.postings["unique"] == 0
+    assert index.postings["shared"] == array('I', [0, 1, 2])
+    assert index.vocabulary == ["shared", "unique"]
+
+
+def test_new_words_are_merged_into_the_vocabulary_by_the_next_search():
+    references = [f"REF-{n:06d}" for n in random.Random(7).sample(range(10 ** 6), 500)]
+    index = inverted(*[("payment", reference) for reference in references])
+    assert index._vocabulary == []  # adding never touched the sorted vocabulary
+    assert list(index.search(references[123])) == [123]
+    assert index.vocabulary == sorted({"payment", "ref", *(r[4:] for r in references)})
+
+    index.add(500, "Payment", "REF-000000A")
+    assert list(index.search("ref 000000a")) == [500]
+    assert index.vocabulary == sorted(index.postings)
+
+
+def test_snapshots_with_an_eager_vocabulary_still_load():
+    index = inverted(("rent march",), ("salary",))
+    state = {'postings': index.postings, 'vocabulary': ["march", "rent", "salary"], 'rows': 2}
+    restored = InvertedIndex.__new__(InvertedIndex)
+    restored.__setstate__(pickle.loads(pickle.dumps(state)))
+    assert list(restored.search("mar")) == [0] and restored.vocabulary == state['vocabulary']
+
+
+def test_narrow_candidates_are_checked_against_long_postings():
+    index = inverted(*[("common", f"REF-{row}") for row in range(100)])
+    assert list(index.search("common ref 17")) == [17]
+    assert list(index.search("common 5")) == [5, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59]
+
+
+def trigram(**records):
+    index = TrigramIndex()
+    for key, fields in records.items():
+        index.add(key, *fields)
+    return index
+
+
+def test_substring_matches_are_ranked_by_match_quality():
+    index = trigram(anywhere=("Joanna", "Lee"), word=("Mary Ann", "Smith"), start=("Annabel", "Ng"),
+                    whole=("Ann", "Bo"), none=("Bob", None))
+    assert index.search("ANN") == ["whole", "start", "word", "anywhere"]
+    # Short terms have no trigram to look up, and here start both Ann and Annabel
+    assert index.search("an") == ["start", "whole", "word", "anywhere"]
+    assert index.search("") == ["anywhere", "word", "start", "whole", "none"]
+    assert index.search("zzz") == [] and index.search("n\0a") == []
+
+
+def test_terms_do_not_match_across_fields():
+    index = trigram(a=("Ann", "Eve"))
+    assert index.search("nneve") == [] and index.search("ann") == ["a"]
+
+
+def test_updated_and_removed_records():
+    index = trigram(c1=("Jane", "jane@old.example"), c2=("John", None))
+    index.add("c1", "Jane", "jane@new.example")
+    assert index.search("old.ex") == [] and index.search("new.ex") == ["c1"]
+    index.remove("c2")
+    assert index.search("john") == [] and len(index) == 1
+    index.add("c2", "Johnny", None)
+    assert index.search("john") == ["c2"]
+
+
+def test_customer_search_follows_updates():
+    customers = CustomerService(InMemoryDatabaseManager())
+    smith = customers.create_customer("Anna", "Smith", "anna@example.com")
+    anne = customers.create_customer("Anne", "Lee")
+    assert customers.search_customers("ANN") == [smith, anne]
+    customers.update_customer(smith.customer_id, first_name="Joan", email="joan@example.com")
+    assert customers.search_customers("ann") == [anne]
+    assert customers.search_customers("joan s") == [smith]
+
+
+def test_employee_search_follows_updates_and_deletes():
+    employees = EmployeeService(InMemoryDatabaseManager())
+    bjane = employees.create_employee("bjane", "secret1", "Bo", "Janeway", "bo@bank.com", Department.IT)
+    jdoe = employees.create_employee("jdoe", "secret1", "Jane", "Doe", "jane@bank.com", Department.IT)
+    assert employees.search_employees("jane") == [jdoe, bjane]
+    employees.update_employee(jdoe.employee_id, email="jd@bank.com")
+    assert employees.search_employees("jane@") == []
+    employees.delete_employee(bjane.employee_id)
+    assert employees.search_employees("jane") == [jdoe]
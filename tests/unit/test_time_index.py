@@ -0,0 +1,66 @@
+"""
+Tests for the time-ordered secondary indexes behind transaction range queries
+"""
+
+from datetime import datetime
+
+from conftest import make_transaction
+from src.utils.database import DatabaseManager
+from src.utils.time_index import TimeIndex, parse_timestamp
+
+
+def test_time_index_orders_values_and_scans_inclusive_ranges():
+    index = TimeIndex()
+    for day, value in [(3, "c"), (1, "a"), (2, "b1"), (2, "b2"), (5, "e")]:
+        index.add(datetime(2024, 1, day), value)
+    assert index.range() == ["a", "b1", "b2", "c", "e"]
+    assert index.range(datetime(2024, 1, 2), datetime(2024, 1, 3)) == ["b1", "b2", "c"]
+    assert index.range(end=datetime(2024, 1, 1)) == ["a"]
+    assert index.range(datetime(2024, 1, 4), datetime(2024, 1, 4)) == []
+
+
+
+def test_newest_serves_the_latest_values_without_sorting():
+    index = TimeIndex()
+    for day, value in [(1, "a"), (2, "b"), (2, "c"), (4, "d")]:
+        index.add(datetime(2024, 1, day), value)
+    assert index.newest() == ["d", "c", "b", "a"]
+    assert index.newest(limit=2) == ["d", "c"]
+    assert index.newest(end=datetime(2024, 1, 2), limit=2) == ["c", "b"]
+    assert index.newest(datetime(2024, 1, 2), limit=10) == ["d", "c", "b"]
+    assert index.newest(datetime(2024, 1, 3), datetime(2024, 1, 3)) == []
+
+def test_unparsable_timestamps_sort_first():
+    assert parse_timestamp(None) == datetime.min
+    assert parse_timestamp("not a date") == datetime.min
+    assert parse_timestamp("2024-01-02T03:04:05") == datetime(2024, 1, 2, 3, 4, 5)
+
+
+def test_account_and_date_range_queries(data_dir):
+    db = DatabaseManager(data_dir)
+    db.initialize_database()
+    db.save_transactions([make_transaction("t3", datetime(2024, 1, 3)),
+                          make_transaction("t1", datetime(2024, 1, 1)),
+                          make_transaction("x2", datetime(2024, 1, 2), account_number="X")])
+    assert [t['transaction_id'] for t in db.get_account_transactions("000000000001")] == ["t1", "t3"]
+
+    # Appends after the index is built extend it
+    db.save_transaction(make_transaction("t2", datetime(2024, 1, 2)))
+    assert [t['transaction_id'] for t in db.get_account_transactions(
+        "000000000001", start_date=datetime(2024, 1, 2))] == ["t2", "t3"]
+    assert [t['transaction_id'] for t in db.get_transactions_by_date_range(
+        datetime(2024, 1, 2), datetime(2024, 1, 3))] == ["t3", "t2", "x2"]
+
+
+def test_changing_an_indexed_field_reindexes(data_dir):
+    db = DatabaseManager(data_dir)
+    db.initialize_database()
+    db.save_transactions([make_transaction("t1", datetime(2024, 1, 1)),
+                          make_transaction("t2", datetime(2024, 1, 2))])
+    assert len(db.get_account_transactions("000000000001")) == 2
+
+    db.update_transaction(make_transaction("t1", datetime(2024, 1, 5), account_number="X"))
+    assert [t['transaction_id'] for t in db.get_account_transactions("000000000001")] == ["t2"]
+    assert [t['transaction_id'] for t in db.get_account_transactions("X")] == ["t1"]
+    assert [t['transaction_id'] for t in db.get_transactions_by_date_range(
+        datetime(2024, 1, 1), datetime(2024, 1, 31))] == ["t1", "t2"]
@@ -0,0 +1,106 @@
+"""
+Tests for the in-memory indexes of TransactionService
+"""
+
+from datetime import datetime
+
+import pytest
+
+from conftest import make_transaction
+from src.models.transaction import TransactionStatus, TransactionType
+from src.services import verify_statistics
+from src.services.transaction_service import TransactionCounters, TransactionService
+from src.utils.database import DatabaseManager
+from src.utils.memory_database import InMemoryDatabaseManager
+from src.utils.snapshot import SnapshotStore
+
+
+def day(n: int) -> datetime:
+    return datetime(2024, 1, n)
+
+
+@pytest.fixture
+def service():
+    db = InMemoryDatabaseManager()
+    # Stored out of time order, as late writes and merged histories leave them
+    db.save_transactions([make_transaction("a3", day(3), account_number="A"),
+                          make_transaction("b1", day(1), account_number="B"),
+                          make_transaction("a1", day(1), account_number="A"),
+                          make_transaction("a5", day(5), account_number="A"),
+                          make_transaction("a2", day(2), account_number="A")])
+    return TransactionService(db)
+
+
+def ids(transactions):
+    return [transaction.transaction_id for transaction in transactions]
+
+
+def test_account_transactions_are_newest_first(service):
+    assert ids(service.get_account_transactions("A")) == ["a5", "a3", "a2", "a1"]
+    assert ids(service.get_account_transactions("B")) == ["b1"]
+    assert service.get_account_transactions("C") == []
+
+
+def test_date_filters_and_limit(service):
+    assert ids(service.get_account_transactions("A", day(2), day(3))) == ["a3", "a2"]
+    assert ids(service.get_account_transactions("A", start_date=day(3))) == ["a5", "a3"]
+    assert ids(service.get_account_transactions("A", end_date=day(1))) == ["a1"]
+    assert ids(service.get_account_transactions("A", limit=2)) == ["a5", "a3"]
+    assert ids(service.get_account_transactions("A", end_date=day(3), limit=1)) == ["a3"]
+
+
+def test_new_transactions_join_the_account_index(service, monkeypatch):
+    created = service.create_transaction("B", TransactionType.DEPOSIT, 5.0)
+    # Served without scanning or sorting the other accounts' transactions
+    monkeypatch.setattr(service, 'transactions', None)
+    monkeypatch.setattr(service, '_all_transactions', None)
+    assert ids(service.get_account_transactions("B")) == [created.transaction_id, "b1"]
+    assert service.get_transaction_summary("B")['total_deposits'] == 15
+
+
+def test_statistics_follow_status_changes(service):
+    pending = service.create_transaction("A", TransactionType.WITHDRAWAL, 2.5)
+    cancelled = service.create_transaction("A", TransactionType.PAYMENT, 4.0)
+    service.cancel_transaction(cancelled.transaction_id)
+    service.process_transaction(pending.transaction_id)
+    statistics = service.get_transaction_statistics()
+    assert statistics['total_transactions'] == 7
+    assert statistics['by_status'][TransactionStatus.COMPLETED.value] == {'count': 6, 'total_amount': 52.5}
+    assert statistics['by_status'][TransactionStatus.CANCELLED.value] == {'count': 1, 'total_amount': 4}
+    assert statistics['by_type'][TransactionType.WITHDRAWAL.value] == {'count': 1, 'total_amount': 2.5}
+    assert statistics['total_amount_processed'] == 52.5
+    assert service.rebuild_statistics() == []
+
+
+@pytest.fixture
+def stored(data_dir):
+    """Data directory with transactions and a snapshot of their statistics"""
+    db = DatabaseManager(data_dir, log_format="jsonl")
+    db.initialize_database()
+    service = TransactionService(db)
+    service.create_transactions([{'account_number': "A", 'transaction_type': TransactionType.DEPOSIT,
+                                  'amount': 1.25}] * 3)
+    service.save_snapshot()
+    return data_dir, service._version.version
+
+
+def test_restart_restores_the_saved_counters(stored, monkeypatch):
+    data_dir, _ = stored
+    monkeypatch.setattr(TransactionCounters, 'add', None)
+    restarted = TransactionService(DatabaseManager(data_dir, log_format="jsonl"))
+    assert restarted.get_transaction_statistics()['by_type']['deposit'] == {'count': 3, 'total_amount': 3.75}
+
+
+def test_verify_statistics_detects_and_repairs_a_corrupt_counter(stored, capsys):
+    data_dir, version = stored
+    argv = [data_dir, "--backend", "jsonl"]
+    assert verify_statistics.main(argv) == 0
+
+    store = SnapshotStore(f"{data_dir}/snapshots")
+    counters = store.load('transactions_statistics', version)
+    counters.type_cents['deposit'] += 1
+    store.save('transactions_statistics', version, counters)
+    capsys.readouterr()
+    assert verify_statistics.main(argv) == 1
+    assert "type_cents[deposit] is 376, expected 375" in capsys.readouterr().out
+    assert verify_statistics.main(argv) == 0
@@ -0,0 +1,95 @@
+"""
+Tests for write-behind buffering of account updates
+"""
+
+import os
+
+import pytest
+
+from src.models.account import AccountType
+from src.services.account_service import AccountService
+from src.utils.database import DatabaseManager
+from src.utils.write_behind import WriteBehindBuffer
+
+
+@pytest.fixture
+def batches():
+    return []
+
+
+@pytest.fixture
+def intent_log(tmp_path):
+    return str(tmp_path / "accounts.intent.jsonl")
+
+
+def buffer(batches, intent_log=None, max_pending=100):
+    """Buffer whose background flusher never fires during a test"""
+    return WriteBehindBuffer(batches.append, 'account_number', intent_log,
+                             interval=3600, max_pending=max_pending)
+
+
+def test_only_the_latest_update_of_each_record_is_written(batches):
+    pending = buffer(batches)
+    pending.put({'account_number': "A1", 'balance': 1})
+    pending.put({'account_number': "A2", 'balance': 5})
+    pending.put({'account_number': "A1", 'balance': 2})
+    assert batches == [] and len(pending) == 2
+    pending.close()
+    assert batches == [[{'account_number': "A1", 'balance': 2}, {'account_number': "A2", 'balance': 5}]]
+
+
+def test_batch_is_written_once_enough_records_are_dirty(batches):
+    pending = buffer(batches, max_pending=3)
+    pending.put_many([{'account_number': f"A{i}"} for i in range(2)])
+    assert batches == []
+    pending.put({'account_number': "A2"})
+    assert [len(batch) for batch in batches] == [3]
+    pending.close()
+
+
+def test_intent_log_is_replayed_after_a_crash(batches, intent_log):
+    crashed = buffer([], intent_log)
+    crashed.put({'account_number': "A1", 'balance': 1})
+    crashed.put({'account_number': "A1", 'balance': 2})
+    with open(intent_log, 'a') as f:
+        f.write('{"account_number": "A2", "bal')  # torn by the crash
+
+    recovered = buffer(batches, intent_log)
+    assert batches == [[{'account_number': "A1", 'balance': 2}]]
+    assert not os.path.exists(intent_log)
+    recovered.close()
+
+
+def test_failed_write_is_requeued_and_logged_again(intent_log):
+    batches = []
+
+    def flaky_write(batch):
+        if not batches:
+            batches.append(None)
+            raise OSError("disk full")
+        batches.append(batch)
+    pending = WriteBehindBuffer(flaky_write, 'account_number', intent_log, interval=3600)
+    pending.put({'account_number': "A1", 'balance': 1})
+    with pytest.raises(OSError):
+        pending.flush()
+    assert len(pending) == 1 and os.path.getsize(intent_log) > 0
+    pending.close()
+    assert batches[1:] == [[{'account_number': "A1", 'balance': 1}]]
+    assert not os.path.exists(intent_log)
+
+
+def test_account_service_defers_balance_writes(data_dir):
+    db = DatabaseManager(data_dir)
+    db.initialize_database()
+    accounts = AccountService(db, write_behind=True, flush_interval=3600)
+    account = accounts.create_account("C1", AccountType.CHECKING, 100.0)
+    accounts.deposit(account.account_number, 50.0)
+    accounts.withdraw(account.account_number, 30.0)
+    assert db.get_account(account.account_number)['balance'] == 100
+    assert accounts.get_account_balance(account.account_number) == 120
+
+    # A crash before the flush loses nothing: the next start replays the intent log
+    restarted = AccountService(db, write_behind=True, flush_interval=3600)
+    assert db.get_account(account.account_number)['balance'] == 120
+    assert restarted.get_account_balance(account.account_number) == 120
+    restarted.close()
@@ -3,7 +3,7 @@ from flask_login import LoginManager, login_user, logout_user, login_required, U
 from typing import Optional
 from datetime import datetime, timedelta
 from src.services.employee_service import EmployeeService
-from src.utils.database import DatabaseManager
+from src.utils.backends import create_database_manager
 from src.models.employee import Department, Role
 import os
 import time
@@ -58,7 +58,7 @@ login_manager = LoginManager()
 login_manager.init_app(app)
 login_manager.login_view = 'login'  # type: ignore
 
-db = DatabaseManager()
+db = create_database_manager()
 employee_service = EmployeeService(db)
 
 # Initialize default admin accounts if no employees exist
@@ -360,30 +360,25 @@ def api_update_profile():
     """Update user profile information"""
     data = request.get_json()
     
-    # Get current employee
-    employee = employee_service.get_employee(current_user.id)
-    if not employee:
-        return jsonify({'success': False, 'message': 'Employee not found'}), 404
-    
-    # Update allowed fields
+    # Collect allowed fields
+    updates = {}
     if 'first_name' in data and data['first_name'].strip():
-        employee.first_name = data['first_name'].strip()
+        updates['first_name'] = data['first_name'].strip()
     
     if 'last_name' in data and data['last_name'].strip():
-        employee.last_name = data['last_name'].strip()
+        updates['last_name'] = data['last_name'].strip()
     
     if 'email' in data and data['email'].strip():
         # Validate email format
         if '@' not in data['email']:
             return jsonify({'success': False, 'message': 'Invalid email format'}), 400
-        employee.email = data['email'].strip()
+        updates['email'] = data['email'].strip()
     
     try:
-        # Save to database
-        db.update_employee(employee.to_dict())
-        
-        # Update employees cache
-        employee_service.employees[employee.employee_id] = employee
+        # Save through the service, which keeps its cache and search index current
+        if not employee_service.update_employee(current_user.id, **updates):
+            return jsonify({'success': False, 'message': 'Employee not found'}), 404
+        employee = employee_service.get_employee(current_user.id)
         
         return jsonify({
             'success': True,
@@ -422,23 +417,10 @@ def api_change_password():
     if not employee:
         return jsonify({'success': False, 'message': 'Employee not found'}), 404
     
-    # Verify current password
-    from src.utils.security import SecurityManager
-    security = SecurityManager()
-    
-    if not security.verify_password(current_password, employee.password_hash.encode('utf-8')):
-        return jsonify({'success': False, 'message': 'Current password is incorrect'}), 400
-    
     try:
-        # Hash new password
-        new_password_hash = security.hash_password(new_password).decode('utf-8')
-        employee.password_hash = new_password_hash
-        
-        # Save to database
-        db.update_employee(employee.to_dict())
-        
-        # Update employees cache
-        employee_service.employees[employee.employee_id] = employee
+        # Verifies the current password, then saves the new hash through the service
+        if not employee_service.change_password(employee.employee_id, current_password, new_password):
+            return jsonify({'success': False, 'message': 'Current password is incorrect'}), 400
         
         return jsonify({
             'success': True,
@@ -1863,12 +1845,7 @@ def api_get_audit_log(log_id):
     
     try:
         # Get specific audit log
-        audit_logs = db.get_audit_logs()
-        log = None
-        for audit_log in audit_logs:
-            if audit_log.get('id') == log_id:
-                log = audit_log
-                break
+        log = db.get_audit_log(log_id)
         
         if log:
             return jsonify({'success': True, 'log': log})
@@ -1890,57 +1867,67 @@ def api_export_audit_logs():
         start_date = request.args.get('start_date', '')
         end_date = request.args.get('end_date', '')
         
-        # Get all audit logs
-        audit_logs = db.get_audit_logs()
-        
-        # Apply filters
-        if employee:
-            audit_logs = [log for log in audit_logs if log.get('employee_id') == employee]
-        if action:
-            audit_logs = [log for log in audit_logs if log.get('action') == action]
+        start_dt = None
+        end_dt = None
         if start_date:
             try:
                 start_dt = datetime.fromisoformat(start_date)
-                audit_logs = [log for log in audit_logs if datetime.fromisoformat(log.get('timestamp', '')) >= start_dt]
             except:
                 pass
         if end_date:
             try:
                 end_dt = datetime.fromisoformat(end_date)
-                audit_logs = [log for log in audit_logs if datetime.fromisoformat(log.get('timestamp', '')) <= end_dt]
             except:
                 pass
         
+        # Stream matching audit logs, newest first, from a snapshot of the
+        # audit logs, so logs written while the export runs neither stall it
+        # nor appear half-way through
+        snapshot = db.snapshot(collections=['audit_logs'])
+        audit_logs = snapshot.iter_audit_logs(employee_id=employee or None, action=action or None,
+                                              start_date=start_dt, end_date=end_dt,
+                                              newest_first=True)
+        
         # Create CSV content
         import csv
         import io
         
-        output = io.StringIO()
-        writer = csv.writer(output)
-        
-        # Write header
-        writer.writerow(['Timestamp', 'Employee ID', 'Action', 'Target Type', 'Target ID', 'Details', 'Success'])
-        
-        # Write data
-        for log in audit_logs:
-            writer.writerow([
-                log.get('timestamp', ''),
-                log.get('employee_id', ''),
-                log.get('action', ''),
-                log.get('target_type', ''),
-                log.get('target_id', ''),
-                log.get('details', ''),
-                log.get('success', '')
-            ])
-        
-        output.seek(0)
+        def generate_csv():
+            output = io.StringIO()
+            writer = csv.writer(output)
+            
+            # Write header
+            writer.writerow(['Timestamp', 'Employee ID', 'Action', 'Target Type', 'Target ID', 'Details', 'Success'])
+            
+            # Write data
+            try:
+                for log in audit_logs:
+                    writer.writerow([
+                        log.get('timestamp', ''),
+                        log.get('employee_id', ''),
+                        log.get('action', ''),
+                        log.get('target_type', ''),
+                        log.get('target_id', ''),
+                        log.get('details', ''),
+                        log.get('success', '')
+                    ])
+                    yield output.getvalue()
+                    output.seek(0)
+                    output.truncate(0)
+            finally:
+                snapshot.close()
+            
+            yield output.getvalue()
         
         from flask import Response
-        return Response(
-            output.getvalue(),
+        response = Response(
+            generate_csv(),
             mimetype='text/csv',
             headers={'Content-Disposition': f'attachment; filename=audit_logs_{datetime.now().strftime("%Y%m%d")}.csv'}
         )
+        # Also released if the client disconnects before the body is streamed
+        response.call_on_close(snapshot.close)
+        return response
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)})
 